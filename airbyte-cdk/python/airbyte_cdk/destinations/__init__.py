@@ -1,3 +1,4 @@
+from .buffered_destination import BufferedDestination, DestinationRecord, FlushPolicy
 from .destination import Destination
 
-__all__ = ["Destination"]
+__all__ = ["BufferedDestination", "Destination", "DestinationRecord", "FlushPolicy"]
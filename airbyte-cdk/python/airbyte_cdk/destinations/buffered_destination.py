@@ -0,0 +1,253 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from airbyte_cdk.destinations.destination import Destination
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from pydantic import ValidationError
+
+
+@dataclass
+class DestinationRecord:
+    """
+    Lightweight representation of an AirbyteRecordMessage, created without pydantic validation.
+    `size` is the length of the serialized message when known, it is used by the bytes flush policy.
+    """
+
+    __slots__ = ("stream", "data", "emitted_at", "size")
+
+    stream: str
+    data: Mapping[str, Any]
+    emitted_at: int
+    size: int
+
+    @classmethod
+    def from_message(cls, message: AirbyteMessage) -> "DestinationRecord":
+        record = message.record
+        return cls(stream=record.stream, data=record.data, emitted_at=record.emitted_at, size=0)
+
+
+@dataclass
+class FlushPolicy:
+    """
+    Decides when a stream buffer is handed over to flush_records().
+    A buffer is flushed as soon as any of the limits is reached, limits set to None are ignored.
+
+    :param max_records: maximum number of records buffered per stream
+    :param max_bytes: maximum size of the serialized records buffered per stream
+    :param max_age_seconds: maximum time a record may stay in a buffer. It is checked whenever a message is read from the input.
+    :param flush_on_state: flush every buffer when a STATE message is read so it can be emitted as early as possible.
+        If False, STATE messages are held back until the buffers preceding them are flushed by the other limits.
+    """
+
+    max_records: Optional[int] = 1000
+    max_bytes: Optional[int] = 10 * 1024 * 1024
+    max_age_seconds: Optional[float] = 60
+    flush_on_state: bool = True
+
+
+@dataclass
+class StreamBuffer:
+    """Records of a single stream waiting to be flushed"""
+
+    records: List[DestinationRecord] = field(default_factory=list)
+    size: int = 0
+    first_sequence: Optional[int] = None
+    created_at: float = 0
+
+    def append(self, record: DestinationRecord, sequence: int):
+        if not self.records:
+            self.first_sequence = sequence
+            self.created_at = time.monotonic()
+        self.records.append(record)
+        self.size += record.size
+
+    def should_flush(self, policy: FlushPolicy, now: float) -> bool:
+        if not self.records:
+            return False
+        return (
+            (policy.max_records is not None and len(self.records) >= policy.max_records)
+            or (policy.max_bytes is not None and self.size >= policy.max_bytes)
+            or (policy.max_age_seconds is not None and now - self.created_at >= policy.max_age_seconds)
+        )
+
+
+class BufferedDestination(Destination, ABC):
+    """
+    Base class for destinations which write records in batches.
+
+    Input lines are parsed into lightweight DestinationRecords and kept in per-stream buffers. Buffers are flushed according to
+    `flush_policy` by a pool of `max_flush_workers` background threads, at most `max_pending_flushes` flushes may wait for a worker
+    before reading the input is paused. A STATE message is emitted only once every record read before it has been flushed.
+
+    Flushes of the same stream may run concurrently when more than one worker is used. Set `preserve_stream_order` if the destination
+    relies on the batches of a stream being written in the order they were read, flushes of different streams still run concurrently.
+    """
+
+    flush_policy: FlushPolicy = FlushPolicy()
+    max_flush_workers: int = 2
+    max_pending_flushes: int = 4
+    preserve_stream_order: bool = False
+
+    @abstractmethod
+    def flush_records(self, config: Mapping[str, Any], stream_name: str, records: List[DestinationRecord]):
+        """
+        Implement to durably write a batch of records of one stream to the destination. Called from a background thread.
+        Any exception raised here fails the sync.
+        """
+
+    def on_sync_start(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        """
+        Override to prepare the destination before the first record is buffered, e.g: clear streams synced in overwrite mode.
+        """
+
+    def on_sync_end(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        """
+        Override to finalize the sync once every buffer has been flushed.
+        """
+
+    def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[Union[AirbyteMessage, DestinationRecord]]:
+        """
+        Reads from stdin, RECORD messages are turned into DestinationRecords without pydantic validation,
+        all other messages are converted to Airbyte messages
+        """
+        for line in input_stream:
+            try:
+                message = json.loads(line)
+                if message.get("type") == Type.RECORD.value:
+                    record = message["record"]
+                    yield DestinationRecord(stream=record["stream"], data=record["data"], emitted_at=record["emitted_at"], size=len(line))
+                else:
+                    yield AirbyteMessage.parse_obj(message)
+            except (ValueError, KeyError, TypeError, AttributeError, ValidationError):
+                self.logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
+
+    def write(
+        self,
+        config: Mapping[str, Any],
+        configured_catalog: ConfiguredAirbyteCatalog,
+        input_messages: Iterable[Union[AirbyteMessage, DestinationRecord]],
+    ) -> Iterable[AirbyteMessage]:
+        self.on_sync_start(config, configured_catalog)
+        with _FlushPipeline(self, config) as pipeline:
+            for message in input_messages:
+                if isinstance(message, DestinationRecord):
+                    pipeline.add_record(message)
+                elif message.type == Type.RECORD:
+                    pipeline.add_record(DestinationRecord.from_message(message))
+                elif message.type == Type.STATE:
+                    pipeline.add_state(message)
+                yield from pipeline.releasable_states()
+            yield from pipeline.close()
+        self.on_sync_end(config, configured_catalog)
+
+
+class _FlushPipeline:
+    """
+    Keeps the stream buffers of a single write() call and tracks the flushes submitted to the worker pool.
+
+    Every record and state gets a sequence number in input order. A state is released once no record with a lower
+    sequence number is left in a buffer or in a flush which hasn't completed yet.
+    """
+
+    def __init__(self, destination: BufferedDestination, config: Mapping[str, Any]):
+        self._destination = destination
+        self._config = config
+        self._policy = destination.flush_policy
+        self._buffers: Dict[str, StreamBuffer] = {}
+        self._sequence = 0
+        self._pending_states: Deque[Tuple[int, AirbyteMessage]] = deque()
+        self._in_flight: Dict[Future, int] = {}
+        self._last_flush: Dict[str, Future] = {}
+        self._slots = threading.BoundedSemaphore(destination.max_pending_flushes + destination.max_flush_workers)
+        self._executor = ThreadPoolExecutor(max_workers=destination.max_flush_workers, thread_name_prefix="airbyte-flush")
+
+    def __enter__(self) -> "_FlushPipeline":
+        return self
+
+    def __exit__(self, *exc_info):
+        self._executor.shutdown(wait=True)
+
+    def add_record(self, record: DestinationRecord):
+        self._sequence += 1
+        buffer = self._buffers.setdefault(record.stream, StreamBuffer())
+        buffer.append(record, self._sequence)
+        now = time.monotonic()
+        if buffer.should_flush(self._policy, now):
+            self._submit(record.stream)
+        if self._policy.max_age_seconds is not None:
+            self._flush_expired(now)
+
+    def add_state(self, state: AirbyteMessage):
+        self._sequence += 1
+        self._pending_states.append((self._sequence, state))
+        if self._policy.flush_on_state:
+            self._flush_all()
+
+    def releasable_states(self) -> Iterable[AirbyteMessage]:
+        """Yields, in input order, the states whose preceding records are all flushed"""
+        self._raise_for_failed_flushes()
+        lowest_unflushed = self._lowest_unflushed_sequence()
+        while self._pending_states and (lowest_unflushed is None or self._pending_states[0][0] < lowest_unflushed):
+            yield self._pending_states.popleft()[1]
+
+    def close(self) -> Iterable[AirbyteMessage]:
+        """Flushes the remaining buffers, waits for all flushes to complete and yields the remaining states"""
+        self._flush_all()
+        for future in list(self._in_flight):
+            future.result()
+        yield from self.releasable_states()
+
+    def _flush_expired(self, now: float):
+        for stream_name, buffer in list(self._buffers.items()):
+            if buffer.records and now - buffer.created_at >= self._policy.max_age_seconds:
+                self._submit(stream_name)
+
+    def _flush_all(self):
+        for stream_name, buffer in list(self._buffers.items()):
+            if buffer.records:
+                self._submit(stream_name)
+
+    def _submit(self, stream_name: str):
+        buffer = self._buffers.pop(stream_name)
+        # blocks reading the input while too many flushes are waiting for a worker
+        self._slots.acquire()
+        if self._destination.preserve_stream_order:
+            future = self._executor.submit(self._flush_after, self._last_flush.get(stream_name), stream_name, buffer.records)
+            self._last_flush[stream_name] = future
+        else:
+            future = self._executor.submit(self._destination.flush_records, self._config, stream_name, buffer.records)
+        self._in_flight[future] = buffer.first_sequence
+        future.add_done_callback(lambda _: self._slots.release())
+
+    def _flush_after(self, previous_flush: Optional[Future], stream_name: str, records: List[DestinationRecord]):
+        """
+        Waits for the previous flush of the stream before flushing the records.
+        The executor starts tasks in submission order, so the previous flush is already running on another worker and this can't deadlock.
+        """
+        if previous_flush:
+            previous_flush.result()
+        self._destination.flush_records(self._config, stream_name, records)
+
+    def _raise_for_failed_flushes(self):
+        for future in [future for future in self._in_flight if future.done()]:
+            del self._in_flight[future]
+            # re-raises the exception of a failed flush
+            future.result()
+
+    def _lowest_unflushed_sequence(self) -> Optional[int]:
+        # flushes completed since the last _raise_for_failed_flushes() call are still treated as pending, so a failed flush is never
+        # mistaken for a successful one
+        sequences = [buffer.first_sequence for buffer in self._buffers.values() if buffer.records]
+        sequences += list(self._in_flight.values())
+        return min(sequences, default=None)
@@ -8,15 +8,15 @@ import sys
 from abc import ABC, abstractmethod
 from typing import Any, Iterable, List, Mapping
 
-from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.connector import Connector
+from airbyte_cdk.logger import get_shared_logger
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 from pydantic import ValidationError
 
 
 class Destination(Connector, ABC):
-    logger = AirbyteLogger()
+    logger = get_shared_logger()
     VALID_CMDS = {"spec", "check", "write"}
 
     @abstractmethod
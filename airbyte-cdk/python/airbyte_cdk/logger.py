@@ -2,14 +2,20 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
 import logging.config
+import os
+import sys
+import time
 import traceback
-
-from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage
+from typing import Any, Dict, Optional, Union
 
 TRACE_LEVEL_NUM = 5
 
+# environment variable setting the least severe level of the LOG messages which are output, e.g. INFO drops DEBUG and TRACE messages
+LOG_LEVEL_ENV_VAR = "AIRBYTE_LOG_LEVEL"
+
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -29,12 +35,26 @@ LOGGING_CONFIG = {
 }
 
 
+def encode_log_message(level: str, message: str) -> str:
+    """
+    Renders a LOG message without building AirbyteMessage and AirbyteLogMessage models.
+    The output is identical to `AirbyteMessage(type="LOG", log=AirbyteLogMessage(level=level, message=message)).json(exclude_unset=True)`
+    """
+    return f'{{"type": "LOG", "log": {{"level": {json.dumps(level)}, "message": {json.dumps(message)}}}}}'
+
+
+def get_log_level() -> str:
+    """Returns the level set by AIRBYTE_LOG_LEVEL, all messages are output when it isn't set or isn't a valid level"""
+    level = os.environ.get(LOG_LEVEL_ENV_VAR, "TRACE").upper()
+    return level if level in AirbyteLogger.valid_log_types else "TRACE"
+
+
 def init_logger(name: str):
     """Initial set up of logger"""
     logging.setLoggerClass(AirbyteNativeLogger)
     logging.addLevelName(TRACE_LEVEL_NUM, "TRACE")
     logger = logging.getLogger(name)
-    logger.setLevel(TRACE_LEVEL_NUM)
+    logger.setLevel(logging.getLevelName(get_log_level()))
     logging.config.dictConfig(LOGGING_CONFIG)
     return logger
 
@@ -45,8 +65,7 @@ class AirbyteLogFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Return a JSON representation of the log message"""
         message = super().format(record)
-        log_message = AirbyteMessage(type="LOG", log=AirbyteLogMessage(level=record.levelname, message=message))
-        return log_message.json(exclude_unset=True)
+        return encode_log_message(record.levelname, message)
 
 
 class AirbyteNativeLogger(logging.Logger):
@@ -74,8 +93,22 @@ class AirbyteNativeLogger(logging.Logger):
 
 
 class AirbyteLogger:
-    def __init__(self):
-        self.valid_log_types = ["FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"]
+    """
+    Prints LOG messages to stdout.
+
+    Like the standard logging methods, every method accepts %-style arguments which are only formatted when the message is output.
+    Messages below `level` are dropped, it defaults to the level set by the AIRBYTE_LOG_LEVEL environment variable.
+    """
+
+    valid_log_types = ["FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"]
+    # severity of the levels, from the least to the most severe
+    _LEVEL_SEVERITY = {"TRACE": 0, "DEBUG": 1, "INFO": 2, "WARN": 3, "ERROR": 4, "FATAL": 5}
+
+    def __init__(self, level: Optional[str] = None):
+        self.level = level or get_log_level()
+
+    def is_enabled_for(self, level: str) -> bool:
+        return self._LEVEL_SEVERITY.get(level, len(self._LEVEL_SEVERITY)) >= self._LEVEL_SEVERITY.get(self.level, 0)
 
     def log_by_prefix(self, message, default_level):
         """Custom method, which takes log level from first word of message"""
@@ -89,29 +122,69 @@ class AirbyteLogger:
             rendered_message = message
         self.log(log_level, rendered_message)
 
-    def log(self, level, message):
-        log_record = AirbyteLogMessage(level=level, message=message)
-        log_message = AirbyteMessage(type="LOG", log=log_record)
-        print(log_message.json(exclude_unset=True))
+    def log(self, level, message, *args):
+        if not self.is_enabled_for(level):
+            return
+        if args:
+            message = message % args
+        # a single write keeps lines printed from several threads apart
+        sys.stdout.write(encode_log_message(level, message) + "\n")
 
-    def fatal(self, message):
-        self.log("FATAL", message)
+    def fatal(self, message, *args):
+        self.log("FATAL", message, *args)
 
-    def exception(self, message):
+    def exception(self, message, *args):
+        if args:
+            message = message % args
         message = f"{message}\n{traceback.format_exc()}"
         self.error(message)
 
-    def error(self, message):
-        self.log("ERROR", message)
+    def error(self, message, *args):
+        self.log("ERROR", message, *args)
+
+    def warn(self, message, *args):
+        self.log("WARN", message, *args)
+
+    def info(self, message, *args):
+        self.log("INFO", message, *args)
+
+    def debug(self, message, *args):
+        self.log("DEBUG", message, *args)
+
+    def trace(self, message, *args):
+        self.log("TRACE", message, *args)
+
+
+class RateLimitedLogger:
+    """
+    Wraps a logger to output at most one message per key every `interval_seconds`, e.g: per record or per checkpoint messages.
+    Arguments of the dropped messages are never formatted. The next message of a key reports how many of them were dropped.
+    """
+
+    def __init__(self, logger: Union[logging.Logger, AirbyteLogger], interval_seconds: float = 60):
+        self.logger = logger
+        self.interval_seconds = interval_seconds
+        self._last_output: Dict[str, float] = {}
+        self._dropped: Dict[str, int] = {}
+
+    def info(self, key: str, message: str, *args: Any):
+        now = time.monotonic()
+        last_output = self._last_output.get(key)
+        if last_output is not None and now - last_output < self.interval_seconds:
+            self._dropped[key] = self._dropped.get(key, 0) + 1
+            return
+        self._last_output[key] = now
+        dropped = self._dropped.pop(key, 0)
+        if dropped:
+            # the message is formatted first, it may contain a literal % when it has no arguments
+            self.logger.info("%s (%d similar messages skipped)", message % args if args else message, dropped)
+        else:
+            self.logger.info(message, *args)
 
-    def warn(self, message):
-        self.log("WARN", message)
 
-    def info(self, message):
-        self.log("INFO", message)
+_shared_logger = AirbyteLogger()
 
-    def debug(self, message):
-        self.log("DEBUG", message)
 
-    def trace(self, message):
-        self.log("TRACE", message)
+def get_shared_logger() -> AirbyteLogger:
+    """Returns the logger shared by the CDK modules which don't receive the logger of the connector"""
+    return _shared_logger
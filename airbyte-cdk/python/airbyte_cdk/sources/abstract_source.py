@@ -4,12 +4,12 @@
 
 
 import copy
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
 from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
-from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.logger import AirbyteLogger, RateLimitedLogger
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -25,9 +25,12 @@ from airbyte_cdk.models import (
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.columnar import ColumnarStream
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.record_batch import RecordBatchSerializer, SerializedRecordBatch
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
-from airbyte_cdk.sources.utils.transform import TypeTransformer
+from airbyte_cdk.sources.utils.stream_metrics import StreamMetrics
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
 class AbstractSource(Source, ABC):
@@ -36,6 +39,11 @@ class AbstractSource(Source, ABC):
     in this class to create an Airbyte Specification compliant Source.
     """
 
+    # state checkpoints of a stream are logged at most once per interval
+    checkpoint_log_interval_seconds: float = 60
+    # runtime metrics of a stream are logged once per interval while it is read and when it is done
+    metrics_log_interval_seconds: float = 60
+
     @abstractmethod
     def check_connection(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
         """
@@ -81,7 +89,8 @@ class AbstractSource(Source, ABC):
         self, logger: AirbyteLogger, config: Mapping[str, Any], catalog: ConfiguredAirbyteCatalog, state: MutableMapping[str, Any] = None
     ) -> Iterator[AirbyteMessage]:
         """Implements the Read operation from the Airbyte Specification. See https://docs.airbyte.io/architecture/airbyte-specification."""
-        connector_state = copy.deepcopy(state or {})
+        # stream states are copied when their stream is read, see _read_incremental
+        connector_state = dict(state or {})
         logger.info(f"Starting syncing {self.name}")
         config, internal_config = split_config(config)
         # TODO assert all streams exist in the connector
@@ -123,20 +132,34 @@ class AbstractSource(Source, ABC):
             stream_instance.page_size = internal_config.page_size
 
         use_incremental = configured_stream.sync_mode == SyncMode.incremental and stream_instance.supports_incremental
-        if use_incremental:
+        use_record_batches = self._use_record_batches(stream_instance)
+        if use_incremental and use_record_batches:
+            record_iterator = self._read_incremental_batches(logger, stream_instance, configured_stream, connector_state, internal_config)
+        elif use_incremental:
             record_iterator = self._read_incremental(logger, stream_instance, configured_stream, connector_state, internal_config)
+        elif use_record_batches:
+            record_iterator = self._read_full_refresh_batches(stream_instance, configured_stream, internal_config)
         else:
             record_iterator = self._read_full_refresh(stream_instance, configured_stream, internal_config)
 
-        record_counter = 0
         stream_name = configured_stream.stream.name
+        metrics = stream_instance.runtime_metrics = StreamMetrics()
+        next_metrics_log = metrics.started_at + self.metrics_log_interval_seconds
         logger.info(f"Syncing stream: {stream_name} ")
-        for record in record_iterator:
-            if record.type == MessageType.RECORD:
-                record_counter += 1
-            yield record
+        try:
+            for record in record_iterator:
+                if isinstance(record, SerializedRecordBatch):
+                    metrics.records += record.record_count
+                elif record.type == MessageType.RECORD:
+                    metrics.records += 1
+                yield record
+                if time.monotonic() >= next_metrics_log:
+                    logger.info(metrics.render(stream_name, final=False))
+                    next_metrics_log = time.monotonic() + self.metrics_log_interval_seconds
 
-        logger.info(f"Read {record_counter} records from {stream_name} stream")
+            logger.info(f"Read {metrics.records} records from {stream_name} stream")
+        finally:
+            logger.info(metrics.render(stream_name, final=True))
 
     @staticmethod
     def _limit_reached(internal_config: InternalConfig, records_counter: int) -> bool:
@@ -160,9 +183,11 @@ class AbstractSource(Source, ABC):
         internal_config: InternalConfig,
     ) -> Iterator[AirbyteMessage]:
         stream_name = configured_stream.stream.name
-        stream_state = connector_state.get(stream_name, {})
+        # copied so updates made in place by the stream don't leak into the state passed to read()
+        stream_state = copy.deepcopy(connector_state.get(stream_name, {}))
         if stream_state:
-            logger.info(f"Setting state of {stream_name} stream to {stream_state}")
+            logger.info("Setting state of %s stream to %s", stream_name, stream_state)
+        checkpoint_logger = RateLimitedLogger(logger, self.checkpoint_log_interval_seconds)
 
         checkpoint_interval = stream_instance.state_checkpoint_interval
         slices = stream_instance.stream_slices(
@@ -180,7 +205,7 @@ class AbstractSource(Source, ABC):
                 yield self._as_airbyte_record(stream_name, record_data)
                 stream_state = stream_instance.get_updated_state(stream_state, record_data)
                 if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                    yield self._checkpoint_state(stream_name, stream_state, connector_state, logger)
+                    yield self._checkpoint_state(stream_name, stream_state, connector_state, checkpoint_logger)
 
                 total_records_counter += 1
                 # This functionality should ideally live outside of this method
@@ -190,7 +215,7 @@ class AbstractSource(Source, ABC):
                     # Break from slice loop to save state and exit from _read_incremental function.
                     break
 
-            yield self._checkpoint_state(stream_name, stream_state, connector_state, logger)
+            yield self._checkpoint_state(stream_name, stream_state, connector_state, checkpoint_logger)
             if self._limit_reached(internal_config, total_records_counter):
                 return
 
@@ -209,10 +234,95 @@ class AbstractSource(Source, ABC):
                 if self._limit_reached(internal_config, total_records_counter):
                     return
 
-    def _checkpoint_state(self, stream_name, stream_state, connector_state, logger):
-        logger.info(f"Setting state of {stream_name} stream to {stream_state}")
+    @staticmethod
+    def _use_record_batches(stream_instance: Stream) -> bool:
+        """
+        Columnar streams are serialized batch-wise unless they transform their records, which requires Python objects.
+        """
+        return isinstance(stream_instance, ColumnarStream) and stream_instance.transformer._config == TransformConfig.NoTransform
+
+    @staticmethod
+    def _limit_batch(internal_config: InternalConfig, batch, records_counter: int):
+        """
+        Truncate the batch so the total number of records doesn't exceed the limit set by internal config.
+        """
+        if internal_config.limit:
+            return batch.slice(0, max(0, internal_config.limit - records_counter))
+        return batch
+
+    def _read_incremental_batches(
+        self,
+        logger: AirbyteLogger,
+        stream_instance: ColumnarStream,
+        configured_stream: ConfiguredAirbyteStream,
+        connector_state: MutableMapping[str, Any],
+        internal_config: InternalConfig,
+    ) -> Iterator[AirbyteMessage]:
+        stream_name = configured_stream.stream.name
+        # copied so updates made in place by the stream don't leak into the state passed to read()
+        stream_state = copy.deepcopy(connector_state.get(stream_name, {}))
+        if stream_state:
+            logger.info("Setting state of %s stream to %s", stream_name, stream_state)
+        checkpoint_logger = RateLimitedLogger(logger, self.checkpoint_log_interval_seconds)
+
+        checkpoint_interval = stream_instance.state_checkpoint_interval
+        slices = stream_instance.stream_slices(
+            cursor_field=configured_stream.cursor_field, sync_mode=SyncMode.incremental, stream_state=stream_state
+        )
+        total_records_counter = 0
+        for slice in slices:
+            batches = stream_instance.read_record_batches(
+                sync_mode=SyncMode.incremental,
+                stream_slice=slice,
+                stream_state=stream_state,
+                cursor_field=configured_stream.cursor_field or None,
+            )
+            record_counter = 0
+            for batch in batches:
+                batch = self._limit_batch(internal_config, batch, total_records_counter)
+                if batch.num_rows:
+                    yield self._as_serialized_record_batch(stream_name, batch)
+                    stream_state = stream_instance.get_updated_state_from_batch(stream_state, batch)
+                # checkpoint whenever the batch crossed a multiple of the checkpoint interval
+                if (
+                    checkpoint_interval
+                    and record_counter // checkpoint_interval != (record_counter + batch.num_rows) // checkpoint_interval
+                ):
+                    yield self._checkpoint_state(stream_name, stream_state, connector_state, checkpoint_logger)
+
+                record_counter += batch.num_rows
+                total_records_counter += batch.num_rows
+                if self._limit_reached(internal_config, total_records_counter):
+                    break
+
+            yield self._checkpoint_state(stream_name, stream_state, connector_state, checkpoint_logger)
+            if self._limit_reached(internal_config, total_records_counter):
+                return
+
+    def _read_full_refresh_batches(
+        self, stream_instance: ColumnarStream, configured_stream: ConfiguredAirbyteStream, internal_config: InternalConfig
+    ) -> Iterator[SerializedRecordBatch]:
+        slices = stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field)
+        total_records_counter = 0
+        for slice in slices:
+            batches = stream_instance.read_record_batches(
+                stream_slice=slice, sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field
+            )
+            for batch in batches:
+                batch = self._limit_batch(internal_config, batch, total_records_counter)
+                if batch.num_rows:
+                    yield self._as_serialized_record_batch(configured_stream.stream.name, batch)
+                total_records_counter += batch.num_rows
+                if self._limit_reached(internal_config, total_records_counter):
+                    return
+
+    def _checkpoint_state(self, stream_name, stream_state, connector_state, logger: RateLimitedLogger):
+        # the state is rendered only when the message isn't dropped
+        logger.info(stream_name, "Setting state of %s stream to %s", stream_name, stream_state)
         connector_state[stream_name] = stream_state
-        return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
+        # a checkpoint only replaces the state of its own stream, so a shallow copy is a complete snapshot of the connector state
+        state_message = AirbyteStateMessage.construct(data=dict(connector_state))
+        return AirbyteMessage.construct(type=MessageType.STATE, state=state_message)
 
     @lru_cache(maxsize=None)
     def _get_stream_transformer_and_schema(self, stream_name: str) -> Tuple[TypeTransformer, dict]:
@@ -227,12 +337,25 @@ class AbstractSource(Source, ABC):
         return stream_instance.transformer, stream_instance.get_json_schema()
 
     def _as_airbyte_record(self, stream_name: str, data: Mapping[str, Any]):
-        now_millis = int(datetime.now().timestamp()) * 1000
+        now_millis = int(time.time()) * 1000
+        if not isinstance(data, dict):
+            data = dict(data)
         transformer, schema = self._get_stream_transformer_and_schema(stream_name)
         # Transform object fields according to config. Most likely you will
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
+        started = time.perf_counter()
         transformer.transform(data, schema)
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        self._stream_to_instance_map[stream_name].runtime_metrics.transform_seconds += time.perf_counter() - started
+        # the fields are known to be valid, skipping pydantic validation makes building the messages several times cheaper
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
+
+    @lru_cache(maxsize=None)
+    def _get_record_batch_serializer(self) -> RecordBatchSerializer:
+        return RecordBatchSerializer()
+
+    def _as_serialized_record_batch(self, stream_name: str, batch) -> SerializedRecordBatch:
+        now_millis = int(time.time()) * 1000
+        return self._get_record_batch_serializer().serialize(stream_name, batch, emitted_at=now_millis)
@@ -3,14 +3,16 @@
 #
 
 
+import codecs
 import json
 import os
+import re
 import selectors
 import subprocess
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from io import TextIOWrapper
-from typing import Any, DefaultDict, Dict, Iterator, List, Mapping, Optional, Tuple
+from json.decoder import scanstring
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -23,10 +25,20 @@ from airbyte_cdk.models import (
     SyncMode,
     Type,
 )
+from airbyte_cdk.sources.utils.record_batch import SerializedRecordBatch
 
 _INCREMENTAL = "INCREMENTAL"
 _FULL_TABLE = "FULL_TABLE"
 
+# Envelopes of the messages output by singer-python's format_message, other formats are parsed as JSON
+_SINGER_RECORD_PREFIX = '{"type": "RECORD", "stream": "'
+_SINGER_RECORD_KEY = ', "record": '
+_SINGER_VERSION_KEY = ', "version": '
+_SINGER_TIME_EXTRACTED_KEY = ', "time_extracted": "'
+_SINGER_STATE_PREFIX = '{"type": "STATE", "value": '
+_VERSION_PATTERN = re.compile(r"-?\d+")
+_PIPE_READ_SIZE = 64 * 1024
+
 
 def to_json(string):
     try:
@@ -53,6 +65,17 @@ def get_stream_level_metadata(metadatas: List[Dict[str, any]]) -> Optional[Dict[
     return None
 
 
+@dataclass
+class SerializedStateMessage:
+    """Airbyte STATE message rendered from a Singer STATE line without parsing the state, it is output by the entrypoint as is"""
+
+    payload: str
+    type: Type = Type.STATE
+
+    def json(self, **kwargs: Any) -> str:
+        return self.payload
+
+
 @dataclass
 class Catalogs:
     singer_catalog: object
@@ -159,48 +182,143 @@ class SingerHelper:
         return Catalogs(singer_catalog=singer_catalog, airbyte_catalog=airbyte_catalog)
 
     @staticmethod
-    def read(logger, shell_command, is_message=(lambda x: True)) -> Iterator[AirbyteMessage]:
-        with subprocess.Popen(shell_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True) as p:
-            for line, text_wrapper in SingerHelper._read_lines(p):
-                if text_wrapper is p.stdout:
-                    out_json = to_json(line)
-                    if out_json is not None and is_message(out_json):
-                        message_data = SingerHelper._airbyte_message_from_json(out_json)
-                        if message_data is not None:
-                            yield message_data
-                    else:
-                        logger.log_by_prefix(line, "INFO")
+    def read(
+        logger, shell_command, is_message: Callable[[Mapping[str, Any]], bool] = None
+    ) -> Iterator[Union[AirbyteMessage, SerializedRecordBatch, SerializedStateMessage]]:
+        """
+        Runs the tap and converts its output to Airbyte messages.
+
+        RECORD and STATE lines in the format output by singer-python are converted by rewriting their envelope only, the record
+        or state itself is copied as is. Consecutive records of the same stream are yielded as a single SerializedRecordBatch and all
+        the records read from the same chunk of output share their emitted_at. Other lines are parsed as JSON.
+        :param is_message: predicate selecting the parsed lines which are messages, when set every line is parsed.
+        """
+        with subprocess.Popen(shell_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as p:
+            for lines, pipe in SingerHelper._read_lines(p):
+                if pipe is p.stdout:
+                    yield from SingerHelper._messages_from_lines(logger, lines, is_message)
                 else:
-                    logger.log_by_prefix(line, "ERROR")
+                    for line in lines:
+                        logger.log_by_prefix(line, "ERROR")
 
     @staticmethod
-    def _read_lines(process: subprocess.Popen) -> Iterator[Tuple[str, TextIOWrapper]]:
+    def _read_lines(process: subprocess.Popen) -> Iterator[Tuple[List[str], Any]]:
+        """
+        Reads the process' stdout and stderr in large chunks as soon as they are available.
+        :return: iterator of the complete lines read from a pipe by a single read, along with the pipe
+        """
         sel = selectors.DefaultSelector()
-        sel.register(process.stdout, selectors.EVENT_READ)
-        sel.register(process.stderr, selectors.EVENT_READ)
-        eof = False
-        while not eof:
-            selects_list = sel.select()
-            empty_line_counter = 0
-            for key, _ in selects_list:
-                line = key.fileobj.readline()
-                if not line:
-                    empty_line_counter += 1
-                    if empty_line_counter >= len(selects_list):
-                        eof = True
-
-                        try:
-                            process.wait(timeout=60)
-                        except subprocess.TimeoutExpired:
-                            raise Exception(f"Underlying command {process.args} is hanging")
-
-                        if process.returncode != 0:
-                            raise Exception(f"Underlying command {process.args} failed with exit code {process.returncode}")
+        pending = {}
+        for pipe in (process.stdout, process.stderr):
+            sel.register(pipe, selectors.EVENT_READ)
+            pending[pipe] = (codecs.getincrementaldecoder("utf-8")(errors="replace"), [])
+
+        while sel.get_map():
+            for key, _ in sel.select():
+                pipe = key.fileobj
+                decoder, pending_line = pending[pipe]
+                chunk = os.read(pipe.fileno(), _PIPE_READ_SIZE)
+                if chunk:
+                    *lines, last_line = decoder.decode(chunk).split("\n")
+                    if lines:
+                        # the first line of the chunk completes the line started by the previous chunks
+                        lines[0] = "".join(pending_line) + lines[0]
+                        pending_line.clear()
+                    pending_line.append(last_line)
                 else:
-                    yield line, key.fileobj
+                    sel.unregister(pipe)
+                    lines = ["".join(pending_line) + decoder.decode(b"", final=True)]
+                lines = [line for line in lines if line.strip()]
+                if lines:
+                    yield lines, pipe
+
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            raise Exception(f"Underlying command {process.args} is hanging")
+
+        if process.returncode != 0:
+            raise Exception(f"Underlying command {process.args} failed with exit code {process.returncode}")
+
+    @staticmethod
+    def _messages_from_lines(
+        logger, lines: List[str], is_message: Callable[[Mapping[str, Any]], bool] = None
+    ) -> Iterator[Union[AirbyteMessage, SerializedRecordBatch, SerializedStateMessage]]:
+        emitted_at = int(time.time()) * 1000
+        batch_stream, batch_records = None, []
+        for line in lines:
+            line = line.strip()
+            record = None if is_message else SingerHelper._rewrite_record(line, emitted_at)
+            if record:
+                stream_name, record_line = record
+                if stream_name != batch_stream and batch_records:
+                    yield SerializedRecordBatch(stream=batch_stream, record_count=len(batch_records), payload="\n".join(batch_records))
+                    batch_records = []
+                batch_stream = stream_name
+                batch_records.append(record_line)
+                continue
+
+            if batch_records:
+                yield SerializedRecordBatch(stream=batch_stream, record_count=len(batch_records), payload="\n".join(batch_records))
+                batch_stream, batch_records = None, []
+            state = None if is_message else SingerHelper._rewrite_state(line)
+            if state:
+                yield state
+                continue
+            out_json = to_json(line)
+            if isinstance(out_json, dict) and (is_message is None or is_message(out_json)):
+                message_data = SingerHelper._airbyte_message_from_json(out_json, emitted_at)
+                if message_data is not None:
+                    yield message_data
+            else:
+                logger.log_by_prefix(line, "INFO")
+
+        if batch_records:
+            yield SerializedRecordBatch(stream=batch_stream, record_count=len(batch_records), payload="\n".join(batch_records))
+
+    @staticmethod
+    def _rewrite_record(line: str, emitted_at: int) -> Optional[Tuple[str, str]]:
+        """
+        Rewrites a Singer RECORD line into an Airbyte RECORD line, the record itself is neither parsed nor serialized again.
+        :return: stream name and Airbyte RECORD line, None if the line isn't a RECORD in the format of singer-python
+        """
+        if not line.startswith(_SINGER_RECORD_PREFIX) or not line.endswith("}"):
+            return None
+        try:
+            stream_name, end = scanstring(line, len(_SINGER_RECORD_PREFIX))
+        except ValueError:
+            return None
+        if not line.startswith(_SINGER_RECORD_KEY, end):
+            return None
+
+        record_start = end + len(_SINGER_RECORD_KEY)
+        record_end = len(line) - 1
+        # optional trailing keys, a nested key with the same name is always followed by the closing brace of the record
+        key_start = line.rfind(_SINGER_TIME_EXTRACTED_KEY, record_start, record_end)
+        value = line[key_start + len(_SINGER_TIME_EXTRACTED_KEY) : record_end]
+        if key_start != -1 and value.endswith('"') and '"' not in value[:-1] and "\\" not in value:
+            record_end = key_start
+        key_start = line.rfind(_SINGER_VERSION_KEY, record_start, record_end)
+        if key_start != -1 and _VERSION_PATTERN.fullmatch(line, key_start + len(_SINGER_VERSION_KEY), record_end):
+            record_end = key_start
+        if line[record_start] != "{" or line[record_end - 1] != "}":
+            return None
+
+        record_line = (
+            f'{{"type": "RECORD", "record": {{"stream": {json.dumps(stream_name)}, '
+            f'"data": {line[record_start:record_end]}, "emitted_at": {emitted_at}}}}}'
+        )
+        return stream_name, record_line
+
+    @staticmethod
+    def _rewrite_state(line: str) -> Optional[SerializedStateMessage]:
+        """Rewrites a Singer STATE line into an Airbyte STATE message, None if the line isn't a STATE in the format of singer-python"""
+        if line.startswith(_SINGER_STATE_PREFIX) and line.startswith("{", len(_SINGER_STATE_PREFIX)) and line.endswith("}}"):
+            return SerializedStateMessage(payload=f'{{"type": "STATE", "state": {{"data": {line[len(_SINGER_STATE_PREFIX):-1]}}}}}')
+        return None
 
     @staticmethod
-    def _airbyte_message_from_json(transformed_json: Mapping[str, Any]) -> Optional[AirbyteMessage]:
+    def _airbyte_message_from_json(transformed_json: Mapping[str, Any], emitted_at: int = None) -> Optional[AirbyteMessage]:
         if transformed_json is None or transformed_json.get("type") == "SCHEMA" or transformed_json.get("type") == "ACTIVATE_VERSION":
             return None
         elif transformed_json.get("type") == "STATE":
@@ -212,7 +330,7 @@ class SingerHelper:
             out_record = AirbyteRecordMessage(
                 stream=stream_name,
                 data=transformed_json["record"],
-                emitted_at=int(datetime.now().timestamp()) * 1000,
+                emitted_at=emitted_at if emitted_at is not None else int(time.time()) * 1000,
             )
             out_message = AirbyteMessage(type=Type.RECORD, record=out_record)
         return out_message
@@ -1,4 +1,5 @@
 # Initialize Streams Package
+from .columnar import ColumnarStream
 from .core import Stream
 
-__all__ = ["Stream"]
+__all__ = ["ColumnarStream", "Stream"]
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import Stream
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class ColumnarStream(Stream, ABC):
+    """
+    Base abstract class for streams whose data is already held in columnar form, e.g. Parquet or CSV files read through pyarrow.
+
+    Instead of records such a stream returns pyarrow RecordBatches. AbstractSource renders them into RECORD messages with
+    RecordBatchSerializer without converting each value to a Python object. Streams which configure a TypeTransformer
+    are read record by record through read_records() because transformations operate on Python objects.
+    """
+
+    @abstractmethod
+    def read_record_batches(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable["pyarrow.RecordBatch"]:
+        """
+        This method should be overridden by subclasses to read batches of records based on the inputs.
+        Every column of a batch becomes a top level property of the emitted records.
+        """
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        for batch in self.read_record_batches(
+            sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+        ):
+            yield from self._batch_to_records(batch)
+
+    def get_updated_state_from_batch(self, current_stream_state: MutableMapping[str, Any], latest_batch: "pyarrow.RecordBatch"):
+        """
+        Override to compute the updated state from a whole batch, e.g. with pyarrow.compute.max over the cursor column.
+        By default every record of the batch is passed through get_updated_state().
+
+        :param current_stream_state: The stream's current state object
+        :param latest_batch: The latest batch extracted from the stream
+        :return: An updated state object
+        """
+        for record in self._batch_to_records(latest_batch):
+            current_stream_state = self.get_updated_state(current_stream_state, record)
+        return current_stream_state
+
+    @staticmethod
+    def _batch_to_records(batch: "pyarrow.RecordBatch") -> Iterable[Mapping[str, Any]]:
+        columns = batch.schema.names
+        batch_dict = batch.to_pydict()
+        for values in zip(*[batch_dict[column] for column in columns]):
+            yield dict(zip(columns, values))
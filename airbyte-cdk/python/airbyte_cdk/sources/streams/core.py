@@ -11,6 +11,7 @@ from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 import airbyte_cdk.sources.utils.casing as casing
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
+from airbyte_cdk.sources.utils.stream_metrics import StreamMetrics
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
@@ -33,6 +34,19 @@ class Stream(ABC):
     # TypeTransformer object to perform output data transformation
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform)
 
+    @property
+    def runtime_metrics(self) -> StreamMetrics:
+        """
+        :return: Runtime counters of the stream. AbstractSource starts with fresh counters every time the stream is read.
+        """
+        if not hasattr(self, "_runtime_metrics"):
+            self._runtime_metrics = StreamMetrics()
+        return self._runtime_metrics
+
+    @runtime_metrics.setter
+    def runtime_metrics(self, runtime_metrics: StreamMetrics):
+        self._runtime_metrics = runtime_metrics
+
     @property
     def name(self) -> str:
         """
@@ -4,6 +4,7 @@
 
 
 import os
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -271,7 +272,11 @@ class HttpStream(Stream, ABC):
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
         """
+        started = time.perf_counter()
         response: requests.Response = self._session.send(request, **request_kwargs)
+        # the body of a streamed response isn't downloaded yet, fall back on its announced length
+        response_bytes = int(response.headers.get("Content-Length", 0)) if request_kwargs.get("stream") else len(response.content or b"")
+        self.runtime_metrics.add_request(time.perf_counter() - started, response_bytes)
 
         if self.should_retry(response):
             custom_backoff_time = self.backoff_time(response)
@@ -313,9 +318,26 @@ class HttpStream(Stream, ABC):
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
+        attempts, request_seconds = 0, 0.0
+
+        def send(request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+            nonlocal attempts, request_seconds
+            attempts += 1
+            started = time.perf_counter()
+            try:
+                return self._send(request, request_kwargs)
+            finally:
+                request_seconds += time.perf_counter() - started
+
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(send)
         backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
-        return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        started = time.perf_counter()
+        try:
+            return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        finally:
+            # every attempt after the first one is a retry, the time not spent in attempts was spent waiting in backoff
+            if attempts > 1:
+                self.runtime_metrics.add_retries(attempts - 1, max(0.0, time.perf_counter() - started - request_seconds))
 
     def read_records(
         self,
@@ -350,7 +372,9 @@ class HttpStream(Stream, ABC):
             else:
                 response = self._send_request(request, request_kwargs)
 
-            yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            yield from self.runtime_metrics.time_parsing(
+                self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            )
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
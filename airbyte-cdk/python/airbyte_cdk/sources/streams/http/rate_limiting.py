@@ -7,15 +7,14 @@ import sys
 import time
 
 import backoff
-from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.logger import get_shared_logger
 from requests import codes, exceptions
 
 from .exceptions import DefaultBackoffException, UserDefinedBackoffException
 
 TRANSIENT_EXCEPTIONS = (DefaultBackoffException, exceptions.ConnectTimeout, exceptions.ReadTimeout, exceptions.ConnectionError)
 
-# TODO inject singleton logger?
-logger = AirbyteLogger()
+logger = get_shared_logger()
 
 
 def default_backoff_handler(max_tries: int, factor: int, **kwargs):
@@ -24,9 +24,11 @@
 
 from .oauth import Oauth2Authenticator
 from .token import MultipleTokenAuthenticator, TokenAuthenticator
+from .token_cache import OAuthTokenCache
 
 __all__ = [
     "Oauth2Authenticator",
     "TokenAuthenticator",
     "MultipleTokenAuthenticator",
+    "OAuthTokenCache",
 ]
@@ -9,11 +9,16 @@ import pendulum
 import requests
 from requests.auth import AuthBase
 
+from .token_cache import OAuthTokenCache, shared_token_cache
+
 
 class Oauth2Authenticator(AuthBase):
     """
     Generates OAuth2.0 access tokens from an OAuth2.0 refresh token and client credentials.
     The generated access token is attached to each request via the Authorization header.
+
+    Access tokens are kept in `token_cache`, by default a cache shared by every authenticator of the process, so authenticators
+    refreshing tokens with the same credentials reuse the same token. Pass an OAuthTokenCache with a path to reuse tokens across runs.
     """
 
     def __init__(
@@ -26,6 +31,7 @@ class Oauth2Authenticator(AuthBase):
         token_expiry_date: pendulum.datetime = None,
         access_token_name: str = "access_token",
         expires_in_name: str = "expires_in",
+        token_cache: OAuthTokenCache = shared_token_cache,
     ):
         self.token_refresh_endpoint = token_refresh_endpoint
         self.client_secret = client_secret
@@ -34,6 +40,7 @@ class Oauth2Authenticator(AuthBase):
         self.scopes = scopes
         self.access_token_name = access_token_name
         self.expires_in_name = expires_in_name
+        self.token_cache = token_cache
 
         self._token_expiry_date = token_expiry_date or pendulum.now().subtract(days=1)
         self._access_token = None
@@ -47,13 +54,17 @@ class Oauth2Authenticator(AuthBase):
 
     def get_access_token(self):
         if self.token_has_expired():
-            t0 = pendulum.now()
-            token, expires_in = self.refresh_access_token()
-            self._access_token = token
-            self._token_expiry_date = t0.add(seconds=expires_in)
+            self._access_token, self._token_expiry_date = self.token_cache.get_token(self.token_cache_key(), self.refresh_access_token)
 
         return self._access_token
 
+    def token_cache_key(self) -> str:
+        """
+        Authenticators sharing a key share their access token.
+        The key covers the class, the endpoint and the refresh request body, which holds the credentials and scopes.
+        """
+        return self.token_cache.make_key(type(self).__qualname__, self.token_refresh_endpoint, self.get_refresh_request_body())
+
     def token_has_expired(self) -> bool:
         return pendulum.now() > self._token_expiry_date
 
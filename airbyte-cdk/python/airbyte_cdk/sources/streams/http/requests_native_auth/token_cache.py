@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+import pendulum
+
+
+class OAuthTokenCache:
+    """
+    Access tokens shared by every Oauth2Authenticator which refreshes them with the same credentials, so streams building
+    their own authenticator don't each request a token at startup.
+
+    A token is reused until `expiry_margin_seconds` before it expires, or until half of its lifetime has passed for short lived tokens.
+    Refreshes are serialized per credentials: while a thread refreshes a token, the other threads needing it wait and then reuse it.
+
+    When `path` is set the tokens are also stored in that file, so consecutive check, discover and read runs reuse them. Refreshes are then
+    serialized between processes as well, with an exclusive lock on `<path>.lock`. The file holds live access tokens, it is only
+    readable by its owner and the credentials themselves are not stored, tokens are looked up by a hash of them.
+    """
+
+    def __init__(self, path: Optional[str] = None, expiry_margin_seconds: float = 60):
+        self.path = path
+        self.expiry_margin_seconds = expiry_margin_seconds
+        self._tokens: Dict[str, Tuple[str, pendulum.DateTime]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*credentials: Any) -> str:
+        """:return: key identifying the token refreshed with the given credentials, they can't be recovered from the key"""
+        return hashlib.sha256(json.dumps(credentials, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_token(self, key: str, refresh: Callable[[], Tuple[str, int]]) -> Tuple[str, pendulum.DateTime]:
+        """
+        :param key: key of the credentials, see make_key()
+        :param refresh: called to get a new token when no valid one is cached, returns (access_token, token_lifespan_in_seconds)
+        :return: tuple of (access_token, date until which the token should be used)
+        """
+        token = self._valid(self._tokens.get(key))
+        if token:
+            return token
+        with self._lock(key):
+            # another thread may have refreshed the token while this one was waiting for the lock
+            token = self._valid(self._tokens.get(key))
+            if not token:
+                token = self._get_stored_or_refresh(key, refresh) if self.path else self._refresh(refresh)
+                self._tokens[key] = token
+            return token
+
+    def clear(self):
+        """Forget the tokens held in memory, tokens stored in the file are kept"""
+        self._tokens.clear()
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _valid(self, token: Optional[Tuple[str, pendulum.DateTime]]) -> Optional[Tuple[str, pendulum.DateTime]]:
+        if token and pendulum.now() < token[1]:
+            return token
+        return None
+
+    def _refresh(self, refresh: Callable[[], Tuple[str, int]]) -> Tuple[str, pendulum.DateTime]:
+        requested_at = pendulum.now()
+        access_token, expires_in = refresh()
+        reuse_for = max(float(expires_in) - self.expiry_margin_seconds, float(expires_in) / 2)
+        return access_token, requested_at.add(seconds=reuse_for)
+
+    def _get_stored_or_refresh(self, key: str, refresh: Callable[[], Tuple[str, int]]) -> Tuple[str, pendulum.DateTime]:
+        with self._file_lock():
+            stored_tokens = self._read_file()
+            stored = stored_tokens.get(key)
+            token = self._valid((stored["access_token"], pendulum.parse(stored["valid_until"])) if stored else None)
+            if not token:
+                token = self._refresh(refresh)
+                stored_tokens[key] = {"access_token": token[0], "valid_until": token[1].isoformat()}
+                self._write_file(stored_tokens)
+            return token
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_file(self) -> Dict[str, Mapping[str, str]]:
+        try:
+            with open(self.path) as token_file:
+                stored_tokens = json.load(token_file)
+        except (OSError, ValueError):
+            return {}
+        # drop expired tokens so the file doesn't grow with every refresh token ever used
+        now = pendulum.now()
+        return {key: stored for key, stored in stored_tokens.items() if pendulum.parse(stored["valid_until"]) > now}
+
+    def _write_file(self, stored_tokens: Mapping[str, Mapping[str, str]]):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        # mkstemp creates the file readable by its owner only, replacing the file at once keeps readers from seeing it half written
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            with os.fdopen(descriptor, "w") as temp_file:
+                json.dump(stored_tokens, temp_file)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+# cache shared by the authenticators of the process unless they are given their own
+shared_token_cache = OAuthTokenCache()
@@ -0,0 +1,158 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from airbyte_cdk.models import Type
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency of the CDK
+    pa = None
+    pc = None
+
+# Escape sequences for characters JSON does not allow to appear unescaped inside a string
+_CONTROL_CHARACTER_ESCAPES = {chr(code): f"\\u{code:04x}" for code in range(0x20)}
+_CONTROL_CHARACTER_ESCAPES.update({"\b": "\\b", "\f": "\\f", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+@dataclass
+class SerializedRecordBatch:
+    """
+    A batch of RECORD messages which is already rendered as newline separated JSON.
+
+    It is yielded by AbstractSource.read in place of individual AirbyteMessages for columnar streams.
+    Like AirbyteMessage it exposes `type` and `json()` so the entrypoint can output it without special casing.
+    """
+
+    stream: str
+    record_count: int
+    payload: str
+    type: Type = Type.RECORD
+
+    def json(self, **kwargs: Any) -> str:
+        return self.payload
+
+
+class RecordBatchSerializer:
+    """
+    Renders AirbyteRecordMessage JSON lines straight from a pyarrow RecordBatch.
+
+    Every column is rendered to JSON text with vectorized pyarrow compute kernels and the columns are then joined row-wise
+    together with the message envelope, so no per-value Python objects are created. The output matches
+    `AirbyteMessage(...).json(exclude_unset=True)` except for number formatting (e.g. 1.0 is rendered as 1) and non-ASCII characters,
+    which are emitted as UTF-8 instead of \\u escapes. Both forms are valid JSON.
+
+    Timestamp, date and time values are rendered with Python's isoformat() and binary values are decoded as UTF-8. Those columns and types without a vectorized rendering
+    (lists, maps, binary, ...) fall back to converting the values of that column only to Python objects.
+    """
+
+    def __init__(self):
+        if pa is None:
+            raise ImportError("pyarrow is required to serialize record batches, please add it to your connector's dependencies")
+
+    def serialize(self, stream_name: str, batch: "pa.RecordBatch", emitted_at: int) -> SerializedRecordBatch:
+        """
+        :param stream_name: name of the stream the records belong to
+        :param batch: records to serialize, every column becomes a top level property of the record data
+        :param emitted_at: emitted_at timestamp in milliseconds shared by all records of the batch
+        :return: serialized batch with one RECORD message per row
+        """
+        prefix = f'{{"type": "RECORD", "record": {{"stream": {json.dumps(stream_name)}, "data": {{'
+        suffix = f'}}, "emitted_at": {int(emitted_at)}}}}}\n'
+        if batch.num_rows == 0:
+            return SerializedRecordBatch(stream=stream_name, record_count=0, payload="")
+        if batch.num_columns == 0:
+            return SerializedRecordBatch(stream=stream_name, record_count=batch.num_rows, payload=((prefix + suffix) * batch.num_rows)[:-1])
+
+        parts = [prefix]
+        for index, field in enumerate(batch.schema):
+            separator = ", " if index else ""
+            parts.append(f"{separator}{json.dumps(field.name)}: ")
+            parts.append(self._render_column(batch.column(index)))
+        parts.append(suffix)
+        lines = pc.binary_join_element_wise(*parts, "")
+        return SerializedRecordBatch(stream=stream_name, record_count=batch.num_rows, payload=self._concatenate(lines)[:-1])
+
+    @staticmethod
+    def _concatenate(lines: "pa.Array") -> str:
+        """Returns the contents of a string array as one string by reading its value buffer directly"""
+        if lines.offset != 0 or lines.null_count:
+            return "".join(lines.to_pylist())
+        total_length = pc.sum(pc.binary_length(lines)).as_py()
+        return lines.buffers()[2].to_pybytes()[:total_length].decode("utf-8")
+
+    def _render_column(self, column: "pa.Array") -> "pa.Array":
+        """
+        Renders every value of a column as JSON text.
+        :return: string array with the same length as the column, nulls are rendered as `null`
+        """
+        column_type = column.type
+        if pa.types.is_dictionary(column_type):
+            return self._render_column(column.dictionary_decode())
+        if pa.types.is_large_string(column_type):
+            # compute kernels can't join string and large_string arrays together
+            return self._render_column(pc.cast(column, pa.string()))
+
+        if pa.types.is_boolean(column_type) or pa.types.is_integer(column_type) or pa.types.is_decimal(column_type):
+            rendered = pc.cast(column, pa.string())
+        elif pa.types.is_floating(column_type):
+            rendered = self._render_float(column)
+        elif pa.types.is_string(column_type):
+            rendered = self._quote(self._escape(column))
+        elif pa.types.is_binary(column_type) or pa.types.is_large_binary(column_type) or pa.types.is_fixed_size_binary(column_type):
+            # like pydantic, which decodes bytes as UTF-8, values which aren't valid UTF-8 raise an error
+            return self._render_column(pc.cast(column, pa.large_string() if pa.types.is_large_binary(column_type) else pa.string()))
+        elif pa.types.is_temporal(column_type) and not pa.types.is_duration(column_type):
+            # rendered with isoformat() like the record-by-record path: arrow's own string cast differs in fractional seconds,
+            # time zones and nanosecond precision
+            rendered = pa.array(
+                [None if value is None else json.dumps(value.isoformat()) for value in column.to_pylist()], type=pa.string()
+            )
+        elif pa.types.is_struct(column_type):
+            rendered = self._render_struct(column)
+        else:
+            rendered = pa.array([json.dumps(value, default=str) for value in column.to_pylist()], type=pa.string())
+        return pc.fill_null(rendered, "null")
+
+    @staticmethod
+    def _render_float(column: "pa.Array") -> "pa.Array":
+        rendered = pc.cast(column, pa.string())
+        if pc.any(pc.or_(pc.is_nan(column), pc.is_inf(column))).as_py():
+            # keep the same spelling as json.dumps for non finite values
+            for pattern, replacement in (("^nan$", "NaN"), ("^inf$", "Infinity"), ("^-inf$", "-Infinity")):
+                rendered = pc.replace_substring_regex(rendered, pattern, replacement)
+        return rendered
+
+    @staticmethod
+    def _escape(column: "pa.Array") -> "pa.Array":
+        escaped = pc.replace_substring(column, "\\", "\\\\")
+        escaped = pc.replace_substring(escaped, '"', '\\"')
+        if pc.any(pc.match_substring_regex(escaped, "[\\x00-\\x1f]")).as_py():
+            for character, replacement in _CONTROL_CHARACTER_ESCAPES.items():
+                escaped = pc.replace_substring(escaped, character, replacement)
+        return escaped
+
+    @staticmethod
+    def _quote(column: "pa.Array") -> "pa.Array":
+        return pc.binary_join_element_wise('"', column, '"', "")
+
+    def _render_struct(self, column: "pa.StructArray") -> "pa.Array":
+        if column.type.num_fields == 0:
+            rendered = pa.array(["{}"] * len(column), type=pa.string())
+        else:
+            parts = ["{"]
+            # flatten() takes slicing offsets into account, unlike accessing the children directly
+            for index, child in enumerate(column.flatten()):
+                separator = ", " if index else ""
+                parts.append(f"{separator}{json.dumps(column.type[index].name)}: ")
+                parts.append(self._render_column(child))
+            parts.append("}")
+            rendered = pc.binary_join_element_wise(*parts, "")
+        if column.null_count:
+            rendered = pc.if_else(pc.is_valid(column), rendered, pa.scalar(None, pa.string()))
+        return rendered
@@ -7,6 +7,7 @@ import importlib
 import json
 import os
 import pkgutil
+from functools import lru_cache
 from typing import Any, ClassVar, Dict, Mapping, Tuple
 
 import jsonref
@@ -18,11 +19,26 @@ from pydantic import BaseModel, Field
 
 
 class ResourceSchemaLoader:
-    """JSONSchema loader from package resources"""
+    """
+    JSONSchema loader from package resources.
+
+    Schemas are loaded lazily, the first time they are requested, and the resolved schemas are cached for the lifetime of the process,
+    so discover, read and connector code asking for the schema of the same stream don't read and resolve it again.
+    """
+
+    # resolved schemas rendered as JSON by (package name, schema name). Rendered schemas are cheap to parse into a fresh copy,
+    # which the caller is free to modify.
+    _resolved_schemas: ClassVar[Dict[Tuple[str, str], str]] = {}
 
     def __init__(self, package_name: str):
         self.package_name = package_name
 
+    @classmethod
+    def clear_cache(cls):
+        """Forget the schemas loaded so far, e.g. after the schema files were modified"""
+        cls._resolved_schemas.clear()
+        _read_shared_schema.cache_clear()
+
     def get_schema(self, name: str) -> dict:
         """
         This method retrieves a JSON schema from the schemas/ folder.
@@ -35,7 +51,14 @@ class ResourceSchemaLoader:
         schemas/<name>.json # contains a $ref to shared_definition
         schemas/<name2>.json # contains a $ref to shared_definition
         """
-
+        key = (self.package_name, name)
+        resolved_schema = self._resolved_schemas.get(key)
+        if resolved_schema is None:
+            resolved_schema = json.dumps(self._load_schema(name))
+            self._resolved_schemas[key] = resolved_schema
+        return json.loads(resolved_schema)
+
+    def _load_schema(self, name: str) -> dict:
         schema_filename = f"schemas/{name}.json"
         raw_file = pkgutil.get_data(self.package_name, schema_filename)
         if not raw_file:
@@ -69,7 +92,7 @@ class ResourceSchemaLoader:
 
             def __call__(self, uri: str) -> Dict[str, Any]:
                 uri = uri.replace(self.uri_base, f"{self.uri_base}/{self.shared}/")
-                return json.load(open(uri))
+                return json.loads(_read_shared_schema(uri))
 
         package = importlib.import_module(self.package_name)
         base = os.path.dirname(package.__file__) + "/"
@@ -106,6 +129,13 @@ class ResourceSchemaLoader:
         return resolved
 
 
+@lru_cache(maxsize=None)
+def _read_shared_schema(path: str) -> str:
+    """Shared schemas are usually referenced by many stream schemas, read each of them only once"""
+    with open(path) as schema_file:
+        return schema_file.read()
+
+
 def check_config_against_spec_or_exit(config: Mapping[str, Any], spec: ConnectorSpecification, logger: AirbyteLogger):
     """
     Check config object against spec. In case of spec is invalid, throws
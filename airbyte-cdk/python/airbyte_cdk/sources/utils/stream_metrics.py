@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import threading
+import time
+from typing import Any, Iterable, Iterator, Mapping, TypeVar
+
+T = TypeVar("T")
+
+# prefix of the LOG messages carrying the metrics, the rest of the message is a JSON object
+METRICS_LOG_PREFIX = "Stream metrics: "
+
+
+class StreamMetrics:
+    """
+    Runtime counters of a stream, collected while it is read.
+
+    AbstractSource counts the records and the time spent in the stream's TypeTransformer, HttpStream counts requests, response bytes,
+    retries and where the time goes: waiting for responses, sleeping in backoff and running parse_response.
+    Requests may be counted from several threads, records and timings are only collected by the thread reading the stream.
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.bytes = 0
+        self.requests = 0
+        self.retries = 0
+        self.request_seconds = 0.0
+        self.backoff_seconds = 0.0
+        self.parse_seconds = 0.0
+        self.transform_seconds = 0.0
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add_request(self, seconds: float, response_bytes: int):
+        with self._lock:
+            self.requests += 1
+            self.request_seconds += seconds
+            self.bytes += response_bytes
+
+    def add_retries(self, retries: int, backoff_seconds: float):
+        with self._lock:
+            self.retries += retries
+            self.backoff_seconds += backoff_seconds
+
+    def time_parsing(self, records: Iterable[T]) -> Iterator[T]:
+        """Yields from records, the time spent producing them is added to parse_seconds"""
+        iterator = iter(records)
+        while True:
+            started = time.perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.parse_seconds += time.perf_counter() - started
+            yield record
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {
+            "records": self.records,
+            "bytes": self.bytes,
+            "requests": self.requests,
+            "retries": self.retries,
+            "elapsed_seconds": round(time.monotonic() - self.started_at, 3),
+            "request_seconds": round(self.request_seconds, 3),
+            "backoff_seconds": round(self.backoff_seconds, 3),
+            "parse_seconds": round(self.parse_seconds, 3),
+            "transform_seconds": round(self.transform_seconds, 3),
+        }
+
+    def render(self, stream_name: str, final: bool) -> str:
+        """
+        :return: message carrying the metrics, e.g:
+            Stream metrics: {"stream": "users", "final": true, "records": 1000, "bytes": 250000, "requests": 10, ...}
+        """
+        return METRICS_LOG_PREFIX + json.dumps({"stream": stream_name, "final": final, **self.as_dict()})
@@ -6,10 +6,10 @@ from distutils.util import strtobool
 from enum import Flag, auto
 from typing import Any, Callable, Dict
 
-from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.logger import get_shared_logger
 from jsonschema import Draft7Validator, validators
 
-logger = AirbyteLogger()
+logger = get_shared_logger()
 
 
 class TransformConfig(Flag):
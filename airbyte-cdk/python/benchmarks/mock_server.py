@@ -0,0 +1,147 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping
+from urllib.parse import parse_qs, urlparse
+
+SHAPES = ("flat", "nested", "wide")
+
+_WIDE_COLUMNS = 100
+
+
+def make_record(index: int, shape: str) -> Dict[str, Any]:
+    """
+    Builds a deterministic synthetic record.
+    Some values are served with a different type than the one declared by `record_schema` so TypeTransformer has work to do.
+    """
+    record = {
+        "id": index,
+        "name": f"user {index}",
+        "email": f"user{index}@example.com",
+        "amount": str(index % 1000 + 0.25),
+        "score": str(index % 100),
+        "active": index % 2 == 0,
+        "created_at": "2021-10-01T12:00:00Z",
+    }
+    if shape == "nested":
+        record["address"] = {"street": f"{index} Main street", "city": "San Francisco", "zip": index % 100000, "country": "US"}
+        record["tags"] = [f"tag{index % 7}", f"tag{index % 11}", f"tag{index % 13}"]
+        record["items"] = [{"sku": f"sku-{index}-{item}", "quantity": str(item + 1), "price": item * 1.5} for item in range(3)]
+    elif shape == "wide":
+        for column in range(_WIDE_COLUMNS):
+            record[f"column_{column}"] = str(index + column) if column % 3 == 0 else f"value {index} {column}"
+    return record
+
+
+def record_schema(shape: str) -> Mapping[str, Any]:
+    properties = {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "email": {"type": "string"},
+        "amount": {"type": "number"},
+        "score": {"type": "integer"},
+        "active": {"type": "boolean"},
+        "created_at": {"type": "string", "format": "date-time"},
+    }
+    if shape == "nested":
+        properties["address"] = {
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "city": {"type": "string"},
+                "zip": {"type": "string"},
+                "country": {"type": "string"},
+            },
+        }
+        properties["tags"] = {"type": "array", "items": {"type": "string"}}
+        properties["items"] = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"sku": {"type": "string"}, "quantity": {"type": "integer"}, "price": {"type": "number"}},
+            },
+        }
+    elif shape == "wide":
+        for column in range(_WIDE_COLUMNS):
+            properties[f"column_{column}"] = {"type": "integer" if column % 3 == 0 else "string"}
+    return {"type": "object", "properties": properties}
+
+
+def make_records(count: int, shape: str) -> List[Dict[str, Any]]:
+    return [make_record(index, shape) for index in range(count)]
+
+
+class MockApiServer:
+    """
+    Local HTTP server serving `records` synthetic records from GET /records?page=<n>, `page_size` records per page.
+
+    Responses look like `{"data": [...], "next_page": <n + 1 or null>}`. Page bodies are rendered once when the server starts,
+    so the server thread takes as little CPU and GIL time as possible away from the code being measured.
+    Each response is delayed by `latency_ms` to simulate a remote API.
+    """
+
+    def __init__(self, records: int, page_size: int, shape: str, latency_ms: float = 0):
+        self.records = records
+        self.page_size = page_size
+        self.pages = max(1, -(-records // page_size))
+        self.latency = latency_ms / 1000
+        # every full page carries the same records, only the last one may be shorter
+        self._page_data = {size: json.dumps(make_records(size, shape)).encode() for size in {page_size, self._page_length(self.pages - 1)}}
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-api-server", daemon=True)
+
+    @property
+    def url_base(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> "MockApiServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _page_length(self, page: int) -> int:
+        return min(self.page_size, self.records - page * self.page_size)
+
+    def render_page(self, page: int) -> bytes:
+        if page < 0 or page >= self.pages:
+            return b'{"data": [], "next_page": null}'
+        next_page = str(page + 1) if page + 1 < self.pages else "null"
+        return b'{"data": ' + self._page_data[self._page_length(page)] + b', "next_page": ' + next_page.encode() + b"}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, so the measured client reuses its connection like it would against a real API
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/records":
+                    self.send_error(404)
+                    return
+                page = int(parse_qs(url.query).get("page", ["0"])[0])
+                if server.latency:
+                    time.sleep(server.latency)
+                body = server.render_page(page)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,301 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the throughput of the CDK hot path against a local mock API, see benchmarks/README.md.
+
+Every stage runs in a fresh process, so its peak RSS is not inflated by the stages which ran before it.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+
+import requests
+from airbyte_cdk.entrypoint import AirbyteEntrypoint
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    ConnectorSpecification,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from mock_server import SHAPES, MockApiServer, make_records, record_schema
+
+STREAM_NAME = "records"
+
+# metrics compared against the baseline, True when a higher value is better
+METRICS = {"records_per_second": True, "cpu_seconds": False, "peak_rss_mb": False}
+
+
+class BenchmarkStream(HttpStream):
+    primary_key = "id"
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    def __init__(self, url_base: str, shape: str):
+        super().__init__()
+        self._url_base = url_base
+        self.shape = shape
+
+    @property
+    def name(self) -> str:
+        return STREAM_NAME
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(self, **kwargs) -> str:
+        return "records"
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return record_schema(self.shape)
+
+    def request_params(self, next_page_token: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
+        return {"page": next_page_token["page"] if next_page_token else 0}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json()["next_page"]
+        return {"page": next_page} if next_page is not None else None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["data"]
+
+
+class BenchmarkSource(AbstractSource):
+    def spec(self, logger: AirbyteLogger) -> ConnectorSpecification:
+        return ConnectorSpecification(
+            connectionSpecification={
+                "type": "object",
+                "required": ["url_base", "shape"],
+                "properties": {"url_base": {"type": "string"}, "shape": {"type": "string", "enum": list(SHAPES)}},
+            }
+        )
+
+    def check_connection(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return [BenchmarkStream(url_base=config["url_base"], shape=config["shape"])]
+
+
+def configured_catalog() -> ConfiguredAirbyteCatalog:
+    stream = BenchmarkStream(url_base="", shape="flat").as_airbyte_stream()
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite)
+        ]
+    )
+
+
+# Every stage prepares its inputs outside of the measurement and returns a callable doing the measured work.
+# The callable returns the number of records it processed.
+
+
+def prepare_read_records(options: Mapping[str, Any], server: MockApiServer) -> Callable[[], int]:
+    """HttpStream.read_records: requests, JSON decoding and pagination"""
+    stream = BenchmarkStream(url_base=server.url_base, shape=options["shape"])
+    return lambda: sum(1 for _ in stream.read_records(sync_mode=SyncMode.full_refresh))
+
+
+def prepare_transform(options: Mapping[str, Any], server: MockApiServer) -> Callable[[], int]:
+    """TypeTransformer with the default schema normalization"""
+    records = make_records(options["records"], options["shape"])
+    schema = record_schema(options["shape"])
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    def run() -> int:
+        for record in records:
+            transformer.transform(record, schema)
+        return len(records)
+
+    return run
+
+
+def prepare_source_read(options: Mapping[str, Any], server: MockApiServer) -> Callable[[], int]:
+    """AbstractSource.read: read_records plus transformation and building the AirbyteMessages"""
+    source = BenchmarkSource()
+    config = {"url_base": server.url_base, "shape": options["shape"]}
+    logger = AirbyteLogger(level="WARN")
+    catalog = configured_catalog()
+    return lambda: sum(1 for message in source.read(logger, config, catalog) if message.type == Type.RECORD)
+
+
+def prepare_serialize(options: Mapping[str, Any], server: MockApiServer) -> Callable[[], int]:
+    """Serialization of RECORD messages as done by the entrypoint"""
+    emitted_at = int(time.time() * 1000)
+    messages = [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=STREAM_NAME, data=record, emitted_at=emitted_at))
+        for record in make_records(options["records"], options["shape"])
+    ]
+    return lambda: sum(1 for message in messages if message.json(exclude_unset=True))
+
+
+def prepare_entrypoint(options: Mapping[str, Any], server: MockApiServer) -> Callable[[], int]:
+    """The whole `read` command of AirbyteEntrypoint, from the config files to the serialized messages"""
+    directory = tempfile.mkdtemp()
+    config_path, catalog_path = os.path.join(directory, "config.json"), os.path.join(directory, "catalog.json")
+    with open(config_path, "w") as config_file:
+        json.dump({"url_base": server.url_base, "shape": options["shape"]}, config_file)
+    with open(catalog_path, "w") as catalog_file:
+        catalog_file.write(configured_catalog().json(exclude_unset=True))
+    entrypoint = AirbyteEntrypoint(BenchmarkSource())
+    entrypoint.logger.setLevel(logging.WARNING)
+    parsed_args = entrypoint.parse_args(["read", "--config", config_path, "--catalog", catalog_path])
+
+    def run() -> int:
+        try:
+            for _ in entrypoint.run(parsed_args):
+                pass
+        finally:
+            shutil.rmtree(directory)
+        return options["records"]
+
+    return run
+
+
+STAGES = {
+    "read_records": prepare_read_records,
+    "transform": prepare_transform,
+    "source_read": prepare_source_read,
+    "serialize": prepare_serialize,
+    "entrypoint": prepare_entrypoint,
+}
+
+
+def peak_rss_mb() -> float:
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+
+def run_stage(stage: str, options: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Runs a single stage in the current process.
+    CPU time is measured for the calling thread only, so the mock server thread is not accounted for.
+    """
+    with MockApiServer(
+        records=options["records"], page_size=options["page_size"], shape=options["shape"], latency_ms=options["latency_ms"]
+    ) as server:
+        run = STAGES[stage](options, server)
+        rss_before = peak_rss_mb()
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        records = run()
+        wall_seconds, cpu_seconds = time.perf_counter() - wall_start, time.thread_time() - cpu_start
+    peak_rss = peak_rss_mb()
+    return {
+        "records": records,
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+        "records_per_second": records / wall_seconds if wall_seconds else 0.0,
+        "peak_rss_mb": peak_rss,
+        "stage_rss_mb": peak_rss - rss_before,
+    }
+
+
+def run_isolated(stage: str, options: Mapping[str, Any]) -> Mapping[str, Any]:
+    # spawn rather than fork so the child starts from a clean interpreter and its peak RSS only reflects the stage
+    with multiprocessing.get_context("spawn").Pool(processes=1) as pool:
+        return pool.apply(run_stage, (stage, options))
+
+
+def run_benchmarks(stages: List[str], options: Mapping[str, Any], repeat: int) -> Mapping[str, Any]:
+    """Runs every stage `repeat` times and keeps the run with the median throughput"""
+    results = {}
+    for stage in stages:
+        runs = sorted((run_isolated(stage, options) for _ in range(repeat)), key=lambda result: result["records_per_second"])
+        results[stage] = runs[len(runs) // 2]
+        print(format_result(stage, results[stage]), file=sys.stderr)
+    return results
+
+
+def format_result(stage: str, result: Mapping[str, Any]) -> str:
+    return (
+        f"{stage:<14} {result['records_per_second']:>12,.0f} records/s  {result['cpu_seconds']:>8.3f}s CPU  "
+        f"{result['peak_rss_mb']:>8.1f}MB peak RSS  (+{result['stage_rss_mb']:.1f}MB during the stage)"
+    )
+
+
+def compare(results: Mapping[str, Any], baseline: Mapping[str, Any], max_regression: Optional[float]) -> List[str]:
+    """
+    Prints the relative change of every metric against the baseline.
+    :return: the metrics which regressed by more than max_regression percent
+    """
+    if baseline.get("options") != results["options"]:
+        print("warning: the baseline was recorded with different options, the comparison may not be meaningful", file=sys.stderr)
+    regressions = []
+    for stage, result in results["results"].items():
+        baseline_result = baseline["results"].get(stage)
+        if not baseline_result:
+            continue
+        changes = []
+        for metric, higher_is_better in METRICS.items():
+            if not baseline_result[metric]:
+                continue
+            change = (result[metric] - baseline_result[metric]) / baseline_result[metric] * 100
+            changes.append(f"{metric} {change:+.1f}%")
+            regression = -change if higher_is_better else change
+            if max_regression is not None and regression > max_regression:
+                regressions.append(f"{stage}.{metric}")
+        print(f"{stage:<14} {', '.join(changes)}", file=sys.stderr)
+    return regressions
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the CDK against a local mock API")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES), help="stages to measure, all by default")
+    parser.add_argument("--records", type=int, default=100_000, help="number of records served by the mock API")
+    parser.add_argument("--page-size", type=int, default=1000, help="number of records per page")
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every response of the mock API")
+    parser.add_argument("--shape", choices=SHAPES, default="flat", help="shape of the synthetic records")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs per stage, the run with the median throughput is reported")
+    parser.add_argument("--output", help="write the results as JSON to this file, e.g. to use them as a baseline later")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="exit with an error when a metric is worse than the baseline by more than this percentage",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    parsed_args = parse_args(args)
+    options = {
+        "records": parsed_args.records,
+        "page_size": parsed_args.page_size,
+        "latency_ms": parsed_args.latency_ms,
+        "shape": parsed_args.shape,
+    }
+    results = {"options": options, "results": run_benchmarks(parsed_args.stages, options, max(1, parsed_args.repeat))}
+    if parsed_args.output:
+        with open(parsed_args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    if parsed_args.baseline:
+        with open(parsed_args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), parsed_args.max_regression)
+        if regressions:
+            print(f"regressed by more than {parsed_args.max_regression}%: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
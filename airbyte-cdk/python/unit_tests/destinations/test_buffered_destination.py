@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import threading
+from typing import Any, List, Mapping
+
+import pytest
+from airbyte_cdk import AirbyteLogger
+from airbyte_cdk.destinations import BufferedDestination, DestinationRecord, FlushPolicy
+from airbyte_cdk.models import (
+    AirbyteConnectionStatus,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    ConfiguredAirbyteCatalog,
+    Status,
+    Type,
+)
+
+
+class MockBufferedDestination(BufferedDestination):
+    def __init__(self, flush_policy: FlushPolicy, fail_on_stream: str = None):
+        self.flush_policy = flush_policy
+        self.fail_on_stream = fail_on_stream
+        self.flushed: List[List[DestinationRecord]] = []
+        self.lock = threading.Lock()
+
+    def flush_records(self, config: Mapping[str, Any], stream_name: str, records: List[DestinationRecord]):
+        if stream_name == self.fail_on_stream:
+            raise RuntimeError("flush failed")
+        with self.lock:
+            self.flushed.append(records)
+
+    def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
+        return AirbyteConnectionStatus(status=Status.SUCCEEDED)
+
+    def flushed_data(self) -> List[Mapping[str, Any]]:
+        return sorted([record.data["id"] for records in self.flushed for record in records])
+
+
+def _record(stream: str, record_id: int) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data={"id": record_id}, emitted_at=1))
+
+
+def _state(value: int) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"state": value}))
+
+
+def _input_stream(messages: List[AirbyteMessage]) -> io.TextIOWrapper:
+    lines = "\n".join(message.json(exclude_unset=True) for message in messages) + "\nnot a message\n"
+    return io.TextIOWrapper(io.BytesIO(lines.encode("utf-8")))
+
+
+def test_parse_input_stream_creates_lightweight_records():
+    destination = MockBufferedDestination(FlushPolicy())
+
+    parsed = list(destination._parse_input_stream(_input_stream([_record("s1", 1), _state(1)])))
+
+    assert len(parsed) == 2
+    assert isinstance(parsed[0], DestinationRecord)
+    assert (parsed[0].stream, parsed[0].data, parsed[0].emitted_at) == ("s1", {"id": 1}, 1)
+    assert parsed[0].size > 0
+    assert parsed[1] == _state(1)
+
+
+@pytest.mark.parametrize(
+    "flush_policy",
+    [
+        FlushPolicy(max_records=2),
+        FlushPolicy(max_records=None, max_bytes=1),
+        FlushPolicy(max_records=None, max_bytes=None, max_age_seconds=0),
+        FlushPolicy(max_records=100, flush_on_state=False),
+    ],
+)
+def test_states_are_emitted_after_preceding_records_are_flushed(flush_policy):
+    destination = MockBufferedDestination(flush_policy)
+    messages = [_record("s1", 1), _record("s2", 2), _state(1), _record("s1", 3), _record("s1", 4), _record("s2", 5), _state(2)]
+
+    output = []
+    for state in destination.write({}, ConfiguredAirbyteCatalog(streams=[]), destination._parse_input_stream(_input_stream(messages))):
+        flushed = destination.flushed_data()
+        output.append((state.state.data["state"], flushed))
+
+    assert [state for state, _ in output] == [1, 2]
+    # every record preceding a state was flushed when the state was emitted
+    assert {1, 2} <= set(output[0][1])
+    assert output[1][1] == [1, 2, 3, 4, 5]
+
+
+def test_buffers_are_flushed_by_record_count():
+    destination = MockBufferedDestination(FlushPolicy(max_records=2, max_bytes=None, max_age_seconds=None))
+    messages = [_record("s1", i) for i in range(5)]
+
+    assert list(destination.write({}, ConfiguredAirbyteCatalog(streams=[]), messages)) == []
+    assert sorted(len(records) for records in destination.flushed) == [1, 2, 2]
+    assert destination.flushed_data() == [0, 1, 2, 3, 4]
+
+
+def test_preserve_stream_order():
+    destination = MockBufferedDestination(FlushPolicy(max_records=1, max_bytes=None, max_age_seconds=None))
+    destination.preserve_stream_order = True
+    destination.max_flush_workers = 4
+    messages = [_record(f"s{i % 2}", i) for i in range(20)]
+
+    list(destination.write({}, ConfiguredAirbyteCatalog(streams=[]), messages))
+
+    for stream in ["s0", "s1"]:
+        flushed_ids = [record.data["id"] for records in destination.flushed for record in records if record.stream == stream]
+        assert flushed_ids == sorted(flushed_ids)
+    assert destination.flushed_data() == list(range(20))
+
+
+def test_failed_flush_fails_the_sync_without_emitting_state():
+    destination = MockBufferedDestination(FlushPolicy(), fail_on_stream="s2")
+    messages = [_record("s1", 1), _record("s2", 2), _state(1)]
+
+    with pytest.raises(RuntimeError, match="flush failed"):
+        list(destination.write({}, ConfiguredAirbyteCatalog(streams=[]), messages))
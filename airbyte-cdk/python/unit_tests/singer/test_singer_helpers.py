@@ -4,7 +4,11 @@
 
 
 import copy
+import json
+import shlex
+import sys
 
+import pytest
 from airbyte_cdk.sources.singer import SingerHelper
 
 basic_singer_catalog = {
@@ -54,3 +58,55 @@ def test_singer_catalog_to_airbyte_catalog_pk_override():
 
     user_stream = airbyte_catalog.streams[0]
     assert user_stream.source_defined_primary_key == [["name"]]
+
+
+SINGER_OUTPUT = [
+    '{"type": "SCHEMA", "stream": "users", "schema": {"properties": {"id": {"type": "integer"}}}, "key_properties": ["id"]}',
+    '{"type": "RECORD", "stream": "users", "record": {"id": 1, "amount": 1.10}}',
+    '{"type": "RECORD", "stream": "users", "record": {"id": 2, "nested": {"version": 1}}, "version": 3}',
+    '{"type": "RECORD", "stream": "users", "record": {"id": 3, "time_extracted": "x"}, "time_extracted": "2021-01-01T00:00:00.000000Z"}',
+    '{"type": "RECORD", "stream": "us\\"ers", "record": {"id": 4}}',
+    '{"type": "STATE", "value": {"bookmarks": {"users": {"updated_at": "2021-01-01"}}}}',
+    '{"stream": "users", "type": "RECORD", "record": {"id": 5}}',
+    "INFO not a message",
+]
+
+
+def read_messages(lines, mocker):
+    logger = mocker.MagicMock()
+    script = f"import sys; sys.stdout.write({json.dumps(chr(10).join(lines))}); sys.stderr.write('ERROR tap failed')"
+    output = SingerHelper.read(logger, f"{sys.executable} -c {shlex.quote(script)}")
+    return [json.loads(line) for message in output for line in message.json(exclude_unset=True).split("\n")], logger
+
+
+def test_read_rewrites_singer_messages(mocker):
+    messages, logger = read_messages(SINGER_OUTPUT, mocker)
+
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [(record["stream"], record["data"]) for record in records] == [
+        ("users", {"id": 1, "amount": 1.10}),
+        ("users", {"id": 2, "nested": {"version": 1}}),
+        ("users", {"id": 3, "time_extracted": "x"}),
+        ('us"ers', {"id": 4}),
+        ("users", {"id": 5}),
+    ]
+    assert all(isinstance(record["emitted_at"], int) for record in records)
+    assert [message["type"] for message in messages] == ["RECORD"] * 4 + ["STATE", "RECORD"]
+    assert messages[4]["state"] == {"data": {"bookmarks": {"users": {"updated_at": "2021-01-01"}}}}
+    logger.log_by_prefix.assert_has_calls(
+        [mocker.call("INFO not a message", "INFO"), mocker.call("ERROR tap failed", "ERROR")], any_order=True
+    )
+
+
+def test_read_raises_when_tap_fails(mocker):
+    with pytest.raises(Exception, match="failed with exit code 1"):
+        list(SingerHelper.read(mocker.MagicMock(), f"{sys.executable} -c 'import sys; sys.exit(1)'"))
+
+
+def test_read_batches_records_of_the_same_stream(mocker):
+    lines = [f'{{"type": "RECORD", "stream": "{stream}", "record": {{"id": {index}}}}}' for index, stream in enumerate("aabba")]
+    logger = mocker.MagicMock()
+
+    output = list(SingerHelper._messages_from_lines(logger, lines))
+
+    assert [(batch.stream, batch.record_count) for batch in output] == [("a", 2), ("b", 2), ("a", 1)]
@@ -4,14 +4,29 @@
 
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import pendulum
+import pytest
 import requests
-from airbyte_cdk.sources.streams.http.requests_native_auth import MultipleTokenAuthenticator, Oauth2Authenticator, TokenAuthenticator
+from airbyte_cdk.sources.streams.http.requests_native_auth import (
+    MultipleTokenAuthenticator,
+    Oauth2Authenticator,
+    OAuthTokenCache,
+    TokenAuthenticator,
+)
+from airbyte_cdk.sources.streams.http.requests_native_auth.token_cache import shared_token_cache
 from requests import Response
 
 LOGGER = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_token_cache():
+    shared_token_cache.clear()
+
+
 def test_token_authenticator():
     """
     Should match passed in token, no matter how many times token is retrieved.
@@ -142,3 +157,62 @@ class TestOauth2Authenticator:
         oauth(prepared_request)
 
         assert {"Authorization": "Bearer access_token"} == prepared_request.headers
+
+    def make_authenticator(self, **kwargs) -> Oauth2Authenticator:
+        return Oauth2Authenticator(
+            token_refresh_endpoint=TestOauth2Authenticator.refresh_endpoint,
+            client_id=TestOauth2Authenticator.client_id,
+            client_secret=TestOauth2Authenticator.client_secret,
+            refresh_token=kwargs.pop("refresh_token", TestOauth2Authenticator.refresh_token),
+            **kwargs,
+        )
+
+    def test_token_shared_between_authenticators(self, mocker):
+        refresh = mocker.patch.object(Oauth2Authenticator, "refresh_access_token", return_value=("access_token", 1000))
+
+        assert self.make_authenticator().get_access_token() == "access_token"
+        assert self.make_authenticator().get_access_token() == "access_token"
+        assert refresh.call_count == 1
+
+        refresh.return_value = ("other_access_token", 1000)
+        assert self.make_authenticator(refresh_token="other_refresh_token").get_access_token() == "other_access_token"
+        assert refresh.call_count == 2
+
+    def test_token_refreshed_before_expiry(self, mocker):
+        refresh = mocker.patch.object(Oauth2Authenticator, "refresh_access_token", return_value=("access_token_1", 30))
+        authenticator = self.make_authenticator(token_cache=OAuthTokenCache(expiry_margin_seconds=60))
+
+        assert authenticator.get_access_token() == "access_token_1"
+        # short lived tokens are reused for half of their lifetime
+        assert authenticator._token_expiry_date < pendulum.now().add(seconds=16)
+
+        refresh.return_value = ("access_token_2", 1000)
+        mocker.patch.object(pendulum, "now", return_value=pendulum.now().add(seconds=20))
+        assert authenticator.get_access_token() == "access_token_2"
+
+    def test_concurrent_refreshes(self, mocker):
+        started = threading.Event()
+
+        def slow_refresh(_):
+            started.wait(timeout=5)
+            return "access_token", 1000
+
+        refresh = mocker.patch.object(Oauth2Authenticator, "refresh_access_token", side_effect=slow_refresh, autospec=True)
+        authenticators = [self.make_authenticator() for _ in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = [executor.submit(authenticator.get_access_token) for authenticator in authenticators]
+            started.set()
+
+        assert {token.result() for token in tokens} == {"access_token"}
+        assert refresh.call_count == 1
+
+    def test_file_backed_token_cache(self, mocker, tmp_path):
+        path = str(tmp_path / "tokens.json")
+        refresh = mocker.patch.object(Oauth2Authenticator, "refresh_access_token", return_value=("access_token", 1000))
+
+        assert self.make_authenticator(token_cache=OAuthTokenCache(path=path)).get_access_token() == "access_token"
+        # a new cache with the same file stands for a later run of the connector
+        assert self.make_authenticator(token_cache=OAuthTokenCache(path=path)).get_access_token() == "access_token"
+        assert refresh.call_count == 1
+        assert TestOauth2Authenticator.refresh_token not in (tmp_path / "tokens.json").read_text()
+        assert (tmp_path / "tokens.json").stat().st_mode & 0o077 == 0
@@ -161,6 +161,47 @@ def test_stub_custom_backoff_http_stream(mocker):
     # TODO(davin): Figure out how to assert calls.
 
 
+def test_metrics_count_requests_and_retries(mocker):
+    mocker.patch("time.sleep", lambda x: None)
+    stream = StubCustomBackoffHttpStream()
+    retry = requests.Response()
+    retry.status_code = HTTPStatus.TOO_MANY_REQUESTS
+    retry._content = b""
+    ok = requests.Response()
+    ok.status_code = HTTPStatus.OK
+    ok._content = b'{"data": 1}'
+    mocker.patch.object(requests.Session, "send", side_effect=[retry, retry, ok])
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert len(records) == 1
+    assert stream.runtime_metrics.requests == 3
+    assert stream.runtime_metrics.retries == 2
+    assert stream.runtime_metrics.bytes == len(ok.content)
+    assert stream.runtime_metrics.backoff_seconds >= 0
+
+
+class StubStreamWithMetricsAttribute(StubBasicReadHttpStream):
+    # streams of reporting APIs commonly call the columns they request metrics
+    metrics = ["impressions"]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = ["clicks"]
+
+
+def test_metrics_attribute_of_stream_is_kept(requests_mock):
+    stream = StubStreamWithMetricsAttribute()
+    requests_mock.register_uri("GET", stream.url_base, json={})
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert len(records) == 1
+    assert stream.metrics == ["clicks"]
+    assert StubStreamWithMetricsAttribute.metrics == ["impressions"]
+    assert stream.runtime_metrics.requests == 1
+
+
 @pytest.mark.parametrize("retries", [-20, -1, 0, 1, 2, 10])
 def test_stub_custom_backoff_http_stream_retries(mocker, retries):
     mocker.patch("time.sleep", lambda x: None)
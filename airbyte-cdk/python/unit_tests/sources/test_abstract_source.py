@@ -2,9 +2,9 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-
+import json
 from collections import defaultdict
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import pytest
 from airbyte_cdk.logger import AirbyteLogger
@@ -23,7 +23,8 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import AbstractSource
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import ColumnarStream, Stream
+from airbyte_cdk.sources.utils.stream_metrics import METRICS_LOG_PREFIX
 
 
 class MockSource(AbstractSource):
@@ -346,3 +347,118 @@ def test_valid_incremental_read_with_slices_and_interval(mocker, logger):
     messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
 
     assert expected == messages
+
+
+class MockColumnarStream(ColumnarStream):
+    def __init__(self, batches: List[Any], name: str):
+        self._batches = batches
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def cursor_field(self) -> str:
+        return "id"
+
+    @property
+    def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
+        return "id"
+
+    def read_record_batches(self, **kwargs) -> Iterable[Any]:
+        return self._batches
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
+        return {"id": max(current_stream_state.get("id", 0), latest_record["id"])}
+
+
+def _serialized_records(messages: List[Any]) -> List[Dict[str, Any]]:
+    records = []
+    for message in messages:
+        if message.type == Type.RECORD:
+            records += [json.loads(line)["record"]["data"] for line in message.json(exclude_unset=True).split("\n")]
+    return records
+
+
+def test_columnar_stream_full_refresh_read(mocker, logger):
+    """Tests that columnar streams are emitted as serialized batches, respecting the internal record limit"""
+    pa = pytest.importorskip("pyarrow")
+    batches = [pa.RecordBatch.from_pydict({"id": [1, 2]}), pa.RecordBatch.from_pydict({"id": [3, 4]})]
+    stream = MockColumnarStream(batches, name="s1")
+    mocker.patch.object(MockColumnarStream, "get_json_schema", return_value={})
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    messages = list(src.read(logger, {}, catalog))
+    assert _serialized_records(messages) == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+
+    messages = list(src.read(logger, {"_limit": 3}, catalog))
+    assert _serialized_records(messages) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_columnar_stream_incremental_read(mocker, logger):
+    """Tests that columnar streams update state per batch and checkpoint when a batch crosses the checkpoint interval"""
+    pa = pytest.importorskip("pyarrow")
+    batches = [pa.RecordBatch.from_pydict({"id": [1, 2]}), pa.RecordBatch.from_pydict({"id": [3, 4]})]
+    stream = MockColumnarStream(batches, name="s1")
+    mocker.patch.object(MockColumnarStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockColumnarStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=3)
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    messages = list(src.read(logger, {}, catalog, state={}))
+
+    assert [message.type for message in messages] == [Type.RECORD, Type.RECORD, Type.STATE, Type.STATE]
+    assert _serialized_records(messages) == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert messages[-1].state.data == {"s1": {"id": 4}}
+
+
+def test_read_logs_stream_metrics(mocker):
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    logger = mocker.MagicMock()
+    src = MockSource(streams=[s1])
+    src.metrics_log_interval_seconds = 0
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    list(src.read(logger, {}, catalog))
+
+    logged_metrics = [
+        json.loads(call.args[0][len(METRICS_LOG_PREFIX) :])
+        for call in logger.info.call_args_list
+        if call.args[0].startswith(METRICS_LOG_PREFIX)
+    ]
+    # logged after every record since the interval is 0, then once more at the end of the stream
+    assert [(metrics["records"], metrics["final"]) for metrics in logged_metrics] == [(1, False), (2, False), (2, True)]
+    assert logged_metrics[-1]["stream"] == "s1"
+    assert s1.runtime_metrics.records == 2
+
+
+def test_incremental_read_does_not_modify_input_state(mocker, logger):
+    stream_output = [{"cursor": 1}, {"cursor": 2}]
+    input_state = {"s1": {"cursor": 0}, "other": {"cursor": 5}}
+    s1 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {"cursor": 0}}, stream_output)], name="s1")
+
+    def update_in_place(self, current_stream_state, latest_record):
+        current_stream_state["cursor"] = latest_record["cursor"]
+        return current_stream_state
+
+    mocker.patch.object(MockStream, "get_updated_state", update_in_place)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=1)
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
+
+    messages = list(src.read(logger, {}, catalog, state=input_state))
+
+    assert input_state == {"s1": {"cursor": 0}, "other": {"cursor": 5}}
+    states = [message.state.data for message in messages if message.type == Type.STATE]
+    assert states[-1] == {"s1": {"cursor": 2}, "other": {"cursor": 5}}
+    # records are built without validation but serialized exactly like validated messages
+    records = [message for message in _fix_emitted_at(messages) if message.type == Type.RECORD]
+    assert [message.json(exclude_unset=True) for message in records] == [
+        _as_record("s1", record).json(exclude_unset=True) for record in stream_output
+    ]
@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import json
+
+import pytest
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from airbyte_cdk.sources.utils.record_batch import RecordBatchSerializer
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _expected_lines(stream, records, emitted_at):
+    return [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data=record, emitted_at=emitted_at)).json(
+            exclude_unset=True
+        )
+        for record in records
+    ]
+
+
+def test_serialize_matches_pydantic_output():
+    records = [
+        {"id": 1, "name": "foo", "flag": True, "amount": 1.5},
+        {"id": 2, "name": None, "flag": False, "amount": None},
+        {"id": None, "name": "bar", "flag": None, "amount": -2.25},
+    ]
+    batch = pa.RecordBatch.from_pydict({key: [record[key] for record in records] for key in records[0]})
+
+    serialized = RecordBatchSerializer().serialize("stream", batch, emitted_at=1000)
+
+    assert serialized.type == Type.RECORD
+    assert serialized.record_count == 3
+    assert serialized.json(exclude_unset=True).split("\n") == _expected_lines("stream", records, 1000)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ['quote " and backslash \\', "new\nline\ttab", "control \x01 char", "unicode ☃", ""],
+)
+def test_serialize_escapes_strings(value):
+    batch = pa.RecordBatch.from_pydict({"text": [value]})
+
+    payload = RecordBatchSerializer().serialize("s", batch, emitted_at=1).payload
+
+    assert json.loads(payload)["record"]["data"] == {"text": value}
+
+
+def test_serialize_nested_and_temporal_columns():
+    batch = pa.RecordBatch.from_pydict(
+        {
+            "nested": [{"a": 1, "b": "x"}, None],
+            "ts": [datetime.datetime(2021, 1, 2, 3, 4, 5), None],
+            "day": [datetime.date(2021, 1, 2), datetime.date(2021, 1, 3)],
+            "tags": [["a", "b"], []],
+        }
+    )
+
+    lines = RecordBatchSerializer().serialize("s", batch, emitted_at=1).payload.split("\n")
+
+    first, second = [json.loads(line)["record"]["data"] for line in lines]
+    assert first["nested"] == {"a": 1, "b": "x"}
+    assert first["ts"] == "2021-01-02T03:04:05"
+    assert first["day"] == "2021-01-02"
+    assert first["tags"] == ["a", "b"]
+    assert second == {"nested": None, "ts": None, "day": "2021-01-03", "tags": []}
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        pa.array([datetime.datetime(2021, 1, 2, 3, 4, 5), datetime.datetime(2021, 1, 2, 3, 4, 5, 120)], type=pa.timestamp("us")),
+        pa.array([datetime.datetime(2021, 1, 2, 3, 4, 5), None], type=pa.timestamp("ms", tz="UTC")),
+        pa.array([datetime.datetime(2021, 1, 2, 3, 4, 5, 999)], type=pa.timestamp("ns")),
+        pa.array([datetime.date(2021, 1, 2)], type=pa.date64()),
+        pa.array([datetime.time(3, 4, 5), datetime.time(3, 4, 5, 10)], type=pa.time64("us")),
+    ],
+)
+def test_serialize_temporal_columns_like_isoformat(column):
+    batch = pa.RecordBatch.from_arrays([column], names=["value"])
+
+    lines = RecordBatchSerializer().serialize("s", batch, emitted_at=1).payload.split("\n")
+
+    expected = [None if value is None else value.isoformat() for value in column.to_pylist()]
+    assert [json.loads(line)["record"]["data"]["value"] for line in lines] == expected
+
+
+def test_serialize_binary_columns_as_utf8():
+    batch = pa.RecordBatch.from_pydict({"binary": pa.array([b"caf\xc3\xa9", None], type=pa.binary())})
+
+    lines = RecordBatchSerializer().serialize("s", batch, emitted_at=1).payload.split("\n")
+
+    assert [json.loads(line)["record"]["data"] for line in lines] == [{"binary": "café"}, {"binary": None}]
+    with pytest.raises(pa.ArrowInvalid):
+        RecordBatchSerializer().serialize("s", pa.RecordBatch.from_pydict({"binary": pa.array([b"\xff"])}), emitted_at=1)
+
+
+def test_serialize_large_string_and_dictionary_columns():
+    batch = pa.RecordBatch.from_pydict(
+        {"large": pa.array(["a", None], type=pa.large_string()), "category": pa.array(["x", "y"]).dictionary_encode()}
+    )
+
+    lines = RecordBatchSerializer().serialize("s", batch, emitted_at=1).payload.split("\n")
+
+    assert [json.loads(line)["record"]["data"] for line in lines] == [{"large": "a", "category": "x"}, {"large": None, "category": "y"}]
+
+
+def test_serialize_sliced_batch():
+    batch = pa.RecordBatch.from_pydict({"id": list(range(10)), "nested": [{"v": i} for i in range(10)]}).slice(5, 3)
+
+    lines = RecordBatchSerializer().serialize("s", batch, emitted_at=1).payload.split("\n")
+
+    assert [json.loads(line)["record"]["data"] for line in lines] == [{"id": i, "nested": {"v": i}} for i in range(5, 8)]
+
+
+def test_serialize_empty_batch():
+    serialized = RecordBatchSerializer().serialize("s", pa.RecordBatch.from_pydict({"id": pa.array([], pa.int64())}), emitted_at=1)
+
+    assert serialized.record_count == 0
+    assert serialized.payload == ""
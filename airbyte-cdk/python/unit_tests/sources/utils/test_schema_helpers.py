@@ -34,6 +34,12 @@ def create_and_teardown_schemas_dir():
     shutil.rmtree(SCHEMAS_ROOT)
 
 
+@fixture(autouse=True)
+def clear_schema_cache():
+    # tests rewrite the same schema files, so schemas cached by previous tests would be stale
+    ResourceSchemaLoader.clear_cache()
+
+
 def create_schema(name: str, content: Mapping):
     with open(SCHEMAS_ROOT / f"{name}.json", "w") as f:
         f.write(json.dumps(content))
@@ -155,3 +161,18 @@ class TestResourceSchemaLoader:
         # Make sure generated schema is JSON serializable
         assert json.dumps(actual_schema)
         assert jsonref.JsonRef.replace_refs(actual_schema)
+
+    @staticmethod
+    def test_schema_is_cached():
+        schema = {"type": ["null", "object"], "properties": {"str": {"type": "string"}}}
+        create_schema("cached_schema", schema)
+        resolver = ResourceSchemaLoader(MODULE_NAME)
+
+        actual_schema = resolver.get_schema("cached_schema")
+        actual_schema["properties"]["added"] = {"type": "string"}
+        create_schema("cached_schema", {"type": "object"})
+
+        # the file isn't read again and changes made by the caller don't leak into the cache
+        assert ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema") == schema
+        ResourceSchemaLoader.clear_cache()
+        assert resolver.get_schema("cached_schema") == {"type": "object"}
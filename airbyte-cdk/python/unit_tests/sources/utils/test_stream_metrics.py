@@ -0,0 +1,35 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+from airbyte_cdk.sources.utils.stream_metrics import METRICS_LOG_PREFIX, StreamMetrics
+
+
+def test_time_parsing_yields_all_records():
+    metrics = StreamMetrics()
+
+    assert list(metrics.time_parsing(iter([1, 2, 3]))) == [1, 2, 3]
+    assert metrics.parse_seconds > 0
+
+
+def test_render():
+    metrics = StreamMetrics()
+    metrics.records = 10
+    metrics.add_request(seconds=0.5, response_bytes=100)
+    metrics.add_request(seconds=0.25, response_bytes=50)
+    metrics.add_retries(retries=1, backoff_seconds=2)
+
+    message = metrics.render("users", final=True)
+
+    assert message.startswith(METRICS_LOG_PREFIX)
+    rendered = json.loads(message[len(METRICS_LOG_PREFIX) :])
+    assert rendered["stream"] == "users"
+    assert rendered["final"] is True
+    assert rendered["records"] == 10
+    assert rendered["bytes"] == 150
+    assert rendered["requests"] == 2
+    assert rendered["retries"] == 1
+    assert rendered["request_seconds"] == 0.75
+    assert rendered["backoff_seconds"] == 2
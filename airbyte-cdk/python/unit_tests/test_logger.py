@@ -4,10 +4,12 @@
 
 
 import json
+import logging
 from typing import Dict
 
 import pytest
-from airbyte_cdk.logger import AirbyteLogFormatter, init_logger
+from airbyte_cdk.logger import AirbyteLogFormatter, AirbyteLogger, RateLimitedLogger, encode_log_message, init_logger
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage
 
 
 @pytest.fixture(scope="session")
@@ -73,3 +75,59 @@ def test_fatal(logger, caplog):
     record = caplog.records[0]
     assert record.levelname == "CRITICAL"
     assert record.message == "Test fatal 1"
+
+
+@pytest.mark.parametrize("level", ["INFO", "WARNING", "TRACE"])
+@pytest.mark.parametrize("message", ["Test message", 'quotes " and \\ backslashes', "new\nline", "unicode ünïcödé \u2028"])
+def test_encode_log_message(level, message):
+    expected = AirbyteMessage(type="LOG", log=AirbyteLogMessage(level=level, message=message)).json(exclude_unset=True)
+    assert encode_log_message(level, message) == expected
+
+
+def test_airbyte_logger_level(capsys):
+    logger = AirbyteLogger(level="INFO")
+    logger.debug("Test debug %s", "1")
+    logger.info("Test info %s", "1")
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["log"] for line in lines] == [{"level": "INFO", "message": "Test info 1"}]
+
+
+def test_rate_limited_logger(mocker):
+    logger = mocker.Mock()
+    monotonic = mocker.patch("airbyte_cdk.logger.time.monotonic", return_value=0)
+    rate_limited_logger = RateLimitedLogger(logger, interval_seconds=10)
+    rate_limited_logger.info("first", "Message %s", 1)
+    rate_limited_logger.info("first", "Message %s", 2)
+    rate_limited_logger.info("second", "Message %s", 3)
+    monotonic.return_value = 10
+    rate_limited_logger.info("first", "Message %s", 4)
+
+    assert logger.info.call_args_list == [
+        mocker.call("Message %s", 1),
+        mocker.call("Message %s", 3),
+        mocker.call("%s (%d similar messages skipped)", "Message 4", 1),
+    ]
+
+
+def test_rate_limited_logger_message_with_percent_sign(capsys, mocker):
+    monotonic = mocker.patch("airbyte_cdk.logger.time.monotonic", return_value=0)
+    rate_limited_logger = RateLimitedLogger(AirbyteLogger(), interval_seconds=10)
+    rate_limited_logger.info("key", "a")
+    rate_limited_logger.info("key", "a")
+    monotonic.return_value = 10
+    rate_limited_logger.info("key", "rate 50% done")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["log"]["message"] for line in lines] == ["a", "rate 50% done (1 similar messages skipped)"]
+
+
+@pytest.mark.parametrize("env_level,expected_level", [(None, "TRACE"), ("info", "INFO"), ("WARN", "WARN"), ("unknown", "TRACE")])
+def test_log_level_from_environment(monkeypatch, env_level, expected_level):
+    if env_level:
+        monkeypatch.setenv("AIRBYTE_LOG_LEVEL", env_level)
+    else:
+        monkeypatch.delenv("AIRBYTE_LOG_LEVEL", raising=False)
+
+    assert AirbyteLogger().level == expected_level
+    native_logger = init_logger(f"test_log_level_{expected_level}_{env_level}")
+    assert logging.getLevelName(native_logger.level) == ("WARNING" if expected_level == "WARN" else expected_level)
@@ -0,0 +1,87 @@
+{#
+    Filter applied to the input rows of incremental models:
+    only rows emitted after the most recent row already stored in the model's table are processed.
+    The whole input is processed when the table doesn't exist yet, is empty or on full refresh runs.
+#}
+
+{% macro incremental_clause(col_emitted_at) -%}
+{%- if is_incremental() %}
+and (
+    {{ col_emitted_at }} > (select max({{ col_emitted_at }}) from {{ this }})
+    or (select max({{ col_emitted_at }}) from {{ this }}) is null
+)
+{%- endif %}
+{%- endmacro %}
+
+{#
+    dbt quotes the column names listed in the SQL merging new rows into an incremental table without escaping the quotes
+    they contain, e.g: "column`_'with"_quotes". The macros below are dbt's own implementations using properly quoted names.
+#}
+
+{% macro quoted_column_names(columns) -%}
+    {#-- the quote character of the destination is escaped by doubling it: " for most of them, ` for mysql --#}
+    {%- set quote_character = adapter.quote('')[0] -%}
+    {%- set quoted = [] -%}
+    {%- for column in columns -%}
+        {%- do quoted.append(adapter.quote(column.name | replace(quote_character, quote_character ~ quote_character))) -%}
+    {%- endfor -%}
+    {{ return(quoted) }}
+{%- endmacro %}
+
+{#-- used by the incremental materialization of postgres, redshift, mssql and mysql --#}
+{% macro incremental_upsert(tmp_relation, target_relation, unique_key=none, statement_name="main") %}
+    {%- set dest_columns = adapter.get_columns_in_relation(target_relation) -%}
+    {%- set dest_cols_csv = quoted_column_names(dest_columns) | join(', ') -%}
+
+    {%- if unique_key is not none -%}
+    delete
+    from {{ target_relation }}
+    where ({{ unique_key }}) in (
+        select ({{ unique_key }})
+        from {{ tmp_relation }}
+    );
+    {%- endif %}
+
+    insert into {{ target_relation }} ({{ dest_cols_csv }})
+    (
+       select {{ dest_cols_csv }}
+       from {{ tmp_relation }}
+    );
+{%- endmacro %}
+
+{#-- used by the incremental materialization of snowflake --#}
+{% macro snowflake__get_merge_sql(target, source, unique_key, dest_columns, predicates) -%}
+    {%- set predicates = [] if predicates is none else [] + predicates -%}
+    {%- set quoted_columns = quoted_column_names(dest_columns) -%}
+    {%- set dest_cols_csv = quoted_columns | join(', ') -%}
+    {%- set sql_header = config.get('sql_header', none) -%}
+
+    {% if unique_key %}
+        {% set unique_key_match %}
+            DBT_INTERNAL_SOURCE.{{ unique_key }} = DBT_INTERNAL_DEST.{{ unique_key }}
+        {% endset %}
+        {% do predicates.append(unique_key_match) %}
+    {% else %}
+        {% do predicates.append('FALSE') %}
+    {% endif %}
+
+    {{ sql_header if sql_header is not none }}
+
+    merge into {{ target }} as DBT_INTERNAL_DEST
+        using {{ source }} as DBT_INTERNAL_SOURCE
+        on {{ predicates | join(' and ') }}
+
+    {% if unique_key %}
+    when matched then update set
+        {% for column_name in quoted_columns -%}
+            {{ column_name }} = DBT_INTERNAL_SOURCE.{{ column_name }}
+            {%- if not loop.last %}, {%- endif %}
+        {%- endfor %}
+    {% endif %}
+
+    when not matched then insert
+        ({{ dest_cols_csv }})
+    values
+        ({{ dest_cols_csv }})
+
+{% endmacro %}
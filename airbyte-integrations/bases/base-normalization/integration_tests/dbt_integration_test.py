@@ -298,7 +298,7 @@ class DbtIntegrationTest(object):
         else:
             return "airbyte/normalization:dev"
 
-    def dbt_run(self, destination_type: DestinationType, test_root_dir: str):
+    def dbt_run(self, destination_type: DestinationType, test_root_dir: str, output_dir: str = "final"):
         """
         Run the dbt CLI to perform transformations on the test raw data in the destination
         """
@@ -306,15 +306,16 @@ class DbtIntegrationTest(object):
         # Perform sanity check on dbt project settings
         assert self.run_check_dbt_command(normalization_image, "debug", test_root_dir)
         assert self.run_check_dbt_command(normalization_image, "deps", test_root_dir)
-        final_sql_files = os.path.join(test_root_dir, "final")
+        final_sql_files = os.path.join(test_root_dir, output_dir)
         shutil.rmtree(final_sql_files, ignore_errors=True)
         # Compile dbt models files into destination sql dialect, then run the transformation queries
-        assert self.run_check_dbt_command(normalization_image, "run", test_root_dir)
+        assert self.run_check_dbt_command(normalization_image, "run", test_root_dir, output_dir)
 
     @staticmethod
-    def run_check_dbt_command(normalization_image: str, command: str, cwd: str) -> bool:
+    def run_check_dbt_command(normalization_image: str, command: str, cwd: str, output_dir: str = "final") -> bool:
         """
         Run dbt subprocess while checking and counting for "ERROR", "FAIL" or "WARNING" printed in its outputs
+        The SQL compiled by dbt from the generated models is written to the output_dir folder of cwd
         """
         error_count = 0
         commands = [
@@ -327,7 +328,7 @@ class DbtIntegrationTest(object):
             "-v",
             f"{cwd}/build:/build",
             "-v",
-            f"{cwd}/final:/build/run/airbyte_utils/models/generated",
+            f"{cwd}/{output_dir}:/build/run/airbyte_utils/models/generated",
             "-v",
             "/tmp:/tmp",
             "--network",
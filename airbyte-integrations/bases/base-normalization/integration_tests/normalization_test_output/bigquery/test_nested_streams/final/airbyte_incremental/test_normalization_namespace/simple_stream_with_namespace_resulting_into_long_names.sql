@@ -14,5 +14,7 @@ select
     _airbyte_simple_stream_with_namespace_resulting_into_long_names_hashid
 from `dataline-integration-testing`._airbyte_test_normalization_namespace.`simple_stream_with_namespace_resulting_into_long_names_ab3`
 -- simple_stream_with_namespace_resulting_into_long_names from `dataline-integration-testing`.test_normalization_namespace._airbyte_raw_simple_stream_with_namespace_resulting_into_long_names
+where 1 = 1
+
   );
-    
\ No newline at end of file
+  
\ No newline at end of file
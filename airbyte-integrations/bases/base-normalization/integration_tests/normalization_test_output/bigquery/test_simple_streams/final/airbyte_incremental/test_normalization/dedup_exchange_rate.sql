@@ -16,10 +16,12 @@ select
     HKD_special___characters_1,
     NZD,
     USD,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from `dataline-integration-testing`.test_normalization.`dedup_exchange_rate_scd`
 -- dedup_exchange_rate from `dataline-integration-testing`.test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_active_row = 1
+
   );
-    
\ No newline at end of file
+  
\ No newline at end of file
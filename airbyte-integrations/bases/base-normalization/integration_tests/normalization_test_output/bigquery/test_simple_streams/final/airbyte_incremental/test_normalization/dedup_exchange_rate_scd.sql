@@ -7,6 +7,33 @@
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        id,
+        currency,
+        date,
+        timestamp_col,
+        HKD_special___characters,
+        HKD_special___characters_1,
+        NZD,
+        USD,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from `dataline-integration-testing`._airbyte_test_normalization.`dedup_exchange_rate_ab3`
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     currency,
@@ -16,6 +43,15 @@ select
     HKD_special___characters_1,
     NZD,
     USD,
+  to_hex(md5(cast(concat(coalesce(cast(id as 
+    string
+), ''), '-', coalesce(cast(currency as 
+    string
+), ''), '-', coalesce(cast(NZD as 
+    string
+), '')) as 
+    string
+))) as _airbyte_unique_key,
   date as _airbyte_start_at,
   lag(date) over (
     partition by id, currency, cast(NZD as 
@@ -31,8 +67,8 @@ select
   ) is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_dedup_exchange_rate_hashid
-from `dataline-integration-testing`._airbyte_test_normalization.`dedup_exchange_rate_ab4`
+from dedup_data
 -- dedup_exchange_rate from `dataline-integration-testing`.test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_row_num = 1
   );
-    
\ No newline at end of file
+  
\ No newline at end of file
@@ -7,6 +7,31 @@
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        id,
+        name,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _ab_cdc_log_pos,
+        _airbyte_emitted_at,
+        _airbyte_pos_dedup_cdcx_hashid
+    from `dataline-integration-testing`._airbyte_test_normalization.`pos_dedup_cdcx_ab3`
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_pos_dedup_cdcx_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     name,
@@ -14,6 +39,11 @@ select
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
     _ab_cdc_log_pos,
+  to_hex(md5(cast(concat(coalesce(cast(id as 
+    string
+), '')) as 
+    string
+))) as _airbyte_unique_key,
   _airbyte_emitted_at as _airbyte_start_at,
   lag(_airbyte_emitted_at) over (
     partition by id
@@ -25,8 +55,8 @@ select
   ) is null and _ab_cdc_deleted_at is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_pos_dedup_cdcx_hashid
-from `dataline-integration-testing`._airbyte_test_normalization.`pos_dedup_cdcx_ab4`
+from dedup_data
 -- pos_dedup_cdcx from `dataline-integration-testing`.test_normalization._airbyte_raw_pos_dedup_cdcx
 where _airbyte_row_num = 1
   );
-    
\ No newline at end of file
+  
\ No newline at end of file
@@ -14,6 +14,7 @@ select
     _ab_cdc_lsn,
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_cdc_excluded_hashid
 from `dataline-integration-testing`.test_normalization.`dedup_cdc_excluded_scd`
@@ -0,0 +1,84 @@
+{{ config(schema="test_normalization", tags=["top-level"], unique_key='_airbyte_dedup_cdc_excluded_hashid') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        id,
+        name,
+        column___with__quotes,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from {{ ref('dedup_cdc_excluded_ab3') }}
+    where 1 = 1
+    {{ incremental_clause('_airbyte_emitted_at') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        id,
+        name,
+        column___with__quotes,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from {{ this }} this_data
+    where _airbyte_unique_key in (
+        select {{ dbt_utils.surrogate_key(['id']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        id,
+        name,
+        column___with__quotes,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from {{ ref('dedup_cdc_excluded_ab3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_cdc_excluded_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
+select
+    id,
+    name,
+    column___with__quotes,
+    _ab_cdc_lsn,
+    _ab_cdc_updated_at,
+    _ab_cdc_deleted_at,
+  {{ dbt_utils.surrogate_key(['id']) }} as _airbyte_unique_key,
+  _airbyte_emitted_at as _airbyte_start_at,
+  lag(_airbyte_emitted_at) over (
+    partition by id
+    order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc
+  ) as _airbyte_end_at,
+  case when lag(_airbyte_emitted_at) over (
+    partition by id
+    order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc, _ab_cdc_updated_at desc
+  ) is null and _ab_cdc_deleted_at is null  then 1 else 0 end as _airbyte_active_row,
+  _airbyte_emitted_at,
+  _airbyte_dedup_cdc_excluded_hashid
+from dedup_data
+-- dedup_cdc_excluded from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_excluded') }}
+where _airbyte_row_num = 1
+
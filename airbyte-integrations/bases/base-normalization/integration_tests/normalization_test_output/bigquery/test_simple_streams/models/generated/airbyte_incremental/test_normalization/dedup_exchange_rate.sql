@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level"], unique_key='_airbyte_unique_key') }}
 -- Final base SQL model
 select
     id,
@@ -9,9 +9,11 @@ select
     HKD_special___characters_1,
     NZD,
     USD,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from {{ ref('dedup_exchange_rate_scd') }}
 -- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
 where _airbyte_active_row = 1
+{{ incremental_clause('_airbyte_emitted_at') }}
 
@@ -1,23 +1,24 @@
 
+      
    
   USE [test_normalization];
-  if object_id ('test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp_temp_view"','V') is not null
+  if object_id ('test_normalization_namespace."simple_stream_with_na__lting_into_long_names_temp_view"','V') is not null
       begin
-      drop view test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp_temp_view"
+      drop view test_normalization_namespace."simple_stream_with_na__lting_into_long_names_temp_view"
       end
 
 
    
    
   USE [test_normalization];
-  if object_id ('test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp"','U') is not null
+  if object_id ('test_normalization_namespace."simple_stream_with_na__lting_into_long_names"','U') is not null
       begin
-      drop table test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp"
+      drop table test_normalization_namespace."simple_stream_with_na__lting_into_long_names"
       end
 
 
    USE [test_normalization];
-   EXEC('create view test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp_temp_view" as
+   EXEC('create view test_normalization_namespace."simple_stream_with_na__lting_into_long_names_temp_view" as
     
 -- Final base SQL model
 select
@@ -27,29 +28,33 @@ select
     _airbyte_simple_strea__nto_long_names_hashid
 from "test_normalization"._airbyte_test_normalization_namespace."simple_stream_with_na__lting_into_long_names_ab3"
 -- simple_stream_with_na__lting_into_long_names from "test_normalization".test_normalization_namespace._airbyte_raw_simple_stream_with_namespace_resulting_into_long_names
+where 1 = 1
+
     ');
 
-   SELECT * INTO "test_normalization".test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp" FROM
-    "test_normalization".test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp_temp_view"
+   SELECT * INTO "test_normalization".test_normalization_namespace."simple_stream_with_na__lting_into_long_names" FROM
+    "test_normalization".test_normalization_namespace."simple_stream_with_na__lting_into_long_names_temp_view"
 
    
    
   USE [test_normalization];
-  if object_id ('test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp_temp_view"','V') is not null
+  if object_id ('test_normalization_namespace."simple_stream_with_na__lting_into_long_names_temp_view"','V') is not null
       begin
-      drop view test_normalization_namespace."simple_stream_with_na__lting_into_long_names__dbt_tmp_temp_view"
+      drop view test_normalization_namespace."simple_stream_with_na__lting_into_long_names_temp_view"
       end
 
     
    use [test_normalization];
   if EXISTS (
         SELECT * FROM
-        sys.indexes WHERE name = 'test_normalization_namespace_simple_stream_with_na__lting_into_long_names__dbt_tmp_cci'
-        AND object_id=object_id('test_normalization_namespace_simple_stream_with_na__lting_into_long_names__dbt_tmp')
+        sys.indexes WHERE name = 'test_normalization_namespace_simple_stream_with_na__lting_into_long_names_cci'
+        AND object_id=object_id('test_normalization_namespace_simple_stream_with_na__lting_into_long_names')
     )
-  DROP index test_normalization_namespace.simple_stream_with_na__lting_into_long_names__dbt_tmp.test_normalization_namespace_simple_stream_with_na__lting_into_long_names__dbt_tmp_cci
-  CREATE CLUSTERED COLUMNSTORE INDEX test_normalization_namespace_simple_stream_with_na__lting_into_long_names__dbt_tmp_cci
-    ON test_normalization_namespace.simple_stream_with_na__lting_into_long_names__dbt_tmp
+  DROP index test_normalization_namespace.simple_stream_with_na__lting_into_long_names.test_normalization_namespace_simple_stream_with_na__lting_into_long_names_cci
+  CREATE CLUSTERED COLUMNSTORE INDEX test_normalization_namespace_simple_stream_with_na__lting_into_long_names_cci
+    ON test_normalization_namespace.simple_stream_with_na__lting_into_long_names
 
    
 
+
+  
\ No newline at end of file
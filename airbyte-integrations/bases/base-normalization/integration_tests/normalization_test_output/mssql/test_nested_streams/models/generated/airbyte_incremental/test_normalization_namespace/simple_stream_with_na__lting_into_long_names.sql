@@ -7,4 +7,6 @@ select
     _airbyte_simple_strea__nto_long_names_hashid
 from {{ ref('simple_stream_with_na__lting_into_long_names_ab3') }}
 -- simple_stream_with_na__lting_into_long_names from {{ source('test_normalization_namespace', '_airbyte_raw_simple_stream_with_namespace_resulting_into_long_names') }}
+where 1 = 1
+{{ incremental_clause('_airbyte_emitted_at') }}
 
@@ -1,23 +1,24 @@
 
+      
    
   USE [test_normalization];
-  if object_id ('test_normalization."dedup_exchange_rate__dbt_tmp_temp_view"','V') is not null
+  if object_id ('test_normalization."dedup_exchange_rate_temp_view"','V') is not null
       begin
-      drop view test_normalization."dedup_exchange_rate__dbt_tmp_temp_view"
+      drop view test_normalization."dedup_exchange_rate_temp_view"
       end
 
 
    
    
   USE [test_normalization];
-  if object_id ('test_normalization."dedup_exchange_rate__dbt_tmp"','U') is not null
+  if object_id ('test_normalization."dedup_exchange_rate"','U') is not null
       begin
-      drop table test_normalization."dedup_exchange_rate__dbt_tmp"
+      drop table test_normalization."dedup_exchange_rate"
       end
 
 
    USE [test_normalization];
-   EXEC('create view test_normalization."dedup_exchange_rate__dbt_tmp_temp_view" as
+   EXEC('create view test_normalization."dedup_exchange_rate_temp_view" as
     
 -- Final base SQL model
 select
@@ -29,34 +30,38 @@ select
     hkd_special___characters,
     nzd,
     usd,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from "test_normalization".test_normalization."dedup_exchange_rate_scd"
 -- dedup_exchange_rate from "test_normalization".test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_active_row = 1
+
     ');
 
-   SELECT * INTO "test_normalization".test_normalization."dedup_exchange_rate__dbt_tmp" FROM
-    "test_normalization".test_normalization."dedup_exchange_rate__dbt_tmp_temp_view"
+   SELECT * INTO "test_normalization".test_normalization."dedup_exchange_rate" FROM
+    "test_normalization".test_normalization."dedup_exchange_rate_temp_view"
 
    
    
   USE [test_normalization];
-  if object_id ('test_normalization."dedup_exchange_rate__dbt_tmp_temp_view"','V') is not null
+  if object_id ('test_normalization."dedup_exchange_rate_temp_view"','V') is not null
       begin
-      drop view test_normalization."dedup_exchange_rate__dbt_tmp_temp_view"
+      drop view test_normalization."dedup_exchange_rate_temp_view"
       end
 
     
    use [test_normalization];
   if EXISTS (
         SELECT * FROM
-        sys.indexes WHERE name = 'test_normalization_dedup_exchange_rate__dbt_tmp_cci'
-        AND object_id=object_id('test_normalization_dedup_exchange_rate__dbt_tmp')
+        sys.indexes WHERE name = 'test_normalization_dedup_exchange_rate_cci'
+        AND object_id=object_id('test_normalization_dedup_exchange_rate')
     )
-  DROP index test_normalization.dedup_exchange_rate__dbt_tmp.test_normalization_dedup_exchange_rate__dbt_tmp_cci
-  CREATE CLUSTERED COLUMNSTORE INDEX test_normalization_dedup_exchange_rate__dbt_tmp_cci
-    ON test_normalization.dedup_exchange_rate__dbt_tmp
+  DROP index test_normalization.dedup_exchange_rate.test_normalization_dedup_exchange_rate_cci
+  CREATE CLUSTERED COLUMNSTORE INDEX test_normalization_dedup_exchange_rate_cci
+    ON test_normalization.dedup_exchange_rate
 
    
 
+
+  
\ No newline at end of file
@@ -1,25 +1,51 @@
 
+      
    
   USE [test_normalization];
-  if object_id ('test_normalization."pos_dedup_cdcx_scd__dbt_tmp_temp_view"','V') is not null
+  if object_id ('test_normalization."pos_dedup_cdcx_scd_temp_view"','V') is not null
       begin
-      drop view test_normalization."pos_dedup_cdcx_scd__dbt_tmp_temp_view"
+      drop view test_normalization."pos_dedup_cdcx_scd_temp_view"
       end
 
 
    
    
   USE [test_normalization];
-  if object_id ('test_normalization."pos_dedup_cdcx_scd__dbt_tmp"','U') is not null
+  if object_id ('test_normalization."pos_dedup_cdcx_scd"','U') is not null
       begin
-      drop table test_normalization."pos_dedup_cdcx_scd__dbt_tmp"
+      drop table test_normalization."pos_dedup_cdcx_scd"
       end
 
 
    USE [test_normalization];
-   EXEC('create view test_normalization."pos_dedup_cdcx_scd__dbt_tmp_temp_view" as
+   EXEC('create view test_normalization."pos_dedup_cdcx_scd_temp_view" as
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        id,
+        name,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _ab_cdc_log_pos,
+        _airbyte_emitted_at,
+        _airbyte_pos_dedup_cdcx_hashid
+    from "test_normalization"._airbyte_test_normalization."pos_dedup_cdcx_ab3"
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_pos_dedup_cdcx_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     name,
@@ -27,6 +53,13 @@ select
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
     _ab_cdc_log_pos,
+  convert(varchar(32), HashBytes(''md5'',  coalesce(cast(
+    
+    
+
+    concat(concat(coalesce(cast(id as 
+    VARCHAR(max)), ''''),''''), '''') as 
+    VARCHAR(max)), '''')), 2) as _airbyte_unique_key,
   _airbyte_emitted_at as _airbyte_start_at,
   lag(_airbyte_emitted_at) over (
     partition by id
@@ -38,32 +71,34 @@ select
   ) is null and _ab_cdc_deleted_at is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_pos_dedup_cdcx_hashid
-from "test_normalization"._airbyte_test_normalization."pos_dedup_cdcx_ab4"
+from dedup_data
 -- pos_dedup_cdcx from "test_normalization".test_normalization._airbyte_raw_pos_dedup_cdcx
 where _airbyte_row_num = 1
     ');
 
-   SELECT * INTO "test_normalization".test_normalization."pos_dedup_cdcx_scd__dbt_tmp" FROM
-    "test_normalization".test_normalization."pos_dedup_cdcx_scd__dbt_tmp_temp_view"
+   SELECT * INTO "test_normalization".test_normalization."pos_dedup_cdcx_scd" FROM
+    "test_normalization".test_normalization."pos_dedup_cdcx_scd_temp_view"
 
    
    
   USE [test_normalization];
-  if object_id ('test_normalization."pos_dedup_cdcx_scd__dbt_tmp_temp_view"','V') is not null
+  if object_id ('test_normalization."pos_dedup_cdcx_scd_temp_view"','V') is not null
       begin
-      drop view test_normalization."pos_dedup_cdcx_scd__dbt_tmp_temp_view"
+      drop view test_normalization."pos_dedup_cdcx_scd_temp_view"
       end
 
     
    use [test_normalization];
   if EXISTS (
         SELECT * FROM
-        sys.indexes WHERE name = 'test_normalization_pos_dedup_cdcx_scd__dbt_tmp_cci'
-        AND object_id=object_id('test_normalization_pos_dedup_cdcx_scd__dbt_tmp')
+        sys.indexes WHERE name = 'test_normalization_pos_dedup_cdcx_scd_cci'
+        AND object_id=object_id('test_normalization_pos_dedup_cdcx_scd')
     )
-  DROP index test_normalization.pos_dedup_cdcx_scd__dbt_tmp.test_normalization_pos_dedup_cdcx_scd__dbt_tmp_cci
-  CREATE CLUSTERED COLUMNSTORE INDEX test_normalization_pos_dedup_cdcx_scd__dbt_tmp_cci
-    ON test_normalization.pos_dedup_cdcx_scd__dbt_tmp
+  DROP index test_normalization.pos_dedup_cdcx_scd.test_normalization_pos_dedup_cdcx_scd_cci
+  CREATE CLUSTERED COLUMNSTORE INDEX test_normalization_pos_dedup_cdcx_scd_cci
+    ON test_normalization.pos_dedup_cdcx_scd
 
    
 
+
+  
\ No newline at end of file
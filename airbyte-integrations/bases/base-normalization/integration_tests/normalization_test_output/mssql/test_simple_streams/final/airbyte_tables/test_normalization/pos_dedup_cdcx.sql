@@ -27,6 +27,7 @@ select
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
     _ab_cdc_log_pos,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_pos_dedup_cdcx_hashid
 from "test_normalization".test_normalization."pos_dedup_cdcx_scd"
@@ -0,0 +1,92 @@
+{{ config(schema="test_normalization", tags=["top-level"], unique_key='_airbyte_dedup_exchange_rate_hashid') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        id,
+        currency,
+        {{ adapter.quote('date') }},
+        timestamp_col,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from {{ ref('dedup_exchange_rate_ab3') }}
+    where 1 = 1
+    {{ incremental_clause('_airbyte_emitted_at') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        id,
+        currency,
+        {{ adapter.quote('date') }},
+        timestamp_col,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from {{ this }} this_data
+    where _airbyte_unique_key in (
+        select {{ dbt_utils.surrogate_key(['id', 'currency', 'nzd']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        id,
+        currency,
+        {{ adapter.quote('date') }},
+        timestamp_col,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from {{ ref('dedup_exchange_rate_ab3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
+select
+    id,
+    currency,
+    {{ adapter.quote('date') }},
+    timestamp_col,
+    {{ adapter.quote('HKD@spéçiäl & characters') }},
+    hkd_special___characters,
+    nzd,
+    usd,
+  {{ dbt_utils.surrogate_key(['id', 'currency', 'nzd']) }} as _airbyte_unique_key,
+  {{ adapter.quote('date') }} as _airbyte_start_at,
+  lag({{ adapter.quote('date') }}) over (
+    partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
+    order by {{ adapter.quote('date') }} desc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+  ) as _airbyte_end_at,
+  case when lag({{ adapter.quote('date') }}) over (
+    partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
+    order by {{ adapter.quote('date') }} desc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+  ) is null  then 1 else 0 end as _airbyte_active_row,
+  _airbyte_emitted_at,
+  _airbyte_dedup_exchange_rate_hashid
+from dedup_data
+-- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
+where _airbyte_row_num = 1
+
@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level"], unique_key='_airbyte_unique_key') }}
 -- Final base SQL model
 select
     id,
@@ -7,6 +7,7 @@ select
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
     _ab_cdc_log_pos,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_pos_dedup_cdcx_hashid
 from {{ ref('pos_dedup_cdcx_scd') }}
@@ -1,7 +1,8 @@
 
+      
 
   create  table
-    test_normalization_namespace.`simple_stream_with_na__lting_into_long_names__dbt_tmp`
+    test_normalization_namespace.`simple_stream_with_na__lting_into_long_names`
   as (
     
 -- Final base SQL model
@@ -12,4 +13,8 @@ select
     _airbyte_simple_strea__nto_long_names_hashid
 from _airbyte_test_normalization_namespace.`simple_stream_with_na_1g_into_long_names_ab3`
 -- simple_stream_with_na__lting_into_long_names from test_normalization_namespace._airbyte_raw_simple_s__lting_into_long_names
+where 1 = 1
+
   )
+
+  
\ No newline at end of file
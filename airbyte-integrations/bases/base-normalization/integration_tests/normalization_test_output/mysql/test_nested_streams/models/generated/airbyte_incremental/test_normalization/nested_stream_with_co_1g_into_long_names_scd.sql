@@ -0,0 +1,72 @@
+{{ config(schema="test_normalization", tags=["top-level"], unique_key='_airbyte_nested_strea__nto_long_names_hashid') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        id,
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('partition') }},
+        _airbyte_emitted_at,
+        _airbyte_nested_strea__nto_long_names_hashid
+    from {{ ref('nested_stream_with_co_1g_into_long_names_ab3') }}
+    where 1 = 1
+    {{ incremental_clause('_airbyte_emitted_at') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        id,
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('partition') }},
+        _airbyte_emitted_at,
+        _airbyte_nested_strea__nto_long_names_hashid
+    from {{ this }} this_data
+    where _airbyte_unique_key in (
+        select {{ dbt_utils.surrogate_key(['id']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        id,
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('partition') }},
+        _airbyte_emitted_at,
+        _airbyte_nested_strea__nto_long_names_hashid
+    from {{ ref('nested_stream_with_co_1g_into_long_names_ab3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_nested_strea__nto_long_names_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
+select
+    id,
+    {{ adapter.quote('date') }},
+    {{ adapter.quote('partition') }},
+  {{ dbt_utils.surrogate_key(['id']) }} as _airbyte_unique_key,
+  {{ adapter.quote('date') }} as _airbyte_start_at,
+  lag({{ adapter.quote('date') }}) over (
+    partition by id
+    order by {{ adapter.quote('date') }} is null asc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+  ) as _airbyte_end_at,
+  case when lag({{ adapter.quote('date') }}) over (
+    partition by id
+    order by {{ adapter.quote('date') }} is null asc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+  ) is null  then 1 else 0 end as _airbyte_active_row,
+  _airbyte_emitted_at,
+  _airbyte_nested_strea__nto_long_names_hashid
+from dedup_data
+-- nested_stream_with_co__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_s__lting_into_long_names') }}
+where _airbyte_row_num = 1
+
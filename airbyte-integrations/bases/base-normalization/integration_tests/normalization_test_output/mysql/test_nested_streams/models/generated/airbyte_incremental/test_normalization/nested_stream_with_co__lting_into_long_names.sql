@@ -1,12 +1,14 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level"], unique_key='_airbyte_unique_key') }}
 -- Final base SQL model
 select
     id,
     {{ adapter.quote('date') }},
     {{ adapter.quote('partition') }},
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_nested_strea__nto_long_names_hashid
 from {{ ref('nested_stream_with_co_1g_into_long_names_scd') }}
 -- nested_stream_with_co__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_s__lting_into_long_names') }}
 where _airbyte_active_row = 1
+{{ incremental_clause('_airbyte_emitted_at') }}
 
@@ -1,10 +1,36 @@
 
+      
 
   create  table
-    test_normalization.`dedup_cdc_excluded_scd__dbt_tmp`
+    test_normalization.`dedup_cdc_excluded_scd`
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        id,
+        `name`,
+        `column__'with"_quotes`,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from _airbyte_test_normalization.`dedup_cdc_excluded_ab3`
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_cdc_excluded_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     `name`,
@@ -12,6 +38,7 @@ select
     _ab_cdc_lsn,
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
+  md5(cast(concat(coalesce(cast(id as char), '')) as char)) as _airbyte_unique_key,
   _airbyte_emitted_at as _airbyte_start_at,
   lag(_airbyte_emitted_at) over (
     partition by id
@@ -23,7 +50,9 @@ select
   ) is null and _ab_cdc_deleted_at is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_dedup_cdc_excluded_hashid
-from _airbyte_test_normalization.`dedup_cdc_excluded_ab4`
+from dedup_data
 -- dedup_cdc_excluded from test_normalization._airbyte_raw_dedup_cdc_excluded
 where _airbyte_row_num = 1
   )
+
+  
\ No newline at end of file
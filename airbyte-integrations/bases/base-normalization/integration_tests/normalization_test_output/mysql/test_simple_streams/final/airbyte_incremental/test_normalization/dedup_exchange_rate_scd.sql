@@ -1,10 +1,38 @@
 
+      
 
   create  table
-    test_normalization.`dedup_exchange_rate_scd__dbt_tmp`
+    test_normalization.`dedup_exchange_rate_scd`
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        id,
+        currency,
+        `date`,
+        timestamp_col,
+        `HKD@spéçiäl & characters`,
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from _airbyte_test_normalization.`dedup_exchange_rate_ab3`
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     currency,
@@ -14,6 +42,7 @@ select
     hkd_special___characters,
     nzd,
     usd,
+  md5(cast(concat(coalesce(cast(id as char), ''), '-', coalesce(cast(currency as char), ''), '-', coalesce(cast(nzd as char), '')) as char)) as _airbyte_unique_key,
   `date` as _airbyte_start_at,
   lag(`date`) over (
     partition by id, currency, cast(nzd as char)
@@ -25,7 +54,9 @@ select
   ) is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_dedup_exchange_rate_hashid
-from _airbyte_test_normalization.`dedup_exchange_rate_ab4`
+from dedup_data
 -- dedup_exchange_rate from test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_row_num = 1
   )
+
+  
\ No newline at end of file
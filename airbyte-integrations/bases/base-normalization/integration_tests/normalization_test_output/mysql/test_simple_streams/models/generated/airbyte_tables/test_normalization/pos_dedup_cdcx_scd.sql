@@ -1,24 +0,0 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
--- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
-select
-    id,
-    {{ adapter.quote('name') }},
-    _ab_cdc_lsn,
-    _ab_cdc_updated_at,
-    _ab_cdc_deleted_at,
-    _ab_cdc_log_pos,
-  _airbyte_emitted_at as _airbyte_start_at,
-  lag(_airbyte_emitted_at) over (
-    partition by id
-    order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc
-  ) as _airbyte_end_at,
-  case when lag(_airbyte_emitted_at) over (
-    partition by id
-    order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc, _ab_cdc_updated_at desc, _ab_cdc_log_pos desc
-  ) is null and _ab_cdc_deleted_at is null  then 1 else 0 end as _airbyte_active_row,
-  _airbyte_emitted_at,
-  _airbyte_pos_dedup_cdcx_hashid
-from {{ ref('pos_dedup_cdcx_ab4') }}
--- pos_dedup_cdcx from {{ source('test_normalization', '_airbyte_raw_pos_dedup_cdcx') }}
-where _airbyte_row_num = 1
-
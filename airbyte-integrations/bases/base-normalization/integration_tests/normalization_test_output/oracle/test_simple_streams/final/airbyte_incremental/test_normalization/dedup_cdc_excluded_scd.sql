@@ -1,10 +1,14 @@
 
+      
 
-  create  table test_normalization.dedup_cdc_excluded_scd__dbt_tmp
+  create  table test_normalization.dedup_cdc_excluded_scd
   
   as
     
-with dbt__cte__dedup_cdc_excluded_ab1__ as (
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+ dbt__cte__dedup_cdc_excluded_ab1__ as (
 
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
@@ -65,18 +69,29 @@ select
     tmp.*
 from dbt__cte__dedup_cdc_excluded_ab2__ tmp
 -- dedup_cdc_excluded
-),  dbt__cte__dedup_cdc_excluded_ab4__ as (
+),input_data as (
+    select
+        id,
+        name,
+        column___with__quotes,
+        "_AB_CDC_LSN",
+        "_AB_CDC_UPDATED_AT",
+        "_AB_CDC_DELETED_AT",
+        "_AIRBYTE_EMITTED_AT",
+        "_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID"
+    from dbt__cte__dedup_cdc_excluded_ab3__
+),
 
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by "_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID"
-    order by "_AIRBYTE_EMITTED_AT" asc
-  ) as "_AIRBYTE_ROW_NUM",
-  tmp.*
-from dbt__cte__dedup_cdc_excluded_ab3__ tmp
--- dedup_cdc_excluded from test_normalization.airbyte_raw_dedup_cdc_excluded
-)-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by "_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID"
+        order by "_AIRBYTE_EMITTED_AT" asc
+      ) as "_AIRBYTE_ROW_NUM",
+      input_data.*
+    from input_data
+)
 select
     id,
     name,
@@ -84,6 +99,11 @@ select
     "_AB_CDC_LSN",
     "_AB_CDC_UPDATED_AT",
     "_AB_CDC_DELETED_AT",
+  ora_hash(
+            
+                id
+            
+    ) as "_AIRBYTE_UNIQUE_KEY",
   "_AIRBYTE_EMITTED_AT" as "_AIRBYTE_START_AT",
   lag("_AIRBYTE_EMITTED_AT") over (
     partition by id
@@ -95,6 +115,7 @@ select
   ) is null and "_AB_CDC_DELETED_AT" is null  then 1 else 0 end as "_AIRBYTE_ACTIVE_ROW",
   "_AIRBYTE_EMITTED_AT",
   "_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID"
-from dbt__cte__dedup_cdc_excluded_ab4__
+from dedup_data
 -- dedup_cdc_excluded from test_normalization.airbyte_raw_dedup_cdc_excluded
-where "_AIRBYTE_ROW_NUM" = 1
\ No newline at end of file
+where "_AIRBYTE_ROW_NUM" = 1
+  
\ No newline at end of file
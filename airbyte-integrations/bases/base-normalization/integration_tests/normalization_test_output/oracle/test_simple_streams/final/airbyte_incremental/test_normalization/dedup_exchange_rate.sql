@@ -1,6 +1,7 @@
 
+      
 
-  create  table test_normalization.dedup_exchange_rate__dbt_tmp
+  create  table test_normalization.dedup_exchange_rate
   
   as
     
@@ -14,8 +15,11 @@ select
     hkd_special___characters_1,
     nzd,
     usd,
+    "_AIRBYTE_UNIQUE_KEY",
     "_AIRBYTE_EMITTED_AT",
     "_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID"
 from test_normalization.dedup_exchange_rate_scd
 -- dedup_exchange_rate from test_normalization.airbyte_raw_dedup_exchange_rate
-where "_AIRBYTE_ACTIVE_ROW" = 1
\ No newline at end of file
+where "_AIRBYTE_ACTIVE_ROW" = 1
+
+  
\ No newline at end of file
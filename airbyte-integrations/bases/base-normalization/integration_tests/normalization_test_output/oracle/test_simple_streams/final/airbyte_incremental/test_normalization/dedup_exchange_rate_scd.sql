@@ -1,10 +1,14 @@
 
+      
 
-  create  table test_normalization.dedup_exchange_rate_scd__dbt_tmp
+  create  table test_normalization.dedup_exchange_rate_scd
   
   as
     
-with dbt__cte__dedup_exchange_rate_ab1__ as (
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+ dbt__cte__dedup_exchange_rate_ab1__ as (
 
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
@@ -79,18 +83,31 @@ select
     tmp.*
 from dbt__cte__dedup_exchange_rate_ab2__ tmp
 -- dedup_exchange_rate
-),  dbt__cte__dedup_exchange_rate_ab4__ as (
+),input_data as (
+    select
+        id,
+        currency,
+        "DATE",
+        timestamp_col,
+        hkd_special___characters,
+        hkd_special___characters_1,
+        nzd,
+        usd,
+        "_AIRBYTE_EMITTED_AT",
+        "_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID"
+    from dbt__cte__dedup_exchange_rate_ab3__
+),
 
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by "_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID"
-    order by "_AIRBYTE_EMITTED_AT" asc
-  ) as "_AIRBYTE_ROW_NUM",
-  tmp.*
-from dbt__cte__dedup_exchange_rate_ab3__ tmp
--- dedup_exchange_rate from test_normalization.airbyte_raw_dedup_exchange_rate
-)-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by "_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID"
+        order by "_AIRBYTE_EMITTED_AT" asc
+      ) as "_AIRBYTE_ROW_NUM",
+      input_data.*
+    from input_data
+)
 select
     id,
     currency,
@@ -100,6 +117,17 @@ select
     hkd_special___characters_1,
     nzd,
     usd,
+  ora_hash(
+            
+                id || '~' ||
+            
+            
+                currency || '~' ||
+            
+            
+                nzd
+            
+    ) as "_AIRBYTE_UNIQUE_KEY",
   "DATE" as "_AIRBYTE_START_AT",
   lag("DATE") over (
     partition by id, currency, cast(nzd as varchar2(4000))
@@ -111,6 +139,7 @@ select
   ) is null  then 1 else 0 end as "_AIRBYTE_ACTIVE_ROW",
   "_AIRBYTE_EMITTED_AT",
   "_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID"
-from dbt__cte__dedup_exchange_rate_ab4__
+from dedup_data
 -- dedup_exchange_rate from test_normalization.airbyte_raw_dedup_exchange_rate
-where "_AIRBYTE_ROW_NUM" = 1
\ No newline at end of file
+where "_AIRBYTE_ROW_NUM" = 1
+  
\ No newline at end of file
@@ -1,10 +1,14 @@
 
+      
 
-  create  table test_normalization.pos_dedup_cdcx_scd__dbt_tmp
+  create  table test_normalization.pos_dedup_cdcx_scd
   
   as
     
-with dbt__cte__pos_dedup_cdcx_ab1__ as (
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+ dbt__cte__pos_dedup_cdcx_ab1__ as (
 
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
@@ -67,18 +71,29 @@ select
     tmp.*
 from dbt__cte__pos_dedup_cdcx_ab2__ tmp
 -- pos_dedup_cdcx
-),  dbt__cte__pos_dedup_cdcx_ab4__ as (
+),input_data as (
+    select
+        id,
+        name,
+        "_AB_CDC_LSN",
+        "_AB_CDC_UPDATED_AT",
+        "_AB_CDC_DELETED_AT",
+        "_AB_CDC_LOG_POS",
+        "_AIRBYTE_EMITTED_AT",
+        "_AIRBYTE_POS_DEDUP_CDCX_HASHID"
+    from dbt__cte__pos_dedup_cdcx_ab3__
+),
 
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by "_AIRBYTE_POS_DEDUP_CDCX_HASHID"
-    order by "_AIRBYTE_EMITTED_AT" asc
-  ) as "_AIRBYTE_ROW_NUM",
-  tmp.*
-from dbt__cte__pos_dedup_cdcx_ab3__ tmp
--- pos_dedup_cdcx from test_normalization.airbyte_raw_pos_dedup_cdcx
-)-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by "_AIRBYTE_POS_DEDUP_CDCX_HASHID"
+        order by "_AIRBYTE_EMITTED_AT" asc
+      ) as "_AIRBYTE_ROW_NUM",
+      input_data.*
+    from input_data
+)
 select
     id,
     name,
@@ -86,6 +101,11 @@ select
     "_AB_CDC_UPDATED_AT",
     "_AB_CDC_DELETED_AT",
     "_AB_CDC_LOG_POS",
+  ora_hash(
+            
+                id
+            
+    ) as "_AIRBYTE_UNIQUE_KEY",
   "_AIRBYTE_EMITTED_AT" as "_AIRBYTE_START_AT",
   lag("_AIRBYTE_EMITTED_AT") over (
     partition by id
@@ -97,6 +117,7 @@ select
   ) is null and "_AB_CDC_DELETED_AT" is null  then 1 else 0 end as "_AIRBYTE_ACTIVE_ROW",
   "_AIRBYTE_EMITTED_AT",
   "_AIRBYTE_POS_DEDUP_CDCX_HASHID"
-from dbt__cte__pos_dedup_cdcx_ab4__
+from dedup_data
 -- pos_dedup_cdcx from test_normalization.airbyte_raw_pos_dedup_cdcx
-where "_AIRBYTE_ROW_NUM" = 1
\ No newline at end of file
+where "_AIRBYTE_ROW_NUM" = 1
+  
\ No newline at end of file
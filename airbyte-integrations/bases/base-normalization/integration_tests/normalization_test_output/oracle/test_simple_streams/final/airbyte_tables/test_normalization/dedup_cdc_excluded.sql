@@ -12,6 +12,7 @@ select
     "_AB_CDC_LSN",
     "_AB_CDC_UPDATED_AT",
     "_AB_CDC_DELETED_AT",
+    "_AIRBYTE_UNIQUE_KEY",
     "_AIRBYTE_EMITTED_AT",
     "_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID"
 from test_normalization.dedup_cdc_excluded_scd
@@ -12,6 +12,7 @@ select
     "_AB_CDC_UPDATED_AT",
     "_AB_CDC_DELETED_AT",
     "_AB_CDC_LOG_POS",
+    "_AIRBYTE_UNIQUE_KEY",
     "_AIRBYTE_EMITTED_AT",
     "_AIRBYTE_POS_DEDUP_CDCX_HASHID"
 from test_normalization.pos_dedup_cdcx_scd
@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level"], unique_key=quote('_AIRBYTE_UNIQUE_KEY')) }}
 -- Final base SQL model
 select
     id,
@@ -9,9 +9,11 @@ select
     hkd_special___characters_1,
     nzd,
     usd,
+    {{ quote('_AIRBYTE_UNIQUE_KEY') }},
     {{ quote('_AIRBYTE_EMITTED_AT') }},
     {{ quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
 from {{ ref('dedup_exchange_rate_scd') }}
 -- dedup_exchange_rate from {{ source('test_normalization', 'airbyte_raw_dedup_exchange_rate') }}
 where "_AIRBYTE_ACTIVE_ROW" = 1
+{{ incremental_clause(quote('_AIRBYTE_EMITTED_AT')) }}
 
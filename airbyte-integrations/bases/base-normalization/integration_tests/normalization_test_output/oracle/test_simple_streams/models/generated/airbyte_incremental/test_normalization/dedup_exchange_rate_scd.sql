@@ -0,0 +1,92 @@
+{{ config(schema="test_normalization", tags=["top-level"], unique_key=quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID')) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        id,
+        currency,
+        {{ quote('DATE') }},
+        timestamp_col,
+        hkd_special___characters,
+        hkd_special___characters_1,
+        nzd,
+        usd,
+        {{ quote('_AIRBYTE_EMITTED_AT') }},
+        {{ quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
+    from {{ ref('dedup_exchange_rate_ab3') }}
+    where 1 = 1
+    {{ incremental_clause(quote('_AIRBYTE_EMITTED_AT')) }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        id,
+        currency,
+        {{ quote('DATE') }},
+        timestamp_col,
+        hkd_special___characters,
+        hkd_special___characters_1,
+        nzd,
+        usd,
+        {{ quote('_AIRBYTE_EMITTED_AT') }},
+        {{ quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
+    from {{ this }} this_data
+    where {{ quote('_AIRBYTE_UNIQUE_KEY') }} in (
+        select {{ dbt_utils.surrogate_key(['id', 'currency', 'nzd']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        id,
+        currency,
+        {{ quote('DATE') }},
+        timestamp_col,
+        hkd_special___characters,
+        hkd_special___characters_1,
+        nzd,
+        usd,
+        {{ quote('_AIRBYTE_EMITTED_AT') }},
+        {{ quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
+    from {{ ref('dedup_exchange_rate_ab3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by {{ quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
+        order by {{ quote('_AIRBYTE_EMITTED_AT') }} asc
+      ) as {{ quote('_AIRBYTE_ROW_NUM') }},
+      input_data.*
+    from input_data
+)
+select
+    id,
+    currency,
+    {{ quote('DATE') }},
+    timestamp_col,
+    hkd_special___characters,
+    hkd_special___characters_1,
+    nzd,
+    usd,
+  {{ dbt_utils.surrogate_key(['id', 'currency', 'nzd']) }} as {{ quote('_AIRBYTE_UNIQUE_KEY') }},
+  {{ quote('DATE') }} as {{ quote('_AIRBYTE_START_AT') }},
+  lag({{ quote('DATE') }}) over (
+    partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
+    order by {{ quote('DATE') }} asc nulls last, {{ quote('DATE') }} desc, {{ quote('_AIRBYTE_EMITTED_AT') }} desc
+  ) as {{ quote('_AIRBYTE_END_AT') }},
+  case when lag({{ quote('DATE') }}) over (
+    partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
+    order by {{ quote('DATE') }} asc nulls last, {{ quote('DATE') }} desc, {{ quote('_AIRBYTE_EMITTED_AT') }} desc
+  ) is null  then 1 else 0 end as {{ quote('_AIRBYTE_ACTIVE_ROW') }},
+  {{ quote('_AIRBYTE_EMITTED_AT') }},
+  {{ quote('_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
+from dedup_data
+-- dedup_exchange_rate from {{ source('test_normalization', 'airbyte_raw_dedup_exchange_rate') }}
+where {{ quote('_AIRBYTE_ROW_NUM') }} = 1
+
@@ -0,0 +1,84 @@
+{{ config(schema="test_normalization", tags=["top-level"], unique_key=quote('_AIRBYTE_POS_DEDUP_CDCX_HASHID')) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        id,
+        name,
+        {{ quote('_AB_CDC_LSN') }},
+        {{ quote('_AB_CDC_UPDATED_AT') }},
+        {{ quote('_AB_CDC_DELETED_AT') }},
+        {{ quote('_AB_CDC_LOG_POS') }},
+        {{ quote('_AIRBYTE_EMITTED_AT') }},
+        {{ quote('_AIRBYTE_POS_DEDUP_CDCX_HASHID') }}
+    from {{ ref('pos_dedup_cdcx_ab3') }}
+    where 1 = 1
+    {{ incremental_clause(quote('_AIRBYTE_EMITTED_AT')) }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        id,
+        name,
+        {{ quote('_AB_CDC_LSN') }},
+        {{ quote('_AB_CDC_UPDATED_AT') }},
+        {{ quote('_AB_CDC_DELETED_AT') }},
+        {{ quote('_AB_CDC_LOG_POS') }},
+        {{ quote('_AIRBYTE_EMITTED_AT') }},
+        {{ quote('_AIRBYTE_POS_DEDUP_CDCX_HASHID') }}
+    from {{ this }} this_data
+    where {{ quote('_AIRBYTE_UNIQUE_KEY') }} in (
+        select {{ dbt_utils.surrogate_key(['id']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        id,
+        name,
+        {{ quote('_AB_CDC_LSN') }},
+        {{ quote('_AB_CDC_UPDATED_AT') }},
+        {{ quote('_AB_CDC_DELETED_AT') }},
+        {{ quote('_AB_CDC_LOG_POS') }},
+        {{ quote('_AIRBYTE_EMITTED_AT') }},
+        {{ quote('_AIRBYTE_POS_DEDUP_CDCX_HASHID') }}
+    from {{ ref('pos_dedup_cdcx_ab3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by {{ quote('_AIRBYTE_POS_DEDUP_CDCX_HASHID') }}
+        order by {{ quote('_AIRBYTE_EMITTED_AT') }} asc
+      ) as {{ quote('_AIRBYTE_ROW_NUM') }},
+      input_data.*
+    from input_data
+)
+select
+    id,
+    name,
+    {{ quote('_AB_CDC_LSN') }},
+    {{ quote('_AB_CDC_UPDATED_AT') }},
+    {{ quote('_AB_CDC_DELETED_AT') }},
+    {{ quote('_AB_CDC_LOG_POS') }},
+  {{ dbt_utils.surrogate_key(['id']) }} as {{ quote('_AIRBYTE_UNIQUE_KEY') }},
+  {{ quote('_AIRBYTE_EMITTED_AT') }} as {{ quote('_AIRBYTE_START_AT') }},
+  lag({{ quote('_AIRBYTE_EMITTED_AT') }}) over (
+    partition by id
+    order by {{ quote('_AIRBYTE_EMITTED_AT') }} asc nulls last, {{ quote('_AIRBYTE_EMITTED_AT') }} desc, {{ quote('_AIRBYTE_EMITTED_AT') }} desc
+  ) as {{ quote('_AIRBYTE_END_AT') }},
+  case when lag({{ quote('_AIRBYTE_EMITTED_AT') }}) over (
+    partition by id
+    order by {{ quote('_AIRBYTE_EMITTED_AT') }} asc nulls last, {{ quote('_AIRBYTE_EMITTED_AT') }} desc, {{ quote('_AIRBYTE_EMITTED_AT') }} desc, {{ quote('_AB_CDC_UPDATED_AT') }} desc, {{ quote('_AB_CDC_LOG_POS') }} desc
+  ) is null and {{ quote('_AB_CDC_DELETED_AT') }} is null  then 1 else 0 end as {{ quote('_AIRBYTE_ACTIVE_ROW') }},
+  {{ quote('_AIRBYTE_EMITTED_AT') }},
+  {{ quote('_AIRBYTE_POS_DEDUP_CDCX_HASHID') }}
+from dedup_data
+-- pos_dedup_cdcx from {{ source('test_normalization', 'airbyte_raw_pos_dedup_cdcx') }}
+where {{ quote('_AIRBYTE_ROW_NUM') }} = 1
+
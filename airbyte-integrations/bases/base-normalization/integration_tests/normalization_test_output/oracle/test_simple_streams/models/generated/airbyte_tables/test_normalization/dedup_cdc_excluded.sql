@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level"], unique_key=quote('_AIRBYTE_UNIQUE_KEY')) }}
 -- Final base SQL model
 select
     id,
@@ -7,6 +7,7 @@ select
     {{ quote('_AB_CDC_LSN') }},
     {{ quote('_AB_CDC_UPDATED_AT') }},
     {{ quote('_AB_CDC_DELETED_AT') }},
+    {{ quote('_AIRBYTE_UNIQUE_KEY') }},
     {{ quote('_AIRBYTE_EMITTED_AT') }},
     {{ quote('_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID') }}
 from {{ ref('dedup_cdc_excluded_scd') }}
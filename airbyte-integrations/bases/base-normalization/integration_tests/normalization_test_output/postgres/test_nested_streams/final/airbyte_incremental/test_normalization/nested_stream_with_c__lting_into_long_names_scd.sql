@@ -1,13 +1,41 @@
 
+      
 
-  create  table "postgres".test_normalization."nested_stream_with_c__lting_into_long_names_scd__dbt_tmp"
+  create  table "postgres".test_normalization."nested_stream_with_c__lting_into_long_names_scd"
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        "id",
+        "date",
+        "partition",
+        _airbyte_emitted_at,
+        _airbyte_nested_stre__nto_long_names_hashid
+    from "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab3"
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_nested_stre__nto_long_names_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     "id",
     "date",
     "partition",
+  md5(cast(coalesce(cast("id" as 
+    varchar
+), '') as 
+    varchar
+)) as _airbyte_unique_key,
   "date" as _airbyte_start_at,
   lag("date") over (
     partition by "id"
@@ -19,7 +47,8 @@ select
   ) is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_nested_stre__nto_long_names_hashid
-from "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4"
+from dedup_data
 -- nested_stream_with_c__lting_into_long_names from "postgres".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names
 where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
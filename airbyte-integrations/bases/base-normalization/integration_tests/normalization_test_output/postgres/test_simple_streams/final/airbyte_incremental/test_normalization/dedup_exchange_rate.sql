@@ -1,6 +1,7 @@
 
+      
 
-  create  table "postgres".test_normalization."dedup_exchange_rate__dbt_tmp"
+  create  table "postgres".test_normalization."dedup_exchange_rate"
   as (
     
 -- Final base SQL model
@@ -13,9 +14,12 @@ select
     hkd_special___characters,
     nzd,
     usd,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from "postgres".test_normalization."dedup_exchange_rate_scd"
 -- dedup_exchange_rate from "postgres".test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_active_row = 1
-  );
\ No newline at end of file
+
+  );
+  
\ No newline at end of file
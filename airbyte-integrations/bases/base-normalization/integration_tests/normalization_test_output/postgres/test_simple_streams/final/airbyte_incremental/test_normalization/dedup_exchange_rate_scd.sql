@@ -1,9 +1,37 @@
 
+      
 
-  create  table "postgres".test_normalization."dedup_exchange_rate_scd__dbt_tmp"
+  create  table "postgres".test_normalization."dedup_exchange_rate_scd"
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        "id",
+        currency,
+        "date",
+        timestamp_col,
+        "HKD@spéçiäl & characters",
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from "postgres"._airbyte_test_normalization."dedup_exchange_rate_ab3"
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     "id",
     currency,
@@ -13,6 +41,15 @@ select
     hkd_special___characters,
     nzd,
     usd,
+  md5(cast(coalesce(cast("id" as 
+    varchar
+), '') || '-' || coalesce(cast(currency as 
+    varchar
+), '') || '-' || coalesce(cast(nzd as 
+    varchar
+), '') as 
+    varchar
+)) as _airbyte_unique_key,
   "date" as _airbyte_start_at,
   lag("date") over (
     partition by "id", currency, cast(nzd as 
@@ -28,7 +65,8 @@ select
   ) is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_dedup_exchange_rate_hashid
-from "postgres"._airbyte_test_normalization."dedup_exchange_rate_ab4"
+from dedup_data
 -- dedup_exchange_rate from "postgres".test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
@@ -1,12 +1,16 @@
 
+      
 
   create  table
-    "integrationtests".test_normalization."nested_stream_with_complex_columns_resulting_into_long_names_scd__dbt_tmp"
+    "integrationtests".test_normalization."nested_stream_with_complex_columns_resulting_into_long_names_scd"
     
     
   as (
     
-with __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab1 as (
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+ __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab1 as (
 
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
@@ -36,22 +40,31 @@ select
     tmp.*
 from __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab2 tmp
 -- nested_stream_with_complex_columns_resulting_into_long_names
-),  __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab4 as (
+),input_data as (
+    select
+        id,
+        date,
+        "partition",
+        _airbyte_emitted_at,
+        _airbyte_nested_stream_with_complex_columns_resulting_into_long_names_hashid
+    from __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab3
+),
 
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by _airbyte_nested_stream_with_complex_columns_resulting_into_long_names_hashid
-    order by _airbyte_emitted_at asc
-  ) as _airbyte_row_num,
-  tmp.*
-from __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab3 tmp
--- nested_stream_with_complex_columns_resulting_into_long_names from "integrationtests".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names
-)-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_nested_stream_with_complex_columns_resulting_into_long_names_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     date,
     "partition",
+  md5(cast(coalesce(cast(id as varchar), '') as varchar)) as _airbyte_unique_key,
   date as _airbyte_start_at,
   lag(date) over (
     partition by id
@@ -63,7 +76,8 @@ select
   ) is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_nested_stream_with_complex_columns_resulting_into_long_names_hashid
-from __dbt__cte__nested_stream_with_complex_columns_resulting_into_long_names_ab4
+from dedup_data
 -- nested_stream_with_complex_columns_resulting_into_long_names from "integrationtests".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names
 where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
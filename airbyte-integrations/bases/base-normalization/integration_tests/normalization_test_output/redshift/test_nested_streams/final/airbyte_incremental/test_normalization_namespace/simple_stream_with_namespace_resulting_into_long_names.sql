@@ -1,7 +1,8 @@
 
+      
 
   create  table
-    "integrationtests".test_normalization_namespace."simple_stream_with_namespace_resulting_into_long_names__dbt_tmp"
+    "integrationtests".test_normalization_namespace."simple_stream_with_namespace_resulting_into_long_names"
     
     
   as (
@@ -40,4 +41,7 @@ select
     _airbyte_simple_stream_with_namespace_resulting_into_long_names_hashid
 from __dbt__cte__simple_stream_with_namespace_resulting_into_long_names_ab3
 -- simple_stream_with_namespace_resulting_into_long_names from "integrationtests".test_normalization_namespace._airbyte_raw_simple_stream_with_namespace_resulting_into_long_names
-  );
\ No newline at end of file
+where 1 = 1
+
+  );
+  
\ No newline at end of file
@@ -1,12 +1,16 @@
 
+      
 
   create  table
-    "integrationtests".test_normalization."dedup_cdc_excluded_scd__dbt_tmp"
+    "integrationtests".test_normalization."dedup_cdc_excluded_scd"
     
     
   as (
     
-with __dbt__cte__dedup_cdc_excluded_ab1 as (
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+ __dbt__cte__dedup_cdc_excluded_ab1 as (
 
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
@@ -48,18 +52,29 @@ select
     tmp.*
 from __dbt__cte__dedup_cdc_excluded_ab2 tmp
 -- dedup_cdc_excluded
-),  __dbt__cte__dedup_cdc_excluded_ab4 as (
+),input_data as (
+    select
+        id,
+        name,
+        "column`_'with""_quotes",
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from __dbt__cte__dedup_cdc_excluded_ab3
+),
 
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by _airbyte_dedup_cdc_excluded_hashid
-    order by _airbyte_emitted_at asc
-  ) as _airbyte_row_num,
-  tmp.*
-from __dbt__cte__dedup_cdc_excluded_ab3 tmp
--- dedup_cdc_excluded from "integrationtests".test_normalization._airbyte_raw_dedup_cdc_excluded
-)-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_cdc_excluded_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     name,
@@ -67,6 +82,7 @@ select
     _ab_cdc_lsn,
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
+  md5(cast(coalesce(cast(id as varchar), '') as varchar)) as _airbyte_unique_key,
   _airbyte_emitted_at as _airbyte_start_at,
   lag(_airbyte_emitted_at) over (
     partition by id
@@ -78,7 +94,8 @@ select
   ) is null and _ab_cdc_deleted_at is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_dedup_cdc_excluded_hashid
-from __dbt__cte__dedup_cdc_excluded_ab4
+from dedup_data
 -- dedup_cdc_excluded from "integrationtests".test_normalization._airbyte_raw_dedup_cdc_excluded
 where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
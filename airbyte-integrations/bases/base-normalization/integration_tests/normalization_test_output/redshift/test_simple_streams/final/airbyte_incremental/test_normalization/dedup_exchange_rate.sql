@@ -1,7 +1,8 @@
 
+      
 
   create  table
-    "integrationtests".test_normalization."dedup_exchange_rate__dbt_tmp"
+    "integrationtests".test_normalization."dedup_exchange_rate"
     
     
   as (
@@ -16,9 +17,12 @@ select
     hkd_special___characters,
     nzd,
     usd,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from "integrationtests".test_normalization."dedup_exchange_rate_scd"
 -- dedup_exchange_rate from "integrationtests".test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_active_row = 1
-  );
\ No newline at end of file
+
+  );
+  
\ No newline at end of file
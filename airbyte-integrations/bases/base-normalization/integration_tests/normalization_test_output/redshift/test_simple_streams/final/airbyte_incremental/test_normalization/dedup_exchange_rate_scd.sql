@@ -1,12 +1,16 @@
 
+      
 
   create  table
-    "integrationtests".test_normalization."dedup_exchange_rate_scd__dbt_tmp"
+    "integrationtests".test_normalization."dedup_exchange_rate_scd"
     
     
   as (
     
-with __dbt__cte__dedup_exchange_rate_ab1 as (
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+ __dbt__cte__dedup_exchange_rate_ab1 as (
 
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
@@ -56,18 +60,31 @@ select
     tmp.*
 from __dbt__cte__dedup_exchange_rate_ab2 tmp
 -- dedup_exchange_rate
-),  __dbt__cte__dedup_exchange_rate_ab4 as (
+),input_data as (
+    select
+        id,
+        currency,
+        date,
+        timestamp_col,
+        "hkd@spéçiäl & characters",
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from __dbt__cte__dedup_exchange_rate_ab3
+),
 
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by _airbyte_dedup_exchange_rate_hashid
-    order by _airbyte_emitted_at asc
-  ) as _airbyte_row_num,
-  tmp.*
-from __dbt__cte__dedup_exchange_rate_ab3 tmp
--- dedup_exchange_rate from "integrationtests".test_normalization._airbyte_raw_dedup_exchange_rate
-)-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num,
+      input_data.*
+    from input_data
+)
 select
     id,
     currency,
@@ -77,6 +94,7 @@ select
     hkd_special___characters,
     nzd,
     usd,
+  md5(cast(coalesce(cast(id as varchar), '') || '-' || coalesce(cast(currency as varchar), '') || '-' || coalesce(cast(nzd as varchar), '') as varchar)) as _airbyte_unique_key,
   date as _airbyte_start_at,
   lag(date) over (
     partition by id, currency, cast(nzd as varchar)
@@ -88,7 +106,8 @@ select
   ) is null  then 1 else 0 end as _airbyte_active_row,
   _airbyte_emitted_at,
   _airbyte_dedup_exchange_rate_hashid
-from __dbt__cte__dedup_exchange_rate_ab4
+from dedup_data
 -- dedup_exchange_rate from "integrationtests".test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
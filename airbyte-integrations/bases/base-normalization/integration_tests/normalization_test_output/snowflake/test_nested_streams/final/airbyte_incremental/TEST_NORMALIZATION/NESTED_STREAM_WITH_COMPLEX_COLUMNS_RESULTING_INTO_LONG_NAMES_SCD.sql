@@ -3,10 +3,37 @@
       create or replace transient table "AIRBYTE_DATABASE".TEST_NORMALIZATION."NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_SCD"  as
       (
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        ID,
+        DATE,
+        PARTITION,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+    from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_AB3"
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
 select
     ID,
     DATE,
     PARTITION,
+  md5(cast(coalesce(cast(ID as 
+    varchar
+), '') as 
+    varchar
+)) as _AIRBYTE_UNIQUE_KEY,
   DATE as _AIRBYTE_START_AT,
   lag(DATE) over (
     partition by ID
@@ -18,8 +45,8 @@ select
   ) is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
   _AIRBYTE_EMITTED_AT,
   _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
-from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_AB4"
+from dedup_data
 -- NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES from "AIRBYTE_DATABASE".TEST_NORMALIZATION._AIRBYTE_RAW_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES
-where _airbyte_row_num = 1
+where _AIRBYTE_ROW_NUM = 1
       );
     
\ No newline at end of file
@@ -0,0 +1,72 @@
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level"], unique_key='_AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        ID,
+        DATE,
+        PARTITION,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+    from {{ ref('NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_AB3') }}
+    where 1 = 1
+    {{ incremental_clause('_AIRBYTE_EMITTED_AT') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        ID,
+        DATE,
+        PARTITION,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+    from {{ this }} this_data
+    where _AIRBYTE_UNIQUE_KEY in (
+        select {{ dbt_utils.surrogate_key(['ID']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        ID,
+        DATE,
+        PARTITION,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+    from {{ ref('NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_AB3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
+select
+    ID,
+    DATE,
+    PARTITION,
+  {{ dbt_utils.surrogate_key(['ID']) }} as _AIRBYTE_UNIQUE_KEY,
+  DATE as _AIRBYTE_START_AT,
+  lag(DATE) over (
+    partition by ID
+    order by DATE is null asc, DATE desc, _AIRBYTE_EMITTED_AT desc
+  ) as _AIRBYTE_END_AT,
+  case when lag(DATE) over (
+    partition by ID
+    order by DATE is null asc, DATE desc, _AIRBYTE_EMITTED_AT desc
+  ) is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
+  _AIRBYTE_EMITTED_AT,
+  _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID
+from dedup_data
+-- NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES') }}
+where _AIRBYTE_ROW_NUM = 1
+
@@ -1,13 +0,0 @@
-
-  create or replace  view "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."DEDUP_CDC_EXCLUDED_AB4"  as (
-    
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
-    order by _AIRBYTE_EMITTED_AT asc
-  ) as _AIRBYTE_ROW_NUM,
-  tmp.*
-from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."DEDUP_CDC_EXCLUDED_AB3" tmp
--- DEDUP_CDC_EXCLUDED from "AIRBYTE_DATABASE".TEST_NORMALIZATION._AIRBYTE_RAW_DEDUP_CDC_EXCLUDED
-  );
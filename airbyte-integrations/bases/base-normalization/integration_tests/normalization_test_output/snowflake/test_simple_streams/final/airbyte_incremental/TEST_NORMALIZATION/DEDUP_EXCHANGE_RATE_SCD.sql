@@ -3,6 +3,33 @@
       create or replace transient table "AIRBYTE_DATABASE".TEST_NORMALIZATION."DEDUP_EXCHANGE_RATE_SCD"  as
       (
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        ID,
+        CURRENCY,
+        DATE,
+        TIMESTAMP_COL,
+        "HKD@spéçiäl & characters",
+        HKD_SPECIAL___CHARACTERS,
+        NZD,
+        USD,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."DEDUP_EXCHANGE_RATE_AB3"
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
 select
     ID,
     CURRENCY,
@@ -12,6 +39,15 @@ select
     HKD_SPECIAL___CHARACTERS,
     NZD,
     USD,
+  md5(cast(coalesce(cast(ID as 
+    varchar
+), '') || '-' || coalesce(cast(CURRENCY as 
+    varchar
+), '') || '-' || coalesce(cast(NZD as 
+    varchar
+), '') as 
+    varchar
+)) as _AIRBYTE_UNIQUE_KEY,
   DATE as _AIRBYTE_START_AT,
   lag(DATE) over (
     partition by ID, CURRENCY, cast(NZD as 
@@ -27,8 +63,8 @@ select
   ) is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
   _AIRBYTE_EMITTED_AT,
   _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
-from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."DEDUP_EXCHANGE_RATE_AB4"
+from dedup_data
 -- DEDUP_EXCHANGE_RATE from "AIRBYTE_DATABASE".TEST_NORMALIZATION._AIRBYTE_RAW_DEDUP_EXCHANGE_RATE
-where _airbyte_row_num = 1
+where _AIRBYTE_ROW_NUM = 1
       );
     
\ No newline at end of file
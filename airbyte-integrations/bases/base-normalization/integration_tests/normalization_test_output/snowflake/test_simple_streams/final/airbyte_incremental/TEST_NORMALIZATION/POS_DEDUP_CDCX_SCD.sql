@@ -3,6 +3,31 @@
       create or replace transient table "AIRBYTE_DATABASE".TEST_NORMALIZATION."POS_DEDUP_CDCX_SCD"  as
       (
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+
+input_data as (
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AB_CDC_LOG_POS,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_POS_DEDUP_CDCX_HASHID
+    from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."POS_DEDUP_CDCX_AB3"
+),
+
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_POS_DEDUP_CDCX_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
 select
     ID,
     NAME,
@@ -10,6 +35,11 @@ select
     _AB_CDC_UPDATED_AT,
     _AB_CDC_DELETED_AT,
     _AB_CDC_LOG_POS,
+  md5(cast(coalesce(cast(ID as 
+    varchar
+), '') as 
+    varchar
+)) as _AIRBYTE_UNIQUE_KEY,
   _AIRBYTE_EMITTED_AT as _AIRBYTE_START_AT,
   lag(_AIRBYTE_EMITTED_AT) over (
     partition by ID
@@ -21,8 +51,8 @@ select
   ) is null and _AB_CDC_DELETED_AT is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
   _AIRBYTE_EMITTED_AT,
   _AIRBYTE_POS_DEDUP_CDCX_HASHID
-from "AIRBYTE_DATABASE"._AIRBYTE_TEST_NORMALIZATION."POS_DEDUP_CDCX_AB4"
+from dedup_data
 -- POS_DEDUP_CDCX from "AIRBYTE_DATABASE".TEST_NORMALIZATION._AIRBYTE_RAW_POS_DEDUP_CDCX
-where _airbyte_row_num = 1
+where _AIRBYTE_ROW_NUM = 1
       );
     
\ No newline at end of file
@@ -10,6 +10,7 @@ select
     _AB_CDC_LSN,
     _AB_CDC_UPDATED_AT,
     _AB_CDC_DELETED_AT,
+    _AIRBYTE_UNIQUE_KEY,
     _AIRBYTE_EMITTED_AT,
     _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
 from "AIRBYTE_DATABASE".TEST_NORMALIZATION."DEDUP_CDC_EXCLUDED_SCD"
@@ -10,6 +10,7 @@ select
     _AB_CDC_UPDATED_AT,
     _AB_CDC_DELETED_AT,
     _AB_CDC_LOG_POS,
+    _AIRBYTE_UNIQUE_KEY,
     _AIRBYTE_EMITTED_AT,
     _AIRBYTE_POS_DEDUP_CDCX_HASHID
 from "AIRBYTE_DATABASE".TEST_NORMALIZATION."POS_DEDUP_CDCX_SCD"
@@ -0,0 +1,84 @@
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level"], unique_key='_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        ID,
+        NAME,
+        {{ adapter.quote('column`_\'with""_quotes') }},
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from {{ ref('DEDUP_CDC_EXCLUDED_AB3') }}
+    where 1 = 1
+    {{ incremental_clause('_AIRBYTE_EMITTED_AT') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        ID,
+        NAME,
+        {{ adapter.quote('column`_\'with""_quotes') }},
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from {{ this }} this_data
+    where _AIRBYTE_UNIQUE_KEY in (
+        select {{ dbt_utils.surrogate_key(['ID']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        ID,
+        NAME,
+        {{ adapter.quote('column`_\'with""_quotes') }},
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from {{ ref('DEDUP_CDC_EXCLUDED_AB3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
+select
+    ID,
+    NAME,
+    {{ adapter.quote('column`_\'with""_quotes') }},
+    _AB_CDC_LSN,
+    _AB_CDC_UPDATED_AT,
+    _AB_CDC_DELETED_AT,
+  {{ dbt_utils.surrogate_key(['ID']) }} as _AIRBYTE_UNIQUE_KEY,
+  _AIRBYTE_EMITTED_AT as _AIRBYTE_START_AT,
+  lag(_AIRBYTE_EMITTED_AT) over (
+    partition by ID
+    order by _AIRBYTE_EMITTED_AT is null asc, _AIRBYTE_EMITTED_AT desc, _AIRBYTE_EMITTED_AT desc
+  ) as _AIRBYTE_END_AT,
+  case when lag(_AIRBYTE_EMITTED_AT) over (
+    partition by ID
+    order by _AIRBYTE_EMITTED_AT is null asc, _AIRBYTE_EMITTED_AT desc, _AIRBYTE_EMITTED_AT desc, _AB_CDC_UPDATED_AT desc
+  ) is null and _AB_CDC_DELETED_AT is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
+  _AIRBYTE_EMITTED_AT,
+  _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+from dedup_data
+-- DEDUP_CDC_EXCLUDED from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_CDC_EXCLUDED') }}
+where _AIRBYTE_ROW_NUM = 1
+
@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level"], unique_key='_AIRBYTE_UNIQUE_KEY') }}
 -- Final base SQL model
 select
     ID,
@@ -9,9 +9,11 @@ select
     HKD_SPECIAL___CHARACTERS,
     NZD,
     USD,
+    _AIRBYTE_UNIQUE_KEY,
     _AIRBYTE_EMITTED_AT,
     _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
 from {{ ref('DEDUP_EXCHANGE_RATE_SCD') }}
 -- DEDUP_EXCHANGE_RATE from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }}
 where _airbyte_active_row = 1
+{{ incremental_clause('_AIRBYTE_EMITTED_AT') }}
 
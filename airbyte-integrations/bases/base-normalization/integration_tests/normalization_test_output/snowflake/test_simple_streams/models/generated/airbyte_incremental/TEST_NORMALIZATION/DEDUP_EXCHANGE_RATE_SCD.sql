@@ -0,0 +1,92 @@
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level"], unique_key='_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        ID,
+        CURRENCY,
+        DATE,
+        TIMESTAMP_COL,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        HKD_SPECIAL___CHARACTERS,
+        NZD,
+        USD,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    from {{ ref('DEDUP_EXCHANGE_RATE_AB3') }}
+    where 1 = 1
+    {{ incremental_clause('_AIRBYTE_EMITTED_AT') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        ID,
+        CURRENCY,
+        DATE,
+        TIMESTAMP_COL,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        HKD_SPECIAL___CHARACTERS,
+        NZD,
+        USD,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    from {{ this }} this_data
+    where _AIRBYTE_UNIQUE_KEY in (
+        select {{ dbt_utils.surrogate_key(['ID', 'CURRENCY', 'NZD']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        ID,
+        CURRENCY,
+        DATE,
+        TIMESTAMP_COL,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        HKD_SPECIAL___CHARACTERS,
+        NZD,
+        USD,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    from {{ ref('DEDUP_EXCHANGE_RATE_AB3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
+select
+    ID,
+    CURRENCY,
+    DATE,
+    TIMESTAMP_COL,
+    {{ adapter.quote('HKD@spéçiäl & characters') }},
+    HKD_SPECIAL___CHARACTERS,
+    NZD,
+    USD,
+  {{ dbt_utils.surrogate_key(['ID', 'CURRENCY', 'NZD']) }} as _AIRBYTE_UNIQUE_KEY,
+  DATE as _AIRBYTE_START_AT,
+  lag(DATE) over (
+    partition by ID, CURRENCY, cast(NZD as {{ dbt_utils.type_string() }})
+    order by DATE is null asc, DATE desc, _AIRBYTE_EMITTED_AT desc
+  ) as _AIRBYTE_END_AT,
+  case when lag(DATE) over (
+    partition by ID, CURRENCY, cast(NZD as {{ dbt_utils.type_string() }})
+    order by DATE is null asc, DATE desc, _AIRBYTE_EMITTED_AT desc
+  ) is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
+  _AIRBYTE_EMITTED_AT,
+  _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+from dedup_data
+-- DEDUP_EXCHANGE_RATE from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }}
+where _AIRBYTE_ROW_NUM = 1
+
@@ -0,0 +1,84 @@
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level"], unique_key='_AIRBYTE_POS_DEDUP_CDCX_HASHID') }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{% if is_incremental() %}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AB_CDC_LOG_POS,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_POS_DEDUP_CDCX_HASHID
+    from {{ ref('POS_DEDUP_CDCX_AB3') }}
+    where 1 = 1
+    {{ incremental_clause('_AIRBYTE_EMITTED_AT') }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AB_CDC_LOG_POS,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_POS_DEDUP_CDCX_HASHID
+    from {{ this }} this_data
+    where _AIRBYTE_UNIQUE_KEY in (
+        select {{ dbt_utils.surrogate_key(['ID']) }} from new_data
+    )
+),
+{% else %}
+input_data as (
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _AB_CDC_LOG_POS,
+        _AIRBYTE_EMITTED_AT,
+        _AIRBYTE_POS_DEDUP_CDCX_HASHID
+    from {{ ref('POS_DEDUP_CDCX_AB3') }}
+),
+{% endif %}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by _AIRBYTE_POS_DEDUP_CDCX_HASHID
+        order by _AIRBYTE_EMITTED_AT asc
+      ) as _AIRBYTE_ROW_NUM,
+      input_data.*
+    from input_data
+)
+select
+    ID,
+    NAME,
+    _AB_CDC_LSN,
+    _AB_CDC_UPDATED_AT,
+    _AB_CDC_DELETED_AT,
+    _AB_CDC_LOG_POS,
+  {{ dbt_utils.surrogate_key(['ID']) }} as _AIRBYTE_UNIQUE_KEY,
+  _AIRBYTE_EMITTED_AT as _AIRBYTE_START_AT,
+  lag(_AIRBYTE_EMITTED_AT) over (
+    partition by ID
+    order by _AIRBYTE_EMITTED_AT is null asc, _AIRBYTE_EMITTED_AT desc, _AIRBYTE_EMITTED_AT desc
+  ) as _AIRBYTE_END_AT,
+  case when lag(_AIRBYTE_EMITTED_AT) over (
+    partition by ID
+    order by _AIRBYTE_EMITTED_AT is null asc, _AIRBYTE_EMITTED_AT desc, _AIRBYTE_EMITTED_AT desc, _AB_CDC_UPDATED_AT desc, _AB_CDC_LOG_POS desc
+  ) is null and _AB_CDC_DELETED_AT is null  then 1 else 0 end as _AIRBYTE_ACTIVE_ROW,
+  _AIRBYTE_EMITTED_AT,
+  _AIRBYTE_POS_DEDUP_CDCX_HASHID
+from dedup_data
+-- POS_DEDUP_CDCX from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_POS_DEDUP_CDCX') }}
+where _AIRBYTE_ROW_NUM = 1
+
@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level"], unique_key='_AIRBYTE_UNIQUE_KEY') }}
 -- Final base SQL model
 select
     ID,
@@ -7,6 +7,7 @@ select
     _AB_CDC_UPDATED_AT,
     _AB_CDC_DELETED_AT,
     _AB_CDC_LOG_POS,
+    _AIRBYTE_UNIQUE_KEY,
     _AIRBYTE_EMITTED_AT,
     _AIRBYTE_POS_DEDUP_CDCX_HASHID
 from {{ ref('POS_DEDUP_CDCX_SCD') }}
@@ -9,7 +9,7 @@ import re
 import shutil
 import tempfile
 from distutils.dir_util import copy_tree
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 from integration_tests.dbt_integration_test import DbtIntegrationTest
@@ -100,6 +100,25 @@ def run_test_normalization(destination_type: DestinationType, test_resource_name
     dbt_test_utils.dbt_run(destination_type, test_root_dir)
     dbt_test(destination_type, test_root_dir)
     check_outputs(destination_type, test_resource_name, test_root_dir)
+    if os.path.exists(os.path.join("resources", test_resource_name, "data_input", "messages_incremental.txt")):
+        run_incremental_normalization(destination_type, test_resource_name, test_root_dir)
+
+
+def run_incremental_normalization(destination_type: DestinationType, test_resource_name: str, test_root_dir: str):
+    """
+    Sync the records of messages_incremental.txt on top of the first sync and run dbt again, so the incremental models only
+    process the new raw records this time and merge them into the tables built by the first run.
+    """
+    assert setup_incremental_raw_data(destination_type.value, test_resource_name, test_root_dir)
+    copy_test_files(
+        os.path.join("resources", test_resource_name, "dbt_data_tests_tmp_incremental"),
+        os.path.join(test_root_dir, "models/dbt_data_tests_tmp"),
+        destination_type,
+        os.path.join("resources", test_resource_name, "data_input", "replace_identifiers.json"),
+    )
+    # the SQL compiled by the incremental run names temporary tables after the current time, it is kept out of the versioned outputs
+    dbt_test_utils.dbt_run(destination_type, test_root_dir, output_dir=os.path.join("build", "incremental"))
+    dbt_test(destination_type, test_root_dir)
 
 
 def setup_test_dir(integration_type: str, test_resource_name: str) -> str:
@@ -166,7 +185,24 @@ def setup_input_raw_data(integration_type: str, test_resource_name: str, test_ro
     config_file = os.path.join(test_root_dir, "destination_config.json")
     with open(config_file, "w") as f:
         f.write(json.dumps(destination_config))
-    commands = [
+    commands = destination_write_command(integration_type, test_root_dir)
+    # Force a reset in destination raw tables
+    assert dbt_test_utils.run_destination_process("", test_root_dir, commands + ["/data/reset_catalog.json"])
+    # Run a sync to create raw tables in destinations
+    return dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
+
+
+def setup_incremental_raw_data(integration_type: str, test_resource_name: str, test_root_dir: str) -> bool:
+    """
+    Run a second sync with the messages_incremental.txt file of the test case, without resetting the raw tables first.
+    """
+    message_file = os.path.join("resources", test_resource_name, "data_input", "messages_incremental.txt")
+    commands = destination_write_command(integration_type, test_root_dir)
+    return dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
+
+
+def destination_write_command(integration_type: str, test_root_dir: str) -> List[str]:
+    return [
         "docker",
         "run",
         "--rm",
@@ -182,10 +218,6 @@ def setup_input_raw_data(integration_type: str, test_resource_name: str, test_ro
         "/data/destination_config.json",
         "--catalog",
     ]
-    # Force a reset in destination raw tables
-    assert dbt_test_utils.run_destination_process("", test_root_dir, commands + ["/data/reset_catalog.json"])
-    # Run a sync to create raw tables in destinations
-    return dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
 
 
 def generate_dbt_models(destination_type: DestinationType, test_resource_name: str, test_root_dir: str):
@@ -6,7 +6,8 @@
 import json
 import os
 import re
-from typing import Any, Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
 import yaml
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode, SyncMode
@@ -25,21 +26,26 @@ class CatalogProcessor:
     targeted destination schema.
 
     This is relying on a StreamProcessor to handle the conversion of a stream to a table one at a time.
+    Top-level streams (and their nested streams) are independent of each other once table names are resolved,
+    so they are processed in parallel by a pool of worker processes.
     """
 
-    def __init__(self, output_directory: str, destination_type: DestinationType):
+    def __init__(self, output_directory: str, destination_type: DestinationType, max_workers: Optional[int] = None):
         """
         @param output_directory is the path to the directory where this processor should write the resulting SQL files (DBT models)
         @param destination_type is the destination type of warehouse
+        @param max_workers is the number of processes used to generate models, defaults to the number of CPUs. 1 disables parallelism.
         """
         self.output_directory: str = output_directory
         self.destination_type: DestinationType = destination_type
         self.name_transformer: DestinationNameTransformer = DestinationNameTransformer(destination_type)
+        self.max_workers: int = max_workers or os.cpu_count() or 1
 
     def process(self, catalog_file: str, json_column_name: str, default_schema: str):
         """
-        This method first parse and build models to handle top-level streams.
-        In a second loop will go over the substreams that were nested in a breadth-first traversal manner.
+        This method first collects the table names of every stream to resolve naming conflicts.
+        Then it builds models to handle each top-level stream and goes over the substreams nested in it in a
+        breadth-first traversal manner.
 
         @param catalog_file input AirbyteCatalog file in JSON Schema describing the structure of the raw data
         @param json_column_name is the column name containing the JSON Blob with the raw data
@@ -49,7 +55,6 @@ class CatalogProcessor:
         schema_to_source_tables: Dict[str, Set[str]] = {}
         catalog = read_json(catalog_file)
         # print(json.dumps(catalog, separators=(",", ":")))
-        substreams = []
         stream_processors = self.build_stream_processor(
             catalog=catalog,
             json_column_name=json_column_name,
@@ -58,8 +63,9 @@ class CatalogProcessor:
             destination_type=self.destination_type,
             tables_registry=tables_registry,
         )
-        for stream_processor in stream_processors:
-            stream_processor.collect_table_names()
+        # registries collected separately are merged in catalog order so conflicts are always resolved the same way
+        for stream_tables_registry in self.map_streams(collect_table_names, stream_processors):
+            tables_registry.merge(stream_tables_registry)
         for conflict in tables_registry.resolve_names():
             print(
                 f"WARN: Resolving conflict: {conflict.schema}.{conflict.table_name_conflict} "
@@ -70,14 +76,29 @@ class CatalogProcessor:
             truncate = self.destination_type == DestinationType.MYSQL
             raw_table_name = self.name_transformer.normalize_table_name(f"_airbyte_raw_{stream_processor.stream_name}", truncate=truncate)
             add_table_to_sources(schema_to_source_tables, stream_processor.schema, raw_table_name)
-
-            nested_processors = stream_processor.process()
-            if nested_processors and len(nested_processors) > 0:
-                substreams += nested_processors
-            for file in stream_processor.sql_outputs:
-                output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
+        for sql_outputs in self.map_streams(generate_models, stream_processors, tables_registry):
+            for file in sql_outputs:
+                output_sql_file(os.path.join(self.output_directory, file), sql_outputs[file])
         self.write_yaml_sources_file(schema_to_source_tables)
-        self.process_substreams(substreams, tables_registry)
+
+    def map_streams(
+        self,
+        function: Callable[[StreamProcessor], Any],
+        stream_processors: List[StreamProcessor],
+        tables_registry: Optional[TableNameRegistry] = None,
+    ) -> Iterable[Any]:
+        """
+        Applies function to every top-level stream, results are returned in catalog order.
+
+        @param tables_registry is sent once to each worker process (instead of once per stream) to be used by all the stream processors
+        """
+        if self.max_workers <= 1 or len(stream_processors) <= 1:
+            set_tables_registry(tables_registry)
+            return [function(stream_processor) for stream_processor in stream_processors]
+        # sending streams by chunks keeps the inter-process communication overhead low for catalogs with many small streams
+        chunksize = max(1, len(stream_processors) // (self.max_workers * 4))
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=set_tables_registry, initargs=(tables_registry,)) as executor:
+            return list(executor.map(function, stream_processors, chunksize=chunksize))
 
     @staticmethod
     def build_stream_processor(
@@ -153,21 +174,6 @@ class CatalogProcessor:
             result.append(stream_processor)
         return result
 
-    def process_substreams(self, substreams: List[StreamProcessor], tables_registry: TableNameRegistry):
-        """
-        Handle nested stream/substream/children
-        """
-        while substreams:
-            children = substreams
-            substreams = []
-            for substream in children:
-                substream.tables_registry = tables_registry
-                nested_processors = substream.process()
-                if nested_processors:
-                    substreams += nested_processors
-                for file in substream.sql_outputs:
-                    output_sql_file(os.path.join(self.output_directory, file), substream.sql_outputs[file])
-
     def write_yaml_sources_file(self, schema_to_source_tables: Dict[str, Set[str]]):
         """
         Generate the sources.yaml file as described in https://docs.getdbt.com/docs/building-a-dbt-project/using-sources/
@@ -204,6 +210,42 @@ class CatalogProcessor:
 
 # Static Functions
 
+# Tables registry shared by all the stream processors of a worker process, see CatalogProcessor.map_streams
+_worker_tables_registry: Optional[TableNameRegistry] = None
+
+
+def set_tables_registry(tables_registry: Optional[TableNameRegistry]):
+    global _worker_tables_registry
+    _worker_tables_registry = tables_registry
+
+
+def collect_table_names(stream_processor: StreamProcessor) -> TableNameRegistry:
+    """
+    Collects the table names of a stream and its nested streams in a registry of their own
+    """
+    stream_processor.tables_registry = TableNameRegistry(stream_processor.destination_type)
+    stream_processor.collect_table_names()
+    return stream_processor.tables_registry
+
+
+def generate_models(stream_processor: StreamProcessor) -> Dict[str, str]:
+    """
+    Builds the models of a stream then goes over its nested streams in a breadth-first traversal manner.
+    @return the SQL content of the models indexed by their file path
+    """
+    sql_outputs = {}
+    substreams = [stream_processor]
+    while substreams:
+        children = substreams
+        substreams = []
+        for substream in children:
+            substream.tables_registry = _worker_tables_registry
+            nested_processors = substream.process()
+            if nested_processors:
+                substreams += nested_processors
+            sql_outputs.update(substream.sql_outputs)
+    return sql_outputs
+
 
 def read_json(input_path: str) -> Any:
     """
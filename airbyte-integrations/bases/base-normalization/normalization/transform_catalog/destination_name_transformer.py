@@ -4,6 +4,7 @@
 
 
 import unicodedata as ud
+from functools import lru_cache
 from re import match, sub
 
 from normalization.destination_type import DestinationType
@@ -48,8 +49,16 @@ class DestinationNameTransformer:
         """
         self.destination_type: DestinationType = destination_type
 
+    # Transformers of the same destination type are interchangeable, so they share the memoized names below
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DestinationNameTransformer) and self.destination_type == other.destination_type
+
+    def __hash__(self) -> int:
+        return hash(self.destination_type)
+
     # Public methods
 
+    @lru_cache(maxsize=None)
     def needs_quotes(self, input_name: str) -> bool:
         """
         @param input_name to test if it needs to manipulated with quotes or not
@@ -64,6 +73,7 @@ class DestinationNameTransformer:
         contains_non_alphanumeric = match(".*[^A-Za-z0-9_].*", input_name) is not None
         return doesnt_start_with_alphaunderscore or contains_non_alphanumeric
 
+    @lru_cache(maxsize=None)
     def normalize_schema_name(self, schema_name: str, in_jinja: bool = False, truncate: bool = True) -> str:
         """
         @param schema_name is the schema to normalize
@@ -75,6 +85,7 @@ class DestinationNameTransformer:
             schema_name = schema_name[1:]
         return self.__normalize_non_column_identifier_name(input_name=schema_name, in_jinja=in_jinja, truncate=truncate)
 
+    @lru_cache(maxsize=None)
     def normalize_table_name(
         self, table_name: str, in_jinja: bool = False, truncate: bool = True, conflict: bool = False, conflict_level: int = 0
     ) -> str:
@@ -92,6 +103,7 @@ class DestinationNameTransformer:
             input_name=table_name, in_jinja=in_jinja, truncate=truncate, conflict=conflict, conflict_level=conflict_level
         )
 
+    @lru_cache(maxsize=None)
     def normalize_column_name(
         self, column_name: str, in_jinja: bool = False, truncate: bool = True, conflict: bool = False, conflict_level: int = 0
     ) -> str:
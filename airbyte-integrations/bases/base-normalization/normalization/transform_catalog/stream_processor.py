@@ -8,11 +8,11 @@ import re
 from typing import Dict, List, Optional, Tuple
 
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode, SyncMode
-from jinja2 import Template
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer, transform_json_naming
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
 from normalization.transform_catalog.utils import (
+    compile_template,
     is_airbyte_column,
     is_array,
     is_boolean,
@@ -48,6 +48,9 @@ class StreamProcessor(object):
     - Casting each SQL column to the proper JSON data type
     - Generating an artificial (primary key) ID column based on the hashing of the row
 
+    When the raw table is appended to between syncs (append and append_dedup destination sync modes), the final tables are
+    materialized incrementally: only raw rows emitted after the last normalized row are transformed on each run.
+
     If any nested columns are discovered in the stream, a JSON blob SQL column is created in the top level parent stream
     and a new StreamProcessor instance will be spawned for each children substreams. These Sub-Stream Processors are then
     able to generate models to parse and extract recursively from its parent StreamProcessor model into separate SQL tables
@@ -94,6 +97,11 @@ class StreamProcessor(object):
         self.is_nested_array: bool = False
         self.default_schema: str = default_schema
         self.airbyte_emitted_at = "_airbyte_emitted_at"
+        # the raw table is only appended to with these sync modes, so already normalized rows don't need to be processed again
+        self.is_incremental: bool = destination_sync_mode.value in [
+            DestinationSyncMode.append.value,
+            DestinationSyncMode.append_dedup.value,
+        ]
 
     @staticmethod
     def create_from_parent(
@@ -129,6 +137,8 @@ class StreamProcessor(object):
         )
         result.parent = parent
         result.is_nested_array = is_nested_array
+        # Nested tables are extracted from the parent's final table, they can only be appended to if the parent table is append only
+        result.is_incremental = parent.is_incremental and parent.destination_sync_mode.value == DestinationSyncMode.append.value
         result.json_path = parent.json_path + [child_name]
         return result
 
@@ -215,30 +225,36 @@ class StreamProcessor(object):
             self.generate_id_hashing_model(from_table, column_names), is_intermediate=True, column_count=column_count, suffix="ab3"
         )
         if self.destination_sync_mode.value == DestinationSyncMode.append_dedup.value:
-            from_table = self.add_to_outputs(self.generate_dedup_record_model(from_table, column_names), is_intermediate=True, suffix="ab4")
-            if self.destination_type == DestinationType.ORACLE:
-                where_clause = '\nwhere "_AIRBYTE_ROW_NUM" = 1'
-            else:
-                where_clause = "\nwhere _airbyte_row_num = 1"
             from_table = self.add_to_outputs(
-                self.generate_scd_type_2_model(from_table, column_names) + where_clause,
+                self.generate_scd_type_2_model(from_table, column_names),
                 is_intermediate=False,
                 column_count=column_count,
                 suffix="scd",
+                incremental=self.is_incremental,
+                unique_key=self.hash_id(in_jinja=True),
             )
             if self.destination_type == DestinationType.ORACLE:
                 where_clause = '\nwhere "_AIRBYTE_ACTIVE_ROW" = 1'
             else:
                 where_clause = "\nwhere _airbyte_active_row = 1"
-
+            # With CDC, a deleted record has no active row anymore: the final table is rebuilt from the SCD table
+            # so that such records are removed from it as well.
+            incremental = self.is_incremental and "_ab_cdc_deleted_at" not in column_names.keys()
+            if incremental:
+                where_clause += f"\n{self.get_incremental_clause()}"
             from_table = self.add_to_outputs(
-                self.generate_final_model(from_table, column_names) + where_clause, is_intermediate=False, column_count=column_count
+                self.generate_final_model(from_table, column_names, unique_key=self.get_unique_key()) + where_clause,
+                is_intermediate=False,
+                column_count=column_count,
+                incremental=incremental,
+                unique_key=self.get_unique_key(in_jinja=True),
             )
             # TODO generate yaml file to dbt test final table where primary keys should be unique
         else:
-            from_table = self.add_to_outputs(
-                self.generate_final_model(from_table, column_names), is_intermediate=False, column_count=column_count
-            )
+            sql = self.generate_final_model(from_table, column_names)
+            if self.is_incremental:
+                sql += f"\nwhere 1 = 1\n{self.get_incremental_clause()}"
+            from_table = self.add_to_outputs(sql, is_intermediate=False, column_count=column_count, incremental=self.is_incremental)
         return self.find_children_streams(from_table, column_names)
 
     def extract_column_names(self) -> Dict[str, Tuple[str, str]]:
@@ -311,7 +327,7 @@ class StreamProcessor(object):
             table_alias = ""
         else:
             table_alias = "as table_alias"
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 {{ unnesting_before_query }}
@@ -370,7 +386,7 @@ from {{ from_table }} {{ table_alias }}
         return f"{json_extract} as {column_name}"
 
     def generate_column_typing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
@@ -449,7 +465,7 @@ from {{ from_table }}
 
     @staticmethod
     def generate_mysql_date_format_statement(column_name: str) -> str:
-        template = Template(
+        template = compile_template(
             """
         case when {{column_name}} = '' then NULL
         else cast({{column_name}} as date)
@@ -471,7 +487,7 @@ from {{ from_table }}
             },
             {"regex": r"\\d{4}-\\d{2}-\\d{2}T(\\d{2}:){2}\\d{2}\\.\\d{1,7}(\\+|-)\\d{2}", "format": "YYYY-MM-DDTHH24:MI:SS.FFTZH"},
         ]
-        template = Template(
+        template = compile_template(
             """
     case
     {% for format_item in formats %}
@@ -486,7 +502,7 @@ from {{ from_table }}
 
     def generate_id_hashing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
 
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to build a hash column based on the values of this record
 select
@@ -547,29 +563,6 @@ from {{ from_table }} tmp
 
         return col
 
-    def generate_dedup_record_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
-            """
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  row_number() over (
-    partition by {{ hash_id }}
-    order by {{ col_emitted_at }} asc
-  ) as {{ active_row }},
-  tmp.*
-from {{ from_table }} tmp
-{{ sql_table_comment }}
-        """
-        )
-        sql = template.render(
-            active_row=self.process_col("_airbyte_row_num"),
-            col_emitted_at=self.get_emitted_at(),
-            hash_id=self.hash_id(),
-            from_table=jinja_call(from_table),
-            sql_table_comment=self.sql_table_comment(include_from_table=True),
-        )
-        return sql
-
     def process_col(self, col: str):
         return self.name_transformer.normalize_column_name(col)
 
@@ -577,6 +570,65 @@ from {{ from_table }} tmp
 
         scd_sql_template = """
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with
+{{ '{%' }} if is_incremental() {{ '%}' }}
+new_data as (
+    -- raw rows which were not normalized yet
+    select
+      {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+      {%- endif %}
+      {%- for field in fields %}
+        {{ field }},
+      {%- endfor %}
+        {{ col_emitted_at }},
+        {{ hash_id }}
+    from {{ from_table }}
+    where 1 = 1
+    {{ incremental_clause }}
+),
+input_data as (
+    select * from new_data
+    union all
+    -- rows of the primary keys found in the new rows are windowed again to update their end date and active flag
+    select
+      {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+      {%- endif %}
+      {%- for field in fields %}
+        {{ field }},
+      {%- endfor %}
+        {{ col_emitted_at }},
+        {{ hash_id }}
+    from {{ '{{ this }}' }} this_data
+    where {{ unique_key }} in (
+        select {{ unique_key_value }} from new_data
+    )
+),
+{{ '{%' }} else {{ '%}' }}
+input_data as (
+    select
+      {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+      {%- endif %}
+      {%- for field in fields %}
+        {{ field }},
+      {%- endfor %}
+        {{ col_emitted_at }},
+        {{ hash_id }}
+    from {{ from_table }}
+),
+{{ '{%' }} endif {{ '%}' }}
+dedup_data as (
+    -- deduplicate records based on the hash record column
+    select
+      row_number() over (
+        partition by {{ hash_id }}
+        order by {{ col_emitted_at }} asc
+      ) as {{ row_num }},
+      input_data.*
+    from input_data
+)
 select
   {%- if parent_hash_id %}
     {{ parent_hash_id }},
@@ -584,6 +636,7 @@ select
   {%- for field in fields %}
     {{ field }},
   {%- endfor %}
+  {{ unique_key_value }} as {{ unique_key }},
   {{ cursor_field }} as {{ airbyte_start_at }},
   lag({{ cursor_field }}) over (
     partition by {{ primary_key }}
@@ -595,11 +648,12 @@ select
   ) is null {{ cdc_active_row }} then 1 else 0 end as {{ active_row }},
   {{ col_emitted_at }},
   {{ hash_id }}
-from {{ from_table }}
+from dedup_data
 {{ sql_table_comment }}
+where {{ row_num }} = 1
         """
 
-        template = Template(scd_sql_template)
+        template = compile_template(scd_sql_template)
 
         order_null = "is null asc"
         if self.destination_type == DestinationType.ORACLE:
@@ -622,6 +676,7 @@ from {{ from_table }}
 
         sql = template.render(
             order_null=order_null,
+            row_num=self.process_col("_airbyte_row_num"),
             airbyte_start_at=self.name_transformer.normalize_column_name("_airbyte_start_at"),
             airbyte_end_at=self.name_transformer.normalize_column_name("_airbyte_end_at"),
             active_row=self.name_transformer.normalize_column_name("_airbyte_active_row"),
@@ -636,9 +691,39 @@ from {{ from_table }}
             sql_table_comment=self.sql_table_comment(include_from_table=True),
             cdc_active_row=cdc_active_row_pattern,
             cdc_updated_at_order=cdc_updated_order_pattern,
+            unique_key=self.get_unique_key(),
+            unique_key_value=self.get_unique_key_value(column_names),
+            incremental_clause=self.get_incremental_clause(),
         )
         return sql
 
+    def get_incremental_clause(self) -> str:
+        """
+        Filter on the emitted_at column to apply to the input rows of an incremental model (see the incremental_clause macro)
+        """
+        return jinja_call(f"incremental_clause({self.get_emitted_at(in_jinja=True)})")
+
+    def get_unique_key(self, in_jinja: bool = False) -> str:
+        return self.name_transformer.normalize_column_name("_airbyte_unique_key", in_jinja)
+
+    def get_unique_key_value(self, column_names: Dict[str, Tuple[str, str]]) -> str:
+        """
+        Builds a single column value out of the (composite) primary key so records can be matched by their primary key
+        between the new rows and the rows already stored in an incremental table
+        """
+        if not self.primary_key:
+            raise ValueError(f"No primary key specified for stream {self.stream_name}")
+        fields = []
+        for path in self.primary_key:
+            # validates the path the same way the primary key used for windowing does
+            self.get_primary_key_from_path(column_names, path)
+            field = path[0]
+            if is_airbyte_column(field):
+                fields.append(self.name_transformer.normalize_column_name(field, in_jinja=True))
+            else:
+                fields.append(StreamProcessor.safe_cast_to_string(self.properties[field], column_names[field][1], self.destination_type))
+        return jinja_call(f"dbt_utils.surrogate_key([{', '.join(fields)}])")
+
     def get_cursor_field(self, column_names: Dict[str, Tuple[str, str]], in_jinja: bool = False) -> str:
         if not self.cursor_field:
             cursor = self.name_transformer.normalize_column_name("_airbyte_emitted_at", in_jinja)
@@ -681,8 +766,8 @@ from {{ from_table }}
             else:
                 raise ValueError(f"No path specified for stream {self.stream_name}")
 
-    def generate_final_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+    def generate_final_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]], unique_key: str = "") -> str:
+        template = compile_template(
             """
 -- Final base SQL model
 select
@@ -692,6 +777,9 @@ select
   {%- for field in fields %}
     {{ field }},
   {%- endfor %}
+  {%- if unique_key %}
+    {{ unique_key }},
+  {%- endif %}
     {{ col_emitted_at }},
     {{ hash_id }}
 from {{ from_table }}
@@ -702,6 +790,7 @@ from {{ from_table }}
             col_emitted_at=self.get_emitted_at(),
             parent_hash_id=self.parent_hash_id(),
             fields=self.list_fields(column_names),
+            unique_key=unique_key,
             hash_id=self.hash_id(),
             from_table=jinja_call(from_table),
             sql_table_comment=self.sql_table_comment(include_from_table=True),
@@ -711,7 +800,9 @@ from {{ from_table }}
     def list_fields(self, column_names: Dict[str, Tuple[str, str]]) -> List[str]:
         return [column_names[field][0] for field in column_names]
 
-    def add_to_outputs(self, sql: str, is_intermediate: bool, column_count: int = 0, suffix: str = "") -> str:
+    def add_to_outputs(
+        self, sql: str, is_intermediate: bool, column_count: int = 0, suffix: str = "", incremental: bool = False, unique_key: str = ""
+    ) -> str:
         schema = self.get_schema(is_intermediate)
         # MySQL table names need to be manually truncated, because it does not do it automatically
         truncate_name = self.destination_type == DestinationType.MYSQL
@@ -725,17 +816,23 @@ from {{ from_table }}
                 # dbt throws "maximum recursion depth exceeded" exception at runtime
                 # if ephemeral is used with large number of columns, use views instead
                 output = os.path.join("airbyte_views", self.schema, file)
+        elif incremental:
+            # only new rows are inserted (or merged on unique_key) into the existing table
+            output = os.path.join("airbyte_incremental", self.schema, file)
         else:
             output = os.path.join("airbyte_tables", self.schema, file)
         tags = self.get_model_tags(is_intermediate)
+        config = f"tags=[{tags}]"
+        if unique_key:
+            config += f", unique_key={unique_key}"
         # The alias() macro configs a model's final table name.
         if file_name != table_name:
-            header = jinja_call(f'config(alias="{table_name}", schema="{schema}", tags=[{tags}])')
+            header = jinja_call(f'config(alias="{table_name}", schema="{schema}", {config})')
         else:
             if self.destination_type == DestinationType.ORACLE:
-                header = jinja_call(f'config(schema="{self.default_schema}", tags=[{tags}])')
+                header = jinja_call(f'config(schema="{self.default_schema}", {config})')
             else:
-                header = jinja_call(f'config(schema="{schema}", tags=[{tags}])')
+                header = jinja_call(f'config(schema="{schema}", {config})')
         self.sql_outputs[
             output
         ] = f"""
@@ -147,6 +147,20 @@ class TableNameRegistry:
         table_name = self.get_simple_table_name(json_path)
         self.simple_table_registry.add(intermediate_schema, schema, json_path, stream_name, table_name)
 
+    def merge(self, other: "TableNameRegistry"):
+        """
+        Record the simple names collected by another registry after the ones collected so far.
+
+        Names of separate streams can be collected independently (for example in parallel) and merged afterwards.
+        As long as registries are merged in catalog order, collisions are resolved exactly as if all names were
+        registered in a single registry.
+        """
+        for values in other.simple_table_registry.values():
+            for value in values:
+                self.simple_table_registry.add(
+                    value.intermediate_schema, value.schema, value.json_path, value.stream_name, value.table_name
+                )
+
     def get_simple_table_name(self, json_path: List[str]) -> str:
         """
         Generates a simple table name, possibly in collisions within this catalog because of truncation
@@ -3,13 +3,24 @@
 #
 
 
+from functools import lru_cache
 from typing import Set
 
+from jinja2 import Template
+
 
 def jinja_call(command: str) -> str:
     return "{{ " + command + " }}"
 
 
+@lru_cache(maxsize=None)
+def compile_template(source: str) -> Template:
+    """
+    Compiling a jinja template is much more expensive than rendering it: templates are compiled once and reused for every stream
+    """
+    return Template(source)
+
+
 def remove_jinja(command: str) -> str:
     return str(command).replace("{{ ", "").replace(" }}", "")
 
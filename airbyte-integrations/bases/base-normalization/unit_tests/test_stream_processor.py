@@ -100,3 +100,48 @@ def test_primary_key(
     except ValueError as e:
         if not expecting_exception:
             raise e
+
+
+@pytest.mark.parametrize(
+    "destination_sync_mode, expected_outputs",
+    [
+        (DestinationSyncMode.overwrite, ["airbyte_tables/schema_name/test_incremental.sql"]),
+        (DestinationSyncMode.append, ["airbyte_incremental/schema_name/test_incremental.sql"]),
+        (
+            DestinationSyncMode.append_dedup,
+            ["airbyte_incremental/schema_name/test_incremental_scd.sql", "airbyte_incremental/schema_name/test_incremental.sql"],
+        ),
+    ],
+)
+def test_incremental_models(destination_sync_mode: DestinationSyncMode, expected_outputs: List[str]):
+    stream_processor = StreamProcessor.create(
+        stream_name="test_incremental",
+        destination_type=DestinationType.POSTGRES,
+        raw_schema="raw_schema",
+        default_schema="default_schema",
+        schema="schema_name",
+        source_sync_mode=SyncMode.incremental,
+        destination_sync_mode=destination_sync_mode,
+        cursor_field=["updated_at"],
+        primary_key=[["id"]],
+        json_column_name="json_column_name",
+        properties={"id": {"type": "integer"}, "updated_at": {"type": "string"}},
+        tables_registry=TableNameRegistry(DestinationType.POSTGRES),
+        from_table="source('raw_schema', '_airbyte_raw_test_incremental')",
+    )
+    stream_processor.collect_table_names()
+    stream_processor.tables_registry.resolve_names()
+    stream_processor.process()
+    final_outputs = [output for output in stream_processor.sql_outputs if not output.startswith("airbyte_ctes")]
+    assert final_outputs == expected_outputs
+    for output in expected_outputs:
+        sql = stream_processor.sql_outputs[output]
+        if destination_sync_mode == DestinationSyncMode.overwrite:
+            assert "incremental_clause" not in sql
+        else:
+            assert "{{ incremental_clause('_airbyte_emitted_at') }}" in sql
+    if destination_sync_mode == DestinationSyncMode.append_dedup:
+        scd_sql = stream_processor.sql_outputs[expected_outputs[0]]
+        assert "unique_key='_airbyte_test_incremental_hashid'" in scd_sql
+        assert "where _airbyte_unique_key in" in scd_sql
+        assert "unique_key='_airbyte_unique_key'" in stream_processor.sql_outputs[expected_outputs[1]]
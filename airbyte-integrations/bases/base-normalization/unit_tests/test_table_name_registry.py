@@ -9,7 +9,7 @@ from typing import List
 
 import pytest
 from normalization.destination_type import DestinationType
-from normalization.transform_catalog.catalog_processor import CatalogProcessor
+from normalization.transform_catalog.catalog_processor import CatalogProcessor, collect_table_names
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
 from normalization.transform_catalog.table_name_registry import TableNameRegistry, get_nested_hashed_table_name
 
@@ -96,6 +96,34 @@ def test_resolve_names(destination_type: DestinationType, catalog_file: str):
     assert tables_registry.to_dict(apply_function) == expected_names
 
 
+@pytest.mark.parametrize("catalog_file", ["long_name_truncate_collisions_catalog", "un-nesting_collisions_catalog", "nested_catalog"])
+@pytest.mark.parametrize("destination_type", list(DestinationType))
+def test_resolve_names_from_merged_registries(destination_type: DestinationType, catalog_file: str):
+    """
+    Names collected for each stream in a registry of their own (as done by parallel workers) and merged in catalog order
+    should be resolved exactly like names collected in a single registry
+    """
+    catalog = read_json(f"resources/{catalog_file}.json")
+    tables_registry = TableNameRegistry(destination_type)
+    merged_registry = TableNameRegistry(destination_type)
+    stream_processors = CatalogProcessor.build_stream_processor(
+        catalog=catalog,
+        json_column_name="'json_column_name_test'",
+        default_schema="schema_test",
+        name_transformer=DestinationNameTransformer(destination_type),
+        destination_type=destination_type,
+        tables_registry=tables_registry,
+    )
+    for stream_processor in stream_processors:
+        stream_processor.collect_table_names()
+    for stream_processor in stream_processors:
+        merged_registry.merge(collect_table_names(stream_processor))
+
+    conflicts = [vars(conflict) for conflict in tables_registry.resolve_names()]
+    assert [vars(conflict) for conflict in merged_registry.resolve_names()] == conflicts
+    assert merged_registry.to_dict() == tables_registry.to_dict()
+
+
 def identity(x):
     return x
 
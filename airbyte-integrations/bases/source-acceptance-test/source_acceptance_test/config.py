@@ -108,4 +108,13 @@ class TestConfig(BaseConfig):
 class Config(BaseConfig):
     connector_image: str = Field(description="Docker image to test, for example 'airbyte/source-hubspot:dev'")
     base_path: Optional[str] = Field(description="Base path for all relative paths")
+    max_parallel_runs: int = Field(
+        default=4,
+        description="Maximum number of connector containers run concurrently, set to 1 if the connector can't be run concurrently",
+        ge=1,
+    )
+    cache_connector_outputs: bool = Field(
+        default=False,
+        description="Reuse the output of a connector command run with the same config, catalog and state earlier in the test session",
+    )
     tests: TestConfig = Field(description="List of the tests with their configs")
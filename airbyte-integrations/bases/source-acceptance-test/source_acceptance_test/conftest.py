@@ -7,19 +7,20 @@ import copy
 import json
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import Logger
 from pathlib import Path
 from subprocess import run
-from typing import Any, List, MutableMapping, Optional
+from typing import Any, Iterable, List, MutableMapping, Optional
 
 import pytest
 from airbyte_cdk.models import AirbyteRecordMessage, AirbyteStream, ConfiguredAirbyteCatalog, ConnectorSpecification, Type
 from docker import errors
 from source_acceptance_test.config import Config
-from source_acceptance_test.utils import ConnectorRunner, SecretDict, load_config
+from source_acceptance_test.utils import ConnectorRunner, RunsAhead, SecretDict, load_config, load_configured_catalog
 
 
-@pytest.fixture(name="base_path")
+@pytest.fixture(name="base_path", scope="session")
 def base_path_fixture(pytestconfig, acceptance_test_config) -> Path:
     """Fixture to define base path for every path-like fixture"""
     if acceptance_test_config.base_path:
@@ -62,10 +63,7 @@ def configured_catalog_path_fixture(inputs, base_path) -> Optional[str]:
 @pytest.fixture(name="configured_catalog")
 def configured_catalog_fixture(configured_catalog_path, discovered_catalog) -> Optional[ConfiguredAirbyteCatalog]:
     if configured_catalog_path:
-        catalog = ConfiguredAirbyteCatalog.parse_file(configured_catalog_path)
-        for configured_stream in catalog.streams:
-            configured_stream.stream = discovered_catalog.get(configured_stream.stream.name, configured_stream.stream)
-        return catalog
+        return load_configured_catalog(configured_catalog_path, discovered_catalog)
     return None
 
 
@@ -101,9 +99,46 @@ def connector_spec_fixture(connector_spec_path) -> ConnectorSpecification:
     return ConnectorSpecification.parse_file(connector_spec_path)
 
 
+@pytest.fixture(name="connector_runs_executor", scope="session")
+def connector_runs_executor_fixture(acceptance_test_config) -> Iterable[ThreadPoolExecutor]:
+    """Pool running the connector containers of the whole session, it bounds the number of containers running concurrently"""
+    with ThreadPoolExecutor(max_workers=acceptance_test_config.max_parallel_runs, thread_name_prefix="connector-run") as executor:
+        yield executor
+
+
+@pytest.fixture(name="cached_outputs", scope="session")
+def cached_outputs_fixture(acceptance_test_config) -> Optional[MutableMapping[str, Future]]:
+    """Cache of connector outputs: hash of the command and its inputs -> future of the output, None unless enabled in the config"""
+    return {} if acceptance_test_config.cache_connector_outputs else None
+
+
+@pytest.fixture(name="started_runs", scope="session")
+def started_runs_fixture() -> MutableMapping[str, List[Future]]:
+    """Runs started ahead which haven't been taken over by a test yet: hash of the command and its inputs -> futures of the outputs"""
+    return {}
+
+
 @pytest.fixture(name="docker_runner")
-def docker_runner_fixture(image_tag, tmp_path) -> ConnectorRunner:
-    return ConnectorRunner(image_tag, volume=tmp_path)
+def docker_runner_fixture(image_tag, tmp_path, connector_runs_executor, cached_outputs, started_runs) -> ConnectorRunner:
+    return ConnectorRunner(image_tag, volume=tmp_path, executor=connector_runs_executor, cache=cached_outputs, started_runs=started_runs)
+
+
+@pytest.fixture(name="runs_ahead", scope="session", autouse=True)
+def runs_ahead_fixture(
+    request, pull_docker_image, acceptance_test_config, base_path, tmp_path_factory, connector_runs_executor, cached_outputs, started_runs
+) -> Iterable[RunsAhead]:
+    """Starts the independent connector commands of the collected tests together, see RunsAhead"""
+    runner = ConnectorRunner(
+        acceptance_test_config.connector_image,
+        volume=tmp_path_factory.mktemp("runs_ahead"),
+        executor=connector_runs_executor,
+        cache=cached_outputs,
+        started_runs=started_runs,
+    )
+    runs_ahead = RunsAhead(runner, base_path, request.session.items)
+    runs_ahead.start()
+    yield runs_ahead
+    runs_ahead.cancel()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -15,7 +15,15 @@ from docker.errors import ContainerError
 from jsonschema import validate
 from source_acceptance_test.base import BaseTest
 from source_acceptance_test.config import BasicReadTestConfig, ConnectionTestConfig
-from source_acceptance_test.utils import ConnectorRunner, SecretDict, filter_output, serialize, verify_records_schema
+from source_acceptance_test.utils import (
+    ConnectorRunner,
+    RecordIndex,
+    SecretDict,
+    closest_record,
+    diff_dicts,
+    filter_output,
+    verify_records_schema,
+)
 from source_acceptance_test.utils.json_schema_helper import JsonSchemaHelper, get_expected_schema_structure, get_object_structure
 
 
@@ -308,24 +316,34 @@ class TestBasicRead(BaseTest):
                     r2 = TestBasicRead.remove_extra_fields(r2, r1)
                 assert r1 == r2, f"Stream {stream_name}: Mismatch of record order or values"
         else:
-            expected = set(map(serialize, expected))
-            actual = set(map(serialize, actual))
-            missing_expected = set(expected) - set(actual)
+            expected = RecordIndex(expected)
+            actual = RecordIndex(actual)
+            missing_expected = expected.difference(actual)
 
             if missing_expected:
                 msg = f"Stream {stream_name}: All expected records must be produced"
                 detailed_logger.info(msg)
                 detailed_logger.log_json_list(missing_expected)
+                TestBasicRead.log_closest_diffs(missing_expected, actual.difference(expected), detailed_logger)
                 pytest.fail(msg)
 
             if not extra_records:
-                extra_actual = set(actual) - set(expected)
+                extra_actual = actual.difference(expected)
                 if extra_actual:
                     msg = f"Stream {stream_name}: There are more records than expected, but extra_records is off"
                     detailed_logger.info(msg)
                     detailed_logger.log_json_list(extra_actual)
                     pytest.fail(msg)
 
+    @staticmethod
+    def log_closest_diffs(missing: List[Mapping[str, Any]], unexpected: List[Mapping[str, Any]], detailed_logger: Logger, limit: int = 10):
+        """Log the diff between the first missing records and the most similar records produced instead"""
+        for record in missing[:limit]:
+            closest = closest_record(record, unexpected)
+            if closest is None:
+                return
+            detailed_logger.info("\n".join(diff_dicts(record, closest, use_markup=False)))
+
     @staticmethod
     def group_by_stream(records) -> MutableMapping[str, List[MutableMapping]]:
         """Group records by a source stream"""
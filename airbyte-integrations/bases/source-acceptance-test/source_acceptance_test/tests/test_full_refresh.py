@@ -6,7 +6,7 @@
 import pytest
 from airbyte_cdk.models import Type
 from source_acceptance_test.base import BaseTest
-from source_acceptance_test.utils import ConnectorRunner, full_refresh_only_catalog, serialize
+from source_acceptance_test.utils import ConnectorRunner, RecordIndex, full_refresh_only_catalog
 
 
 @pytest.mark.default_timeout(20 * 60)
@@ -16,10 +16,11 @@ class TestFullRefresh(BaseTest):
         output = docker_runner.call_read(connector_config, configured_catalog)
         records_1 = [message.record.data for message in output if message.type == Type.RECORD]
 
-        output = docker_runner.call_read(connector_config, configured_catalog)
+        # the second read starts once the first one completed and always runs the connector again, even when outputs are cached
+        output = docker_runner.call_read(connector_config, configured_catalog, use_cache=False)
         records_2 = [message.record.data for message in output if message.type == Type.RECORD]
 
-        output_diff = set(map(serialize, records_1)) - set(map(serialize, records_2))
+        output_diff = RecordIndex(records_1).difference(RecordIndex(records_2))
         if output_diff:
             msg = "The two sequential reads should produce either equal set of records or one of them is a strict subset of the other"
             detailed_logger.info(msg)
@@ -1,18 +1,23 @@
 from .asserts import verify_records_schema
-from .common import SecretDict, filter_output, full_refresh_only_catalog, incremental_only_catalog, load_config
-from .compare import diff_dicts, serialize
+from .common import SecretDict, filter_output, full_refresh_only_catalog, incremental_only_catalog, load_config, load_configured_catalog
+from .compare import RecordIndex, closest_record, diff_dicts, serialize
 from .connector_runner import ConnectorRunner
 from .json_schema_helper import JsonSchemaHelper
+from .runs_ahead import RunsAhead
 
 __all__ = [
     "JsonSchemaHelper",
     "load_config",
+    "load_configured_catalog",
     "filter_output",
     "full_refresh_only_catalog",
     "incremental_only_catalog",
     "SecretDict",
     "ConnectorRunner",
+    "RunsAhead",
     "diff_dicts",
+    "RecordIndex",
+    "closest_record",
     "serialize",
     "verify_records_schema",
 ]
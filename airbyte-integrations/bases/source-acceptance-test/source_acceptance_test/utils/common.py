@@ -5,7 +5,7 @@
 
 from collections import UserDict
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Mapping
 
 import pytest
 from yaml import load
@@ -15,7 +15,7 @@ try:
 except ImportError:
     from yaml import Loader
 
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, SyncMode
+from airbyte_cdk.models import AirbyteMessage, AirbyteStream, ConfiguredAirbyteCatalog, SyncMode
 from source_acceptance_test.config import Config
 
 
@@ -30,6 +30,14 @@ def load_config(path: str) -> Config:
         return Config.parse_obj(data)
 
 
+def load_configured_catalog(path: Path, discovered_streams: Mapping[str, AirbyteStream]) -> ConfiguredAirbyteCatalog:
+    """Load configured catalog from the file, its streams are replaced by the discovered ones when there are"""
+    catalog = ConfiguredAirbyteCatalog.parse_file(path)
+    for configured_stream in catalog.streams:
+        configured_stream.stream = discovered_streams.get(configured_stream.stream.name, configured_stream.stream)
+    return catalog
+
+
 def full_refresh_only_catalog(configured_catalog: ConfiguredAirbyteCatalog) -> ConfiguredAirbyteCatalog:
     """Transform provided catalog to catalog with all streams configured to use Full Refresh sync (when possible)"""
     streams = []
@@ -4,8 +4,8 @@
 
 
 import functools
-import json
-from typing import List, Mapping, Optional
+import hashlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 import icdiff
 import py
@@ -51,14 +51,102 @@ def diff_dicts(left, right, use_markup) -> Optional[List[str]]:
     return ["equals failed"] + [color_off + line for line in icdiff_lines]
 
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _encode_scalar(value: Any) -> str:
+    encoded = value if type(value) is str else str(value)
+    return "s%d:%s" % (len(encoded), encoded)
+
+
+def _encode(value: Any, parts: List[str]):
+    """
+    Appends the canonical encoding of the value to parts.
+    Keys of mappings are sorted, lists are treated as unordered and scalars are compared by their string representation,
+    every item is length-prefixed and tagged so distinct values can't produce the same encoding.
+    """
+    if isinstance(value, Mapping):
+        parts.append("{%d:" % len(value))
+        try:
+            keys = sorted(value)
+        except TypeError:
+            keys = sorted(value, key=str)
+        for key in keys:
+            encoded_key = key if type(key) is str else str(key)
+            item = value[key]
+            if type(item) in _SCALAR_TYPES:
+                # inlined to avoid a function call for the most common case
+                parts.append("%d:%s%s" % (len(encoded_key), encoded_key, _encode_scalar(item)))
+            else:
+                parts.append("%d:%s" % (len(encoded_key), encoded_key))
+                _encode(item, parts)
+        parts.append("}")
+    elif isinstance(value, List):
+        parts.append("[%d:" % len(value))
+        # encodings are self delimiting, so sorting the encoded items is enough to ignore their order
+        parts.extend(sorted(_encoded(item) for item in value))
+        parts.append("]")
+    else:
+        parts.append(_encode_scalar(value))
+
+
+def _encoded(value: Any) -> str:
+    if type(value) in _SCALAR_TYPES:
+        return _encode_scalar(value)
+    parts = []
+    _encode(value, parts)
+    return "".join(parts)
+
+
+def canonical_digest(value: Any) -> bytes:
+    """Digest of the value which is equal for values considered equal by `serialize`, without building the serialized value"""
+    return hashlib.blake2b(_encoded(value).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class RecordIndex:
+    """
+    Set of records indexed by their canonical digest, it compares large outputs in linear time.
+    Records which are equal once serialized are stored once, the first of them is kept to report differences.
+    """
+
+    def __init__(self, records: Iterable[Mapping[str, Any]] = ()):
+        self._records: Dict[bytes, Mapping[str, Any]] = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: Mapping[str, Any]):
+        self._records.setdefault(canonical_digest(record), record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record: Mapping[str, Any]) -> bool:
+        return canonical_digest(record) in self._records
+
+    def difference(self, other: "RecordIndex") -> List[Mapping[str, Any]]:
+        """Records of this index missing from the other one"""
+        return [record for digest, record in self._records.items() if digest not in other._records]
+
+
+def closest_record(record: Mapping[str, Any], candidates: Iterable[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+    """Candidate sharing the most top level fields with the record, it is used to show a meaningful diff for a missing record"""
+    fields = {key: canonical_digest(value) for key, value in record.items()}
+    best_record, best_score = None, -1
+    for candidate in candidates:
+        score = sum(1 for key, value in candidate.items() if key in fields and fields[key] == canonical_digest(value))
+        if score > best_score:
+            best_record, best_score = candidate, score
+    return best_record
+
+
 @functools.total_ordering
 class DictWithHash(dict):
 
-    _hash: str = None
+    _hash: int = None
 
     def __hash__(self):
         if not self._hash:
-            self._hash = hash(json.dumps({k: serialize(v) for k, v in self.items()}, sort_keys=True))
+            self._hash = hash(canonical_digest(self))
         return self._hash
 
     def __lt__(self, other):
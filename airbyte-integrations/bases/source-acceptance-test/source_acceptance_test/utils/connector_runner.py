@@ -3,19 +3,52 @@
 #
 
 
+import codecs
+import hashlib
 import json
 import logging
+import queue
+import threading
+from concurrent.futures import Executor, Future
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional
+from typing import Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import docker
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog
-from docker.errors import ContainerError
+from docker.errors import APIError, ContainerError
+from docker.models.containers import Container
 from pydantic import ValidationError
 
+# put in the queue by the output reader once the container's output is exhausted
+_END_OF_OUTPUT = object()
+
 
 class ConnectorRunner:
-    def __init__(self, image_name: str, volume: Path):
+    """
+    Runs connector commands in docker containers.
+
+    The call_* methods block until the command completes, their submit_* counterparts return a Future so independent commands can run
+    concurrently on `executor`. Commands run inline when no executor is given.
+    Commands submitted with `ahead` are kept in `started_runs` until the next call with the same image, command, config, catalog and
+    state takes them over, so tests get the output of commands started earlier instead of running the connector themselves.
+    When `cache` is given, the output of a command is shared by every call with the same image, command, config, catalog and state,
+    it should be shared by the runners of a test session to reuse outputs across tests. Failed commands are not cached, they are run
+    again by the next call.
+    """
+
+    # maximum number of parsed messages waiting to be consumed, the output reader pauses once it is reached
+    max_buffered_messages = 10000
+    # guards the caches shared between runners
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        image_name: str,
+        volume: Path,
+        executor: Optional[Executor] = None,
+        cache: Optional[MutableMapping[str, Future]] = None,
+        started_runs: Optional[MutableMapping[str, List[Future]]] = None,
+    ):
         self._client = docker.from_env()
         try:
             self._image = self._client.images.get(image_name)
@@ -24,38 +57,56 @@ class ConnectorRunner:
             self._image = self._client.images.pull(image_name)
             print("Pulling completed")
         self._runs = 0
+        self._runs_lock = threading.Lock()
         self._volume_base = volume
+        self._executor = executor
+        self._cache = cache
+        self._started_runs = started_runs if started_runs is not None else {}
 
     @property
     def output_folder(self) -> Path:
+        """Output folder of the latest run"""
         return self._volume_base / f"run_{self._runs}" / "output"
 
     @property
     def input_folder(self) -> Path:
+        """Input folder of the latest run"""
         return self._volume_base / f"run_{self._runs}" / "input"
 
-    def _prepare_volumes(self, config: Optional[Mapping], state: Optional[Mapping], catalog: Optional[ConfiguredAirbyteCatalog]):
-        self.input_folder.mkdir(parents=True)
-        self.output_folder.mkdir(parents=True)
+    def _next_run_folders(self) -> Tuple[Path, Path]:
+        with self._runs_lock:
+            self._runs += 1
+            input_folder, output_folder = self.input_folder, self.output_folder
+            input_folder.mkdir(parents=True)
+            output_folder.mkdir(parents=True)
+        return input_folder, output_folder
 
+    @staticmethod
+    def _prepare_volumes(
+        input_folder: Path,
+        output_folder: Path,
+        config: Optional[Mapping],
+        state: Optional[Mapping],
+        catalog: Optional[ConfiguredAirbyteCatalog],
+    ):
         if config:
-            with open(str(self.input_folder / "tap_config.json"), "w") as outfile:
+            with open(str(input_folder / "tap_config.json"), "w") as outfile:
                 json.dump(dict(config), outfile)
 
         if state:
-            with open(str(self.input_folder / "state.json"), "w") as outfile:
+            with open(str(input_folder / "state.json"), "w") as outfile:
                 json.dump(dict(state), outfile)
 
         if catalog:
-            with open(str(self.input_folder / "catalog.json"), "w") as outfile:
+            with open(str(input_folder / "catalog.json"), "w") as outfile:
                 outfile.write(catalog.json())
 
         volumes = {
-            str(self.input_folder): {
+            str(input_folder): {
                 "bind": "/data",
                 # "mode": "ro",
             },
-            str(self.output_folder): {
+            str(output_folder): {
                 "bind": "/local",
                 "mode": "rw",
             },
@@ -63,53 +114,267 @@ class ConnectorRunner:
         return volumes
 
     def call_spec(self, **kwargs) -> List[AirbyteMessage]:
-        cmd = "spec"
-        output = list(self.run(cmd=cmd, **kwargs))
-        return output
+        return self.submit_spec(**kwargs).result()
 
     def call_check(self, config, **kwargs) -> List[AirbyteMessage]:
-        cmd = "check --config tap_config.json"
-        output = list(self.run(cmd=cmd, config=config, **kwargs))
-        return output
+        return self.submit_check(config, **kwargs).result()
 
     def call_discover(self, config, **kwargs) -> List[AirbyteMessage]:
-        cmd = "discover --config tap_config.json"
-        output = list(self.run(cmd=cmd, config=config, **kwargs))
-        return output
+        return self.submit_discover(config, **kwargs).result()
 
     def call_read(self, config, catalog, **kwargs) -> List[AirbyteMessage]:
-        cmd = "read --config tap_config.json --catalog catalog.json"
-        output = list(self.run(cmd=cmd, config=config, catalog=catalog, **kwargs))
-        return output
+        return self.submit_read(config, catalog, **kwargs).result()
 
     def call_read_with_state(self, config, catalog, state, **kwargs) -> List[AirbyteMessage]:
+        return self.submit_read_with_state(config, catalog, state, **kwargs).result()
+
+    def submit_spec(self, use_cache: bool = True, **kwargs) -> "Future[List[AirbyteMessage]]":
+        cmd = "spec"
+        return self.submit(cmd=cmd, use_cache=use_cache, **kwargs)
+
+    def submit_check(self, config, use_cache: bool = True, **kwargs) -> "Future[List[AirbyteMessage]]":
+        cmd = "check --config tap_config.json"
+        return self.submit(cmd=cmd, config=config, use_cache=use_cache, **kwargs)
+
+    def submit_discover(self, config, use_cache: bool = True, **kwargs) -> "Future[List[AirbyteMessage]]":
+        cmd = "discover --config tap_config.json"
+        return self.submit(cmd=cmd, config=config, use_cache=use_cache, **kwargs)
+
+    def submit_read(self, config, catalog, use_cache: bool = True, **kwargs) -> "Future[List[AirbyteMessage]]":
+        cmd = "read --config tap_config.json --catalog catalog.json"
+        return self.submit(cmd=cmd, config=config, catalog=catalog, use_cache=use_cache, **kwargs)
+
+    def submit_read_with_state(self, config, catalog, state, use_cache: bool = True, **kwargs) -> "Future[List[AirbyteMessage]]":
         cmd = "read --config tap_config.json --catalog catalog.json --state state.json"
-        output = list(self.run(cmd=cmd, config=config, catalog=catalog, state=state, **kwargs))
-        return output
+        return self.submit(cmd=cmd, config=config, catalog=catalog, state=state, use_cache=use_cache, **kwargs)
+
+    def submit(
+        self,
+        cmd,
+        config=None,
+        state=None,
+        catalog=None,
+        use_cache: bool = True,
+        ahead: bool = False,
+        on_output: Optional[Callable[[List[AirbyteMessage]], None]] = None,
+        **kwargs,
+    ) -> "Future[List[AirbyteMessage]]":
+        """
+        Schedules a run of the connector and returns a future of its whole output.
+        With use_cache an identical run started ahead is taken over, and the output of a previous identical run is reused if
+        outputs are cached. Otherwise the command is always run and its output replaces the cached one.
+        With ahead the run is kept for the next identical call. on_output is called with the output of a successful run before
+        the future is resolved.
+        """
+        key = self._cache_key(cmd, config, state, catalog, **kwargs)
+        if self._cache is not None:
+            # identical calls reuse the cached output, runs started ahead don't need to be kept apart
+            return self._submit_cached(key, cmd, config, state, catalog, use_cache, on_output, **kwargs)
+
+        if ahead:
+            future = self._schedule(cmd, config, state, catalog, on_output, **kwargs)
+            with self._cache_lock:
+                self._started_runs.setdefault(key, []).append(future)
+            return future
+        if use_cache:
+            started_run = self._take_started_run(key)
+            if started_run:
+                return started_run
+        return self._schedule(cmd, config, state, catalog, on_output, **kwargs)
+
+    def _submit_cached(self, key, cmd, config, state, catalog, use_cache, on_output, **kwargs) -> "Future[List[AirbyteMessage]]":
+        with self._cache_lock:
+            if use_cache and key in self._cache:
+                return self._copy_output(self._cache[key])
+            future = self._schedule(cmd, config, state, catalog, on_output, **kwargs)
+            self._cache[key] = future
+        # registered outside of the lock, the callback runs right away when the command was run inline
+        future.add_done_callback(lambda done: self._forget_failure(key, done))
+        return self._copy_output(future)
+
+    def _take_started_run(self, key: str) -> Optional["Future[List[AirbyteMessage]]"]:
+        with self._cache_lock:
+            started_runs = self._started_runs.get(key)
+            if not started_runs:
+                return None
+            future = started_runs.pop(0)
+            if not started_runs:
+                del self._started_runs[key]
+            return future
+
+    def cancel_started_runs(self):
+        """Cancels the runs started ahead which no call took over, the ones already running are left to complete"""
+        with self._cache_lock:
+            started_runs = [future for futures in self._started_runs.values() for future in futures]
+            self._started_runs.clear()
+        for future in started_runs:
+            future.cancel()
+
+    def _forget_failure(self, key: str, future: "Future[List[AirbyteMessage]]"):
+        if future.exception():
+            with self._cache_lock:
+                # the output may have been replaced by a newer run meanwhile
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+
+    def _schedule(self, cmd, config, state, catalog, on_output=None, **kwargs) -> "Future[List[AirbyteMessage]]":
+        def run() -> List[AirbyteMessage]:
+            output = list(self.run(cmd, config=config, state=state, catalog=catalog, **kwargs))
+            if on_output:
+                on_output(output)
+            return output
+
+        if self._executor:
+            return self._executor.submit(run)
+
+        future = Future()
+        try:
+            future.set_result(run())
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def _cache_key(self, cmd, config, state, catalog, **kwargs) -> str:
+        inputs = {
+            "image": self._image.id,
+            "cmd": cmd,
+            # SecretDict isn't serializable, it would be rendered as a masked string
+            "config": dict(config) if config else config,
+            "state": state,
+            "catalog": catalog.dict(exclude_unset=True) if catalog else None,
+            "kwargs": kwargs,
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _copy_output(future: "Future[List[AirbyteMessage]]") -> "Future[List[AirbyteMessage]]":
+        """Gives every caller its own list of messages, so filtering an output in place doesn't affect the other users of the cache"""
+        copy = Future()
+
+        def on_done(done: Future):
+            if done.exception():
+                copy.set_exception(done.exception())
+            else:
+                copy.set_result(list(done.result()))
+
+        future.add_done_callback(on_done)
+        return copy
 
     def run(self, cmd, config=None, state=None, catalog=None, **kwargs) -> Iterable[AirbyteMessage]:
-        self._runs += 1
-        volumes = self._prepare_volumes(config, state, catalog)
-        logging.info("Docker run: \n%s\ninput: %s\noutput: %s", cmd, self.input_folder, self.output_folder)
+        """
+        Runs the connector and lazily yields the messages it outputs while it is still running.
+        The output is read and parsed by a background thread and written as is to the "raw" file of the output folder.
+        If the iteration is stopped before the end of the output, the container is killed.
+        """
+        input_folder, output_folder = self._next_run_folders()
+        volumes = self._prepare_volumes(input_folder, output_folder, config, state, catalog)
+        raw_output_path = output_folder / "raw"
+        logging.info("Docker run: \n%s\ninput: %s\noutput: %s", cmd, input_folder, output_folder)
+        container = self._client.containers.run(
+            image=self._image,
+            command=cmd,
+            working_dir="/data",
+            volumes=volumes,
+            network="host",
+            stdout=True,
+            stderr=True,
+            detach=True,
+            **kwargs,
+        )
+
+        messages = queue.Queue(maxsize=self.max_buffered_messages)
+        stop_reading = threading.Event()
+        reader = threading.Thread(target=self._read_output, args=(container, raw_output_path, messages, stop_reading), daemon=True)
+        reader.start()
+        output_exhausted = False
         try:
-            logs = self._client.containers.run(
-                image=self._image, command=cmd, working_dir="/data", volumes=volumes, network="host", stdout=True, stderr=True, **kwargs
-            )
-        except ContainerError as err:
-            # beautify error from container
-            patched_error = ContainerError(
-                container=err.container, exit_status=err.exit_status, command=err.command, image=err.image, stderr=err.stderr.decode()
-            )
-            raise patched_error from None  # get rid of any previous exception stack
-
-        with open(str(self.output_folder / "raw"), "wb+") as f:
-            f.write(logs)
-
-        for line in logs.decode("utf-8").splitlines():
             try:
-                yield AirbyteMessage.parse_raw(line)
-            except ValidationError as exc:
-                logging.warning("Unable to parse connector's output %s", exc)
+                while True:
+                    item = messages.get()
+                    if item is _END_OF_OUTPUT:
+                        output_exhausted = True
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                stop_reading.set()
+                if not output_exhausted:
+                    self._kill(container)
+                reader.join()
+
+            exit_status = container.wait()["StatusCode"]
+            if exit_status != 0:
+                # beautify error from container
+                stderr = container.logs(stdout=False, stderr=True).decode()
+                raise ContainerError(container=container, exit_status=exit_status, command=cmd, image=self._image, stderr=stderr)
+        finally:
+            # the container is detached, it is kept by docker until removed
+            self._remove(container)
+
+    @staticmethod
+    def _read_output(container: Container, raw_output_path: Path, messages: queue.Queue, stop_reading: threading.Event):
+        """
+        Follows the container's output until it exits, parsed messages are put in the messages queue
+        """
+
+        def put(item: Union[AirbyteMessage, Exception, object]) -> bool:
+            while not stop_reading.is_set():
+                try:
+                    messages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            pending_line = []
+            with open(str(raw_output_path), "wb") as raw_output:
+                for chunk in container.logs(stdout=True, stderr=True, stream=True, follow=True):
+                    raw_output.write(chunk)
+                    *lines, last_line = decoder.decode(chunk).split("\n")
+                    if lines:
+                        # the first line of the chunk completes the line started by the previous chunks
+                        lines[0] = "".join(pending_line) + lines[0]
+                        pending_line.clear()
+                    pending_line.append(last_line)
+                    for line in lines:
+                        message = ConnectorRunner._parse_message(line)
+                        if message and not put(message):
+                            return
+                message = ConnectorRunner._parse_message("".join(pending_line) + decoder.decode(b"", final=True))
+                if message and not put(message):
+                    return
+            put(_END_OF_OUTPUT)
+        except Exception as exc:
+            put(exc)
+
+    @staticmethod
+    def _parse_message(line: str) -> Optional[AirbyteMessage]:
+        if not line.strip():
+            return None
+        try:
+            return AirbyteMessage.parse_raw(line)
+        except ValidationError as exc:
+            logging.warning("Unable to parse connector's output %s", exc)
+            return None
+
+    @staticmethod
+    def _kill(container: Container):
+        try:
+            container.kill()
+        except APIError:
+            # the container has already exited
+            pass
+
+    @staticmethod
+    def _remove(container: Container):
+        try:
+            container.remove(force=True)
+        except APIError:
+            # the container is already being removed
+            pass
 
     @property
     def env_variables(self):
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+import pytest
+from airbyte_cdk.models import AirbyteMessage, AirbyteStream, ConfiguredAirbyteCatalog, Type
+
+from .common import SecretDict, full_refresh_only_catalog, load_configured_catalog
+from .connector_runner import ConnectorRunner
+
+
+class RunsAhead:
+    """
+    Starts the connector commands of the collected tests when the session starts, so the commands which don't depend on each other
+    run concurrently on the runner's executor. A test calling the same command with the same inputs takes over the run started ahead.
+
+    spec, check and discover are started right away. The reads of the basic read test and the first read of the full refresh test
+    use the schemas of the discovered catalog, they are started once the discover run of the session's catalog has completed.
+    Reads depending on the output of other reads, like the incremental ones, are run by the tests themselves.
+    """
+
+    def __init__(self, runner: ConnectorRunner, base_path: Path, items: Iterable[pytest.Item]):
+        self._runner = runner
+        self._base_path = base_path
+        self._items = items
+        # config of the discover run whose output makes the discovered catalog of the session
+        self._catalog_config: Optional[SecretDict] = None
+        # config, configured catalog path and transformation of the catalog of every read
+        self._reads: List[Tuple[SecretDict, Path, Callable[[ConfiguredAirbyteCatalog], ConfiguredAirbyteCatalog]]] = []
+        self._reads_started = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        specs, checks, discovers = 0, [], []
+        for item in self._items:
+            inputs = item.callspec.params.get("inputs") if hasattr(item, "callspec") else None
+            if inputs is None or not hasattr(item.cls, "config_key"):
+                # tests defined by the connector
+                continue
+            config_key = item.cls.config_key()
+            config = self._load_config(inputs) if getattr(inputs, "config_path", None) else None
+
+            if "actual_connector_spec" in item.fixturenames:
+                specs += 1
+            if config_key == "connection" and item.originalname == "test_check":
+                checks.append(config)
+            if config_key == "discovery" and item.originalname == "test_discover":
+                discovers.append(config)
+            if "discovered_catalog" in item.fixturenames and self._catalog_config is None and config is not None:
+                # the discovered catalog is built from the config of the first test using it, the runs are started in the same order
+                self._catalog_config = config
+                discovers.append(config)
+            if getattr(inputs, "configured_catalog_path", None):
+                catalog_path = self._base_path / inputs.configured_catalog_path
+                if config_key == "basic_read" and item.originalname == "test_read":
+                    self._reads.append((config, catalog_path, lambda catalog: catalog))
+                elif config_key == "full_refresh" and item.originalname == "test_sequential_reads":
+                    self._reads.append((config, catalog_path, full_refresh_only_catalog))
+
+        for _ in range(specs):
+            self._runner.submit_spec(ahead=True)
+        for config in checks:
+            self._runner.submit_check(config, ahead=True)
+        for config in discovers:
+            on_output = self._start_reads if config == self._catalog_config else None
+            self._runner.submit_discover(config, ahead=True, on_output=on_output)
+
+    def cancel(self):
+        """Cancels the runs which haven't been taken over by the tests and haven't started yet"""
+        self._runner.cancel_started_runs()
+
+    def _load_config(self, inputs: Any) -> SecretDict:
+        with open(str(self._base_path / inputs.config_path), "r") as file:
+            return SecretDict(json.loads(file.read()))
+
+    def _start_reads(self, output: List[AirbyteMessage]):
+        """Called with the output of the discover runs of the session's catalog, the tests get it once the reads are started"""
+        # the lock is held until the reads are started, so every discover run resolves after them
+        with self._lock:
+            if self._reads_started:
+                return
+            self._reads_started = True
+            catalogs = [message.catalog for message in output if message.type == Type.CATALOG]
+            if not catalogs:
+                # the discovery tests report it
+                return
+            discovered_streams: Mapping[str, AirbyteStream] = {stream.name: stream for stream in catalogs[-1].streams}
+            for config, catalog_path, transform in self._reads:
+                try:
+                    catalog = transform(load_configured_catalog(catalog_path, discovered_streams))
+                except Exception as exc:
+                    logging.warning("Unable to start the read of %s ahead: %s", catalog_path, exc)
+                    continue
+                self._runner.submit_read(config, catalog, ahead=True)
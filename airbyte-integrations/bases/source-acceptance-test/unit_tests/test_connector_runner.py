@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from airbyte_cdk.models import Type
+from docker.errors import ContainerError
+from source_acceptance_test.utils import ConnectorRunner, SecretDict
+
+
+def record_line(value: str) -> bytes:
+    message = {"type": "RECORD", "record": {"stream": "test_stream", "data": {"value": value}, "emitted_at": 1}}
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@pytest.fixture(name="container")
+def container_fixture():
+    container = MagicMock()
+    container.wait.return_value = {"StatusCode": 0}
+    return container
+
+
+@pytest.fixture(name="runner")
+def runner_fixture(mocker, tmp_path, container):
+    client = MagicMock()
+    client.containers.run.return_value = container
+    mocker.patch("source_acceptance_test.utils.connector_runner.docker.from_env", return_value=client)
+    return ConnectorRunner("image:dev", volume=tmp_path)
+
+
+def test_run_parses_output_split_across_chunks(runner, container):
+    output = record_line("first") + b"not a message\n" + record_line("sécond")
+    # split in the middle of lines and of a multi-byte character
+    split_at = output.index("é".encode("utf-8")) + 1
+    container.logs.return_value = iter([output[:10], output[10:split_at], output[split_at:]])
+
+    messages = runner.call_read(config={}, catalog=None)
+
+    assert [message.type for message in messages] == [Type.RECORD, Type.RECORD]
+    assert [message.record.data["value"] for message in messages] == ["first", "sécond"]
+    assert (runner.output_folder / "raw").read_bytes() == output
+    container.kill.assert_not_called()
+    container.remove.assert_called_once_with(force=True)
+
+
+def test_run_raises_container_error(runner, container):
+    container.wait.return_value = {"StatusCode": 1}
+    container.logs.side_effect = lambda stream=False, **kwargs: iter([record_line("first")]) if stream else b"Traceback"
+
+    with pytest.raises(ContainerError, match="Traceback"):
+        runner.call_check(config={})
+    container.remove.assert_called_once_with(force=True)
+
+
+def test_run_stops_container_when_iteration_stops(runner, container):
+    killed = threading.Event()
+    container.kill.side_effect = killed.set
+
+    def endless_output(**kwargs):
+        while not killed.is_set():
+            yield record_line("value")
+
+    container.logs.side_effect = endless_output
+    runner.max_buffered_messages = 10
+
+    for index, message in enumerate(runner.run("read")):
+        if index == 100:
+            break
+
+    assert killed.is_set()
+    container.wait.assert_not_called()
+    container.remove.assert_called_once_with(force=True)
+
+
+def test_submit_reuses_cached_output(mocker, tmp_path, container):
+    client = MagicMock()
+    client.containers.run.return_value = container
+    container.logs.side_effect = lambda **kwargs: iter([record_line("first")])
+    mocker.patch("source_acceptance_test.utils.connector_runner.docker.from_env", return_value=client)
+    cache = {}
+    runner = ConnectorRunner("image:dev", volume=tmp_path / "first", cache=cache)
+    other_runner = ConnectorRunner("image:dev", volume=tmp_path / "second", cache=cache)
+
+    output = runner.call_read(config={"key": "value"}, catalog=None)
+    output.clear()
+    cached_output = other_runner.call_read(config={"key": "value"}, catalog=None)
+    other_output = other_runner.call_read(config={"key": "other value"}, catalog=None)
+    fresh_output = runner.call_read(config={"key": "value"}, catalog=None, use_cache=False)
+
+    assert [message.record.data["value"] for message in cached_output] == ["first"]
+    assert len(other_output) == len(fresh_output) == 1
+    assert client.containers.run.call_count == 3
+
+
+def test_submit_does_not_cache_failures(mocker, tmp_path, container):
+    client = MagicMock()
+    client.containers.run.return_value = container
+    container.wait.side_effect = [{"StatusCode": 1}, {"StatusCode": 0}]
+    container.logs.side_effect = lambda stream=False, **kwargs: iter([record_line("first")]) if stream else b"Traceback"
+    mocker.patch("source_acceptance_test.utils.connector_runner.docker.from_env", return_value=client)
+    cache = {}
+    runner = ConnectorRunner("image:dev", volume=tmp_path, cache=cache)
+
+    with pytest.raises(ContainerError):
+        runner.call_check(config={})
+    assert not cache
+    assert len(runner.call_check(config={})) == 1
+    assert len(runner.call_check(config={})) == 1
+    assert client.containers.run.call_count == 2
+
+
+def test_submit_runs_on_executor(mocker, tmp_path, container):
+    started = threading.Barrier(2, timeout=5)
+
+    def output(**kwargs):
+        # both runs have to be started for either of them to complete
+        started.wait()
+        yield record_line("value")
+
+    container.logs.side_effect = output
+    client = MagicMock()
+    client.containers.run.return_value = container
+    mocker.patch("source_acceptance_test.utils.connector_runner.docker.from_env", return_value=client)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        runner = ConnectorRunner("image:dev", volume=tmp_path, executor=executor)
+        first_read = runner.submit_read(config={}, catalog=None)
+        second_read = runner.submit_read(config={}, catalog=None)
+
+        assert len(first_read.result()) == len(second_read.result()) == 1
+    assert {path.name for path in tmp_path.iterdir()} == {"run_1", "run_2"}
+
+
+def test_submit_takes_over_run_started_ahead(mocker, tmp_path, container):
+    client = MagicMock()
+    client.containers.run.return_value = container
+    container.logs.side_effect = lambda **kwargs: iter([record_line("value")])
+    mocker.patch("source_acceptance_test.utils.connector_runner.docker.from_env", return_value=client)
+    started_runs = {}
+    outputs = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ahead_runner = ConnectorRunner("image:dev", volume=tmp_path / "ahead", executor=executor, started_runs=started_runs)
+        runner = ConnectorRunner("image:dev", volume=tmp_path / "test", executor=executor, started_runs=started_runs)
+        started = ahead_runner.submit_read(config=SecretDict({"key": "value"}), catalog=None, ahead=True, on_output=outputs.append)
+
+        assert runner.submit_read(config=SecretDict({"key": "value"}), catalog=None) is started
+        assert len(started.result()) == 1
+        assert outputs == [started.result()]
+        assert not started_runs
+        # the inputs differ, the masked representation of the configs is the same
+        assert len(runner.call_read(config=SecretDict({"key": "other value"}), catalog=None)) == 1
+    assert client.containers.run.call_count == 2
+
+
+def test_submit_runs_again_when_cache_is_not_used(mocker, tmp_path, container):
+    client = MagicMock()
+    client.containers.run.return_value = container
+    container.logs.side_effect = lambda **kwargs: iter([record_line("value")])
+    mocker.patch("source_acceptance_test.utils.connector_runner.docker.from_env", return_value=client)
+    started_runs = {}
+    runner = ConnectorRunner("image:dev", volume=tmp_path, started_runs=started_runs)
+
+    started = runner.submit_check(config={}, ahead=True)
+    assert runner.submit_check(config={}, use_cache=False) is not started
+    assert client.containers.run.call_count == 2
+    runner.cancel_started_runs()
+    assert not started_runs
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from airbyte_cdk.models import AirbyteCatalog, AirbyteMessage, AirbyteStream, SyncMode, Type
+from source_acceptance_test.config import BasicReadTestConfig, ConnectionTestConfig, DiscoveryTestConfig, FullRefreshConfig
+from source_acceptance_test.tests.test_core import TestBasicRead as _TestBasicRead
+from source_acceptance_test.tests.test_core import TestConnection as _TestConnection
+from source_acceptance_test.tests.test_core import TestDiscovery as _TestDiscovery
+from source_acceptance_test.tests.test_full_refresh import TestFullRefresh as _TestFullRefresh
+from source_acceptance_test.utils import RunsAhead, SecretDict
+
+
+def make_item(cls, name, inputs, fixturenames=()):
+    return SimpleNamespace(cls=cls, originalname=name, callspec=SimpleNamespace(params={"inputs": inputs}), fixturenames=list(fixturenames))
+
+
+def test_runs_ahead(tmp_path):
+    (tmp_path / "config.json").write_text(json.dumps({"key": "value"}))
+    (tmp_path / "invalid_config.json").write_text(json.dumps({"key": "invalid"}))
+    stream = {"name": "users", "json_schema": {}, "supported_sync_modes": ["full_refresh"]}
+    configured_catalog = {"streams": [{"stream": stream, "sync_mode": "incremental", "destination_sync_mode": "append"}]}
+    (tmp_path / "catalog.json").write_text(json.dumps(configured_catalog))
+    read_fixtures = ["connector_config", "configured_catalog", "discovered_catalog"]
+    items = [
+        make_item(_TestConnection, "test_check", ConnectionTestConfig(config_path="config.json")),
+        make_item(_TestConnection, "test_check", ConnectionTestConfig(config_path="invalid_config.json", status="failed")),
+        make_item(_TestDiscovery, "test_discover", DiscoveryTestConfig(config_path="config.json")),
+        make_item(
+            _TestDiscovery, "test_defined_cursors_exist_in_schema", DiscoveryTestConfig(config_path="config.json"), ["discovered_catalog"]
+        ),
+        make_item(
+            _TestBasicRead,
+            "test_read",
+            BasicReadTestConfig(config_path="config.json", configured_catalog_path="catalog.json"),
+            read_fixtures,
+        ),
+        make_item(
+            _TestFullRefresh,
+            "test_sequential_reads",
+            FullRefreshConfig(config_path="config.json", configured_catalog_path="catalog.json"),
+            read_fixtures,
+        ),
+        # defined by the connector, it isn't parametrized with inputs
+        SimpleNamespace(cls=None, originalname="test_custom", fixturenames=[]),
+    ]
+    runner = MagicMock()
+    runs_ahead = RunsAhead(runner, tmp_path, items)
+
+    runs_ahead.start()
+
+    assert [call.args for call in runner.submit_check.call_args_list] == [
+        (SecretDict({"key": "value"}),),
+        (SecretDict({"key": "invalid"}),),
+    ]
+    # run by the discovery test, then for the discovered catalog of the session
+    assert runner.submit_discover.call_count == 2
+    runner.submit_spec.assert_not_called()
+    runner.submit_read.assert_not_called()
+
+    discovered_stream = AirbyteStream(name="users", json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh])
+    discover_output = [AirbyteMessage(type=Type.CATALOG, catalog=AirbyteCatalog(streams=[discovered_stream]))]
+    for call in runner.submit_discover.call_args_list:
+        call.kwargs["on_output"](discover_output)
+
+    assert runner.submit_read.call_count == 2
+    (basic_read_config, basic_read_catalog), (full_refresh_config, full_refresh_catalog) = [
+        call.args for call in runner.submit_read.call_args_list
+    ]
+    assert basic_read_config == full_refresh_config == SecretDict({"key": "value"})
+    assert basic_read_catalog.streams[0].stream == discovered_stream
+    assert basic_read_catalog.streams[0].sync_mode == SyncMode.incremental
+    assert full_refresh_catalog.streams[0].sync_mode == SyncMode.full_refresh
+    assert all(call.kwargs["ahead"] for call in runner.submit_read.call_args_list)
+
+    runs_ahead.cancel()
+    runner.cancel_started_runs.assert_called_once()
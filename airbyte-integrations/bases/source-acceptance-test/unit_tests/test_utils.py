@@ -3,7 +3,7 @@
 #
 
 import pytest
-from source_acceptance_test.utils.compare import serialize
+from source_acceptance_test.utils.compare import RecordIndex, canonical_digest, closest_record, serialize
 
 
 @pytest.fixture(name="not_sorted_data")
@@ -86,3 +86,34 @@ def test_compare_two_records(not_sorted_data, sorted_data):
     """Test that compare two records with equals, not sorted data."""
     output_diff = set(map(serialize, sorted_data)) - set(map(serialize, not_sorted_data))
     assert not output_diff
+
+
+def test_record_index_ignores_lists_order(not_sorted_data, sorted_data):
+    assert not RecordIndex(sorted_data).difference(RecordIndex(not_sorted_data))
+    assert sorted_data[0] in RecordIndex(not_sorted_data)
+
+
+@pytest.mark.parametrize(
+    "left,right,equal",
+    [
+        ({"a": 1, "b": [1, 2]}, {"b": [2, 1], "a": "1"}, True),
+        ({"a": {"b": [{"c": 1}, {"d": 2}]}}, {"a": {"b": [{"d": 2}, {"c": 1}]}}, True),
+        ({"a": [1, 2]}, {"a": "[1, 2]"}, False),
+        ({"a": "b", "c": ""}, {"a": "", "c": "b"}, False),
+        ({"a": [["b"], "c"]}, {"a": [["b", "c"]]}, False),
+        ({"a": {}}, {"a": []}, False),
+    ],
+)
+def test_canonical_digest(left, right, equal):
+    assert (canonical_digest(left) == canonical_digest(right)) is equal
+    assert (hash(serialize(left)) == hash(serialize(right))) is equal
+
+
+def test_record_index_reports_only_differing_records():
+    actual = [{"id": index, "value": "same"} for index in range(1000)]
+    expected = actual[:10] + [{"id": 10, "value": "changed"}]
+
+    missing = RecordIndex(expected).difference(RecordIndex(actual))
+
+    assert missing == [{"id": 10, "value": "changed"}]
+    assert closest_record(missing[0], actual) == {"id": 10, "value": "same"}
@@ -11,9 +11,16 @@ class KvDbClient:
     base_url = "https://kvdb.io"
     PAGE_SIZE = 1000
 
-    def __init__(self, bucket_id: str, secret_key: str = None):
+    def __init__(self, bucket_id: str, secret_key: str = None, pool_size: int = 10):
+        """
+        :param pool_size: number of connections kept open, should match the number of threads using the client concurrently
+        """
         self.secret_key = secret_key
         self.bucket_id = bucket_id
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def write(self, key: str, value: Mapping[str, Any]):
         return self.batch_write([(key, value)])
@@ -34,24 +41,30 @@ class KvDbClient:
         offset = 0
 
         while not pagination_complete:
-            response = self._request(
-                "GET",
-                params={
-                    "limit": self.PAGE_SIZE,
-                    "skip": offset,
-                    "format": "json",
-                    "prefix": prefix or "",
-                    "values": "true" if list_values else "false",
-                },
-                endpoint="/",  # the "list" endpoint doesn't work without adding a trailing slash to the URL
-            )
-
-            response_json = response.json()
+            response_json = self.list_keys_page(offset, list_values=list_values, prefix=prefix)
             yield from response_json
 
             pagination_complete = len(response_json) < self.PAGE_SIZE
             offset += self.PAGE_SIZE
 
+    def list_keys_page(self, offset: int, list_values: bool = False, prefix: str = None) -> List[Union[str, List]]:
+        """
+        Lists at most PAGE_SIZE keys, skipping the first `offset` ones.
+        https://kvdb.io/docs/api/#list-keys
+        """
+        response = self._request(
+            "GET",
+            params={
+                "limit": self.PAGE_SIZE,
+                "skip": offset,
+                "format": "json",
+                "prefix": prefix or "",
+                "values": "true" if list_values else "false",
+            },
+            endpoint="/",  # the "list" endpoint doesn't work without adding a trailing slash to the URL
+        )
+        return response.json()
+
     def delete(self, key: Union[str, List[str]]):
         """
         https://kvdb.io/docs/api/#execute-transaction
@@ -72,7 +85,7 @@ class KvDbClient:
         url = self._get_base_url() + (endpoint or "")
         headers = {"Accept": "application/json", **self._get_auth_headers()}
 
-        response = requests.request(method=http_method, params=params, url=url, headers=headers, json=json)
+        response = self._session.request(method=http_method, params=params, url=url, headers=headers, json=json)
 
         response.raise_for_status()
         return response
@@ -6,51 +6,74 @@
 import time
 import traceback
 import uuid
-from typing import Any, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, Union
 
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.destinations import Destination
-from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
+from airbyte_cdk.destinations import BufferedDestination, DestinationRecord, FlushPolicy
+from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status
 from destination_kvdb.client import KvDbClient
 from destination_kvdb.writer import KvDbWriter
 
 
-class DestinationKvdb(Destination):
+class DestinationKvdb(BufferedDestination):
+    """
+    Records are buffered per stream by the CDK and written with one transaction per KvDbWriter.flush_interval records,
+    using up to max_flush_workers concurrent transactions while the input is still being read.
+    State messages are emitted by the CDK once every record which came before them has been written.
+
+    Streams synced in overwrite mode are cleared in the background while records are written: only records written before
+    the sync started are deleted. Up to max_flush_workers streams are cleared at once, and the first state message is only
+    emitted once every overwritten stream has been cleared.
+    """
+
+    flush_policy = FlushPolicy(max_records=KvDbWriter.flush_interval)
+    max_flush_workers = 4
+    preserve_stream_order = True
+
     def write(
-        self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
+        self,
+        config: Mapping[str, Any],
+        configured_catalog: ConfiguredAirbyteCatalog,
+        input_messages: Iterable[Union[AirbyteMessage, DestinationRecord]],
     ) -> Iterable[AirbyteMessage]:
+        # created here rather than in on_sync_start so it is shut down whatever happens during the sync
+        self._deletion_executor = ThreadPoolExecutor(max_workers=self.max_flush_workers, thread_name_prefix="kvdb-overwrite")
+        self._deletions: List[Future] = []
+        try:
+            for message in super().write(config, configured_catalog, input_messages):
+                self._wait_for_deletions()
+                yield message
+        finally:
+            # deletions which haven't started yet are dropped when the sync fails
+            for deletion in self._deletions:
+                deletion.cancel()
+            self._deletion_executor.shutdown()
 
-        """
-        Reads the input stream of messages, config, and catalog to write data to the destination.
-
-        This method returns an iterable (typically a generator of AirbyteMessages via yield) containing state messages received
-        in the input message stream. Outputting a state message means that every AirbyteRecordMessage which came before it has been
-        successfully persisted to the destination. This is used to ensure fault tolerance in the case that a sync fails before fully completing,
-        then the source is given the last state message output from this method as the starting point of the next sync.
-        """
-        writer = KvDbWriter(KvDbClient(**config))
+    def on_sync_start(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        sync_started_at = time.time_ns() / 1_000_000  # convert from nanoseconds to milliseconds
+        # connections are shared between the flush workers and the deletion workers
+        self._writer = KvDbWriter(KvDbClient(**config, pool_size=self.max_flush_workers * 2))
 
         for configured_stream in configured_catalog.streams:
             if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                writer.delete_stream_entries(configured_stream.stream.name)
+                self._deletions.append(
+                    self._deletion_executor.submit(
+                        self._writer.delete_stream_entries, configured_stream.stream.name, written_before=sync_started_at
+                    )
+                )
 
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                writer.flush()
-                yield message
-            elif message.type == Type.RECORD:
-                record = message.record
-                writer.queue_write_operation(
-                    record.stream, record.data, time.time_ns() / 1_000_000
-                )  # convert from nanoseconds to milliseconds
-            else:
-                # ignore other message types for now
-                continue
+    def flush_records(self, config: Mapping[str, Any], stream_name: str, records: List[DestinationRecord]):
+        self._writer.write_records(stream_name, (record.data for record in records))
+
+    def on_sync_end(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        self._wait_for_deletions()
 
-        # Make sure to flush any records still in the queue
-        writer.flush()
+    def _wait_for_deletions(self):
+        """Blocks until the overwritten streams are cleared, re-raises any failed deletion"""
+        while self._deletions:
+            self._deletions[0].result()
+            self._deletions.pop(0)
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -2,7 +2,9 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from collections import Mapping
+import threading
+import time
+from typing import Iterable, List, Mapping
 
 from destination_kvdb.client import KvDbClient
 
@@ -18,29 +20,53 @@ class KvDbWriter:
     read messages with a particular prefix e.g: name__ab__123, where 123 is the timestamp they last read data from.
     """
 
-    write_buffer = []
     flush_interval = 1000
 
     def __init__(self, client: KvDbClient):
         self.client = client
+        self._last_written_at = 0.0
+        self._written_at_lock = threading.Lock()
 
-    def delete_stream_entries(self, stream_name: str):
-        """ Deletes all the records belonging to the input stream """
-        keys_to_delete = []
-        for key in self.client.list_keys(prefix=f"{stream_name}__ab__"):
-            keys_to_delete.append(key)
-            if len(keys_to_delete) == self.flush_interval:
+    def delete_stream_entries(self, stream_name: str, written_before: float = None):
+        """
+        Deletes all the records belonging to the input stream, one page of listed keys at a time.
+
+        :param written_before: only delete records written before this timestamp (in milliseconds), so deletion can run while
+        records of the current sync are already being written
+        """
+        prefix = f"{stream_name}__ab__"
+        offset = 0
+        while True:
+            keys = self.client.list_keys_page(offset, prefix=prefix)
+            keys_to_delete = [key for key in keys if written_before is None or self._written_at(key, prefix) < written_before]
+            if keys_to_delete:
                 self.client.delete(keys_to_delete)
-                keys_to_delete.clear()
-        if len(keys_to_delete) > 0:
-            self.client.delete(keys_to_delete)
-
-    def queue_write_operation(self, stream_name: str, record: Mapping, written_at: int):
-        kv_pair = (f"{stream_name}__ab__{written_at}", record)
-        self.write_buffer.append(kv_pair)
-        if len(self.write_buffer) == self.flush_interval:
-            self.flush()
-
-    def flush(self):
-        self.client.batch_write(self.write_buffer)
-        self.write_buffer.clear()
+            if len(keys) < self.client.PAGE_SIZE:
+                return
+            # deleted keys are no longer listed, only the kept ones have to be skipped
+            offset += len(keys) - len(keys_to_delete)
+
+    def write_records(self, stream_name: str, records: Iterable[Mapping]):
+        """ Writes a batch of records in a single transaction """
+        kv_pairs: List = []
+        for record in records:
+            kv_pairs.append((f"{stream_name}__ab__{self._next_written_at()}", record))
+        self.client.batch_write(kv_pairs)
+
+    def _next_written_at(self) -> float:
+        """
+        Returns the current time in milliseconds. Batches are written from several threads,
+        so the value is forced to increase strictly to keep keys unique and ordered.
+        """
+        with self._written_at_lock:
+            written_at = max(time.time_ns() / 1_000_000, self._last_written_at + 0.001)  # convert from nanoseconds to milliseconds
+            self._last_written_at = written_at
+            return written_at
+
+    @staticmethod
+    def _written_at(key: str, prefix: str) -> float:
+        try:
+            return float(key[len(prefix) :])
+        except ValueError:
+            # not written by this connector, e.g. a stream whose name starts with this stream's prefix
+            return float("inf")
@@ -2,6 +2,141 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_kvdb.destination import DestinationKvdb
+from destination_kvdb.writer import KvDbWriter
+
+
+class FakeClient:
+    """In memory KvDbClient, keys are listed in lexicographic order like kvdb does"""
+
+    PAGE_SIZE = 3
+
+    def __init__(self, keys: List[str] = None):
+        self.store = {key: {} for key in keys or []}
+        self.deletions: List[List[str]] = []
+        self._lock = threading.Lock()
+
+    def batch_write(self, keys_and_values):
+        with self._lock:
+            self.store.update(keys_and_values)
+
+    def list_keys_page(self, offset: int, list_values: bool = False, prefix: str = None) -> List[str]:
+        with self._lock:
+            return sorted(key for key in self.store if key.startswith(prefix or ""))[offset : offset + self.PAGE_SIZE]
+
+    def delete(self, keys: List[str]):
+        with self._lock:
+            self.deletions.append(keys)
+            for key in keys:
+                del self.store[key]
+
 
 def test_example_method():
     assert True
+
+
+def test_write_records_generates_unique_increasing_keys():
+    client = FakeClient()
+    writer = KvDbWriter(client)
+    with patch("destination_kvdb.writer.time.time_ns", return_value=1_600_000_000_000_000_000):
+        writer.write_records("users", [{"id": 1}, {"id": 2}])
+        writer.write_records("users", [{"id": 3}])
+
+    keys = list(client.store)
+    assert all(key.startswith("users__ab__") for key in keys)
+    written_at = [float(key[len("users__ab__") :]) for key in keys]
+    assert written_at[0] == 1_600_000_000_000
+    assert written_at == sorted(set(written_at))
+
+
+def test_delete_stream_entries_only_deletes_records_written_before():
+    old_keys = [f"users__ab__{1000 + i}.5" for i in range(5)]
+    new_keys = ["users__ab__3000.0", "users__ab__3001.0"]
+    other_keys = ["users__ab__not_a_timestamp", "orders__ab__1000.0"]
+    client = FakeClient(old_keys + new_keys + other_keys)
+
+    KvDbWriter(client).delete_stream_entries("users", written_before=2000)
+
+    assert sorted(client.store) == sorted(new_keys + other_keys)
+    # one transaction per listed page, the keys kept on a page don't hide the next ones
+    assert client.deletions == [old_keys[:3], old_keys[3:]]
+
+
+def test_delete_stream_entries_deletes_every_key_of_the_stream():
+    client = FakeClient([f"users__ab__{1000 + i}.0" for i in range(7)] + ["orders__ab__1000.0"])
+
+    KvDbWriter(client).delete_stream_entries("users")
+
+    assert list(client.store) == ["orders__ab__1000.0"]
+    assert [len(keys) for keys in client.deletions] == [3, 3, 1]
+
+
+def configured_catalog(destination_sync_mode: DestinationSyncMode) -> ConfiguredAirbyteCatalog:
+    stream = AirbyteStream(name="users", json_schema={}, supported_sync_modes=[SyncMode.full_refresh])
+    return ConfiguredAirbyteCatalog(
+        streams=[ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=destination_sync_mode)]
+    )
+
+
+def messages(records: int) -> List[AirbyteMessage]:
+    return [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": index}, emitted_at=0))
+        for index in range(records)
+    ] + [AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"id": records}))]
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    client = FakeClient(["users__ab__1000.0", "users__ab__1001.0"])
+    with patch("destination_kvdb.destination.KvDbClient", side_effect=lambda **kwargs: client):
+        yield client
+
+
+def test_write_overwrite_clears_previous_records_before_emitting_state(client: FakeClient):
+    released = threading.Event()
+    delete = client.delete
+
+    def delete_when_released(keys):
+        released.wait(5)
+        delete(keys)
+
+    client.delete = delete_when_released
+    output = DestinationKvdb().write({"bucket_id": "bucket"}, configured_catalog(DestinationSyncMode.overwrite), messages(5))
+    threading.Timer(0.2, released.set).start()
+
+    assert [message.type for message in output] == [Type.STATE]
+    assert sorted(client.store.values(), key=lambda data: data["id"]) == [{"id": index} for index in range(5)]
+
+
+def test_write_append_keeps_previous_records(client: FakeClient):
+    output = list(DestinationKvdb().write({"bucket_id": "bucket"}, configured_catalog(DestinationSyncMode.append), messages(2)))
+
+    assert [message.type for message in output] == [Type.STATE]
+    assert len(client.store) == 4
+
+
+def test_write_fails_before_emitting_state_when_deletion_fails(client: FakeClient):
+    def failing_delete(keys: List[str]):
+        raise RuntimeError("delete failed")
+
+    client.delete = failing_delete
+    output = DestinationKvdb().write({"bucket_id": "bucket"}, configured_catalog(DestinationSyncMode.overwrite), messages(2))
+
+    with pytest.raises(RuntimeError, match="delete failed"):
+        next(iter(output))
@@ -2,12 +2,12 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping, Tuple
+from typing import Any, Iterator, List, Mapping, MutableMapping, Set, Tuple
 
 import boto3
 import requests
 from airbyte_cdk.logger import AirbyteLogger
-from airbyte_cdk.models import ConnectorSpecification
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from pydantic import Field
@@ -23,6 +23,7 @@ from source_amazon_seller_partner.streams import (
     FulfilledShipmentsReports,
     MerchantListingsReports,
     Orders,
+    ReportsAmazonSPStream,
     VendorDirectFulfillmentShipping,
     VendorInventoryHealthReports,
 )
@@ -52,6 +53,9 @@ class ConnectorConfig(BaseModel):
 
 
 class SourceAmazonSellerPartner(AbstractSource):
+    # names of the report streams whose reports are requested as soon as the streams are created
+    _reports_to_request: Set[str] = frozenset()
+
     def _get_stream_kwargs(self, config: ConnectorConfig) -> Mapping[str, Any]:
         endpoint, marketplace_id, region = get_marketplaces(config.aws_environment)[config.region]
 
@@ -111,7 +115,7 @@ class SourceAmazonSellerPartner(AbstractSource):
         config = ConnectorConfig.parse_obj(config)  # FIXME: this will be not need after we fix CDK
         stream_kwargs = self._get_stream_kwargs(config)
 
-        return [
+        streams = [
             FbaInventoryReports(**stream_kwargs),
             FbaOrdersReports(**stream_kwargs),
             FbaShipmentsReports(**stream_kwargs),
@@ -123,6 +127,23 @@ class SourceAmazonSellerPartner(AbstractSource):
             VendorInventoryHealthReports(**stream_kwargs),
             Orders(**stream_kwargs),
         ]
+        for stream in streams:
+            if isinstance(stream, ReportsAmazonSPStream) and stream.name in self._reports_to_request:
+                stream.request_report()
+        return streams
+
+    def read(
+        self, logger: AirbyteLogger, config: Mapping[str, Any], catalog: ConfiguredAirbyteCatalog, state: MutableMapping[str, Any] = None
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Requests the reports of all the configured report streams before the first stream is read,
+        so Amazon processes them concurrently instead of one after the other.
+        """
+        self._reports_to_request = {configured_stream.stream.name for configured_stream in catalog.streams}
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            self._reports_to_request = frozenset()
 
     def spec(self, *args, **kwargs) -> ConnectorSpecification:
         """
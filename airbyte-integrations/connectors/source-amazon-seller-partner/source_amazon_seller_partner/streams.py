@@ -8,8 +8,7 @@ import json as json_lib
 import time
 import zlib
 from abc import ABC, abstractmethod
-from io import StringIO
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
 
 import pendulum
 import requests
@@ -122,13 +121,19 @@ class ReportsAmazonSPStream(Stream, ABC):
         - retrieve the report;
         - retry the retrieval if the report is still not fully processed;
         - retrieve the report document (if report processing status is `DONE`);
-        - decrypt the report document (if report processing status is `DONE`);
-        - yield the report document (if report processing status is `DONE`)
+        - download, decrypt and decompress the report document chunk by chunk (if report processing status is `DONE`);
+        - yield the report document records as they are decoded (if report processing status is `DONE`)
+
+    The report can be requested ahead of reading the stream with `request_report`, so that Amazon processes the reports of
+    every stream concurrently while the previous streams are read.
     """
 
     primary_key = None
     path_prefix = f"/reports/{REPORTS_API_VERSION}"
+    # the report status is polled with an exponential backoff, starting at `min_sleep_seconds` and capped at `sleep_seconds`
+    min_sleep_seconds = 1
     sleep_seconds = 30
+    document_chunk_size = 1024 * 1024
     data_field = "payload"
 
     def __init__(
@@ -145,6 +150,8 @@ class ReportsAmazonSPStream(Stream, ABC):
         self._session.auth = aws_signature
         self._replication_start_date = replication_start_date
         self.marketplace_ids = marketplace_ids
+        self._report_id: Optional[str] = None
+        self._report_requested_at: Optional[pendulum.DateTime] = None
 
     @property
     def url_base(self) -> str:
@@ -221,25 +228,76 @@ class ReportsAmazonSPStream(Stream, ABC):
         report_payload = retrieve_report_response.json().get(self.data_field, {})
         return report_payload
 
+    def request_report(self):
+        """
+        Requests the creation of the report if it isn't requested yet, the report is then processed by Amazon until it is read.
+        A failed request is only logged, the creation is attempted again when the stream is read.
+        """
+        if self._report_id:
+            return
+        try:
+            self._report_id = self._create_report()["reportId"]
+            self._report_requested_at = pendulum.now("utc")
+        except Exception as e:
+            logger.warn(f"Unable to request the report of stream `{self.name}` ahead of reading it: {e!r}")
+
     @staticmethod
     def decrypt_aes(content, key, iv):
-        key = base64.b64decode(key)
-        iv = base64.b64decode(iv)
-        decrypter = AES.new(key, AES.MODE_CBC, iv)
-        decrypted = decrypter.decrypt(content)
-        padding_bytes = decrypted[-1]
-        return decrypted[:-padding_bytes]
-
-    def decrypt_report_document(self, url, initialization_vector, key, encryption_standard, payload):
+        return b"".join(ReportsAmazonSPStream.decrypt_aes_chunks([content], key, iv))
+
+    @staticmethod
+    def decrypt_aes_chunks(chunks: Iterable[bytes], key, iv) -> Iterator[bytes]:
+        """
+        Decrypts AES-CBC encrypted content chunk by chunk, chunks may have any size.
+        The last block is held back until the end of the content to strip its padding.
+        """
+        decrypter = AES.new(base64.b64decode(key), AES.MODE_CBC, base64.b64decode(iv))
+        pending = b""
+        for chunk in chunks:
+            pending += chunk
+            decryptable_size = (len(pending) - 1) // AES.block_size * AES.block_size
+            if decryptable_size > 0:
+                yield decrypter.decrypt(pending[:decryptable_size])
+                pending = pending[decryptable_size:]
+        if pending:
+            decrypted = decrypter.decrypt(pending)
+            padding_bytes = decrypted[-1]
+            yield decrypted[:-padding_bytes]
+
+    @staticmethod
+    def decompress_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Decompresses zlib or gzip compressed content chunk by chunk"""
+        decompressor = zlib.decompressobj(15 + 32)
+        for chunk in chunks:
+            yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    @staticmethod
+    def split_lines(chunks: Iterable[str]) -> Iterator[str]:
+        """Splits text chunks into lines ending with their line feed, the way iterating over a text file does"""
+        pending = ""
+        for chunk in chunks:
+            *lines, pending = (pending + chunk).split("\n")
+            for line in lines:
+                yield line + "\n"
+        if pending:
+            yield pending
+
+    def decrypt_report_document(self, url, initialization_vector, key, encryption_standard, payload) -> Iterator[str]:
         """
-        Decrypts and unpacks a report document, currently AES encryption is implemented
+        Streams a report document: downloads, decrypts and unpacks it chunk by chunk, currently AES encryption is implemented
+        :return: iterator over the text chunks of the document
         """
-        if encryption_standard == "AES":
-            decrypted = self.decrypt_aes(requests.get(url).content, key, initialization_vector)
+        if encryption_standard != "AES":
+            raise Exception([{"message": "Only AES decryption is implemented."}])
+
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            chunks = self.decrypt_aes_chunks(response.iter_content(chunk_size=self.document_chunk_size), key, initialization_vector)
             if "compressionAlgorithm" in payload:
-                return zlib.decompress(bytearray(decrypted), 15 + 32).decode("iso-8859-1")
-            return decrypted.decode("iso-8859-1")
-        raise Exception([{"message": "Only AES decryption is implemented."}])
+                chunks = self.decompress_chunks(chunks)
+            for chunk in chunks:
+                yield chunk.decode("iso-8859-1")
 
     def parse_response(self, response: requests.Response) -> Iterable[Mapping]:
         payload = response.json().get(self.data_field, {})
@@ -251,30 +309,36 @@ class ReportsAmazonSPStream(Stream, ABC):
             payload,
         )
 
-        document_records = csv.DictReader(StringIO(document), delimiter="\t")
+        document_records = csv.DictReader(self.split_lines(document), delimiter="\t")
         yield from document_records
 
-    def read_records(self, *args, **kwargs) -> Iterable[Mapping[str, Any]]:
+    def _wait_for_report(self, report_id: str) -> Mapping[str, Any]:
         """
-        Create and retrieve the report.
-        Decrypt and parse the report is its fully proceed, then yield the report document records.
+        Polls the report until it is processed or REPORTS_MAX_WAIT_SECONDS have passed since it was requested.
+        The delay between two polls doubles from `min_sleep_seconds` up to `sleep_seconds`.
         """
-        report_payload = {}
-        is_processed = False
-        is_done = False
-        start_time = pendulum.now("utc")
-        seconds_waited = 0
-        report_id = self._create_report()["reportId"]
-
-        # create and retrieve the report
-        while not is_processed and seconds_waited < REPORTS_MAX_WAIT_SECONDS:
+        sleep_seconds = self.min_sleep_seconds
+        while True:
             report_payload = self._retrieve_report(report_id=report_id)
-            seconds_waited = (pendulum.now("utc") - start_time).seconds
-            is_processed = report_payload.get("processingStatus") not in ["IN_QUEUE", "IN_PROGRESS"]
-            is_done = report_payload.get("processingStatus") == "DONE"
-            time.sleep(self.sleep_seconds)
+            seconds_waited = (pendulum.now("utc") - self._report_requested_at).total_seconds()
+            if report_payload.get("processingStatus") not in ["IN_QUEUE", "IN_PROGRESS"] or seconds_waited >= REPORTS_MAX_WAIT_SECONDS:
+                return report_payload
+            time.sleep(min(sleep_seconds, REPORTS_MAX_WAIT_SECONDS - seconds_waited))
+            sleep_seconds = min(sleep_seconds * 2, self.sleep_seconds)
 
-        if is_done:
+    def read_records(self, *args, **kwargs) -> Iterable[Mapping[str, Any]]:
+        """
+        Create and retrieve the report, unless it was already requested with `request_report`.
+        Decrypt and parse the report is its fully proceed, then yield the report document records.
+        """
+        if not self._report_id:
+            self._report_id = self._create_report()["reportId"]
+            self._report_requested_at = pendulum.now("utc")
+        # the report is consumed by this read, a new one is created by the next one
+        report_id, self._report_id = self._report_id, None
+
+        report_payload = self._wait_for_report(report_id)
+        if report_payload.get("processingStatus") == "DONE":
             # retrieve and decrypt the report document
             document_id = report_payload["reportDocumentId"]
             request_headers = self.request_headers()
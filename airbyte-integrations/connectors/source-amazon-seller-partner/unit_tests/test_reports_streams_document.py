@@ -0,0 +1,104 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import base64
+import gzip
+import time
+
+import pendulum
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.auth import NoAuth
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+from source_amazon_seller_partner.auth import AWSSignature
+from source_amazon_seller_partner.streams import MerchantListingsReports, ReportsAmazonSPStream
+
+KEY = base64.b64encode(b"k" * 32).decode()
+IV = base64.b64encode(b"i" * 16).decode()
+DOCUMENT = 'sku\tname\tprice\n1\tfirst \xe9\t1.5\n2\t"multi\nline"\t2\n'
+
+
+@pytest.fixture
+def reports_stream():
+    aws_signature = AWSSignature(
+        service="execute-api",
+        aws_access_key_id="AccessKeyId",
+        aws_secret_access_key="SecretAccessKey",
+        aws_session_token="SessionToken",
+        region="US",
+    )
+    return MerchantListingsReports(
+        url_base="https://test.url",
+        aws_signature=aws_signature,
+        replication_start_date="2017-01-25T00:00:00Z",
+        marketplace_ids=["id"],
+        authenticator=NoAuth(),
+    )
+
+
+def encrypt(content: bytes) -> bytes:
+    return AES.new(base64.b64decode(KEY), AES.MODE_CBC, base64.b64decode(IV)).encrypt(pad(content, AES.block_size))
+
+
+def chunked(content: bytes, size: int):
+    return [content[index : index + size] for index in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 16, 33, 1024])
+def test_decrypt_aes_chunks(chunk_size):
+    content = DOCUMENT.encode("iso-8859-1") * 10
+
+    decrypted = b"".join(ReportsAmazonSPStream.decrypt_aes_chunks(chunked(encrypt(content), chunk_size), KEY, IV))
+
+    assert decrypted == content
+    assert ReportsAmazonSPStream.decrypt_aes(encrypt(content), KEY, IV) == content
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_parse_response_streams_document(mocker, reports_stream, compressed):
+    content = DOCUMENT.encode("iso-8859-1")
+    if compressed:
+        content = gzip.compress(content)
+    document_response = mocker.MagicMock()
+    document_response.__enter__.return_value = document_response
+    document_response.iter_content.side_effect = lambda chunk_size: iter(chunked(encrypt(content), 5))
+    mocker.patch.object(requests, "get", return_value=document_response)
+    payload = {"url": "https://document.url", "encryptionDetails": {"standard": "AES", "initializationVector": IV, "key": KEY}}
+    if compressed:
+        payload["compressionAlgorithm"] = "GZIP"
+    response = mocker.MagicMock()
+    response.json.return_value = {"payload": payload}
+
+    records = list(reports_stream.parse_response(response))
+
+    assert records == [{"sku": "1", "name": "first \xe9", "price": "1.5"}, {"sku": "2", "name": "multi\nline", "price": "2"}]
+    requests.get.assert_called_once_with("https://document.url", stream=True)
+
+
+def test_read_records_uses_requested_report(mocker, reports_stream):
+    mocker.patch.object(time, "sleep", return_value=None)
+    create_report = mocker.patch.object(MerchantListingsReports, "_create_report", return_value={"reportId": "report_id"})
+    statuses = [{"processingStatus": "IN_QUEUE"}, {"processingStatus": "IN_PROGRESS"}, {"processingStatus": "CANCELLED"}]
+    retrieve_report = mocker.patch.object(MerchantListingsReports, "_retrieve_report", side_effect=statuses)
+
+    reports_stream.request_report()
+    reports_stream.request_report()
+    records = list(reports_stream.read_records())
+
+    assert records == []
+    create_report.assert_called_once()
+    assert retrieve_report.call_count == 3
+    assert [call.args[0] for call in time.sleep.call_args_list] == [1, 2]
+
+
+def test_read_records_stops_waiting_for_report(mocker, reports_stream):
+    mocker.patch.object(time, "sleep", return_value=None)
+    mocker.patch.object(MerchantListingsReports, "_create_report", return_value={"reportId": "report_id"})
+    mocker.patch.object(MerchantListingsReports, "_retrieve_report", return_value={"processingStatus": "IN_PROGRESS"})
+    now = pendulum.now("utc")
+    mocker.patch.object(pendulum, "now", side_effect=[now, now.add(seconds=10), now.add(seconds=60)])
+
+    assert list(reports_stream.read_records()) == []
+    assert [call.args[0] for call in time.sleep.call_args_list] == [1]
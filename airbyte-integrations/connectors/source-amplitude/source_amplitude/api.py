@@ -4,12 +4,15 @@
 
 
 import gzip
-import io
 import json
+import re
+import tempfile
 import urllib.parse as urlparse
 import zipfile
 from abc import ABC, abstractmethod
-from typing import IO, Any, Iterable, List, Mapping, MutableMapping, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 from urllib.parse import parse_qs
 
 import pendulum
@@ -111,18 +114,83 @@ class Events(IncrementalAmplitudeStream):
     date_template = "%Y%m%dT%H"
     primary_key = "uuid"
     state_checkpoint_interval = 1000
-    time_interval = {"days": 3}
+
+    # the export window starts with 3 days and is resized after every archive to get archives of about target_archive_size bytes
+    initial_time_interval_hours = 72
+    min_time_interval_hours = 8
+    max_time_interval_hours = 14 * 24
+    target_archive_size = 256 * 1024 * 1024
+    # number of hourly files decompressed and decoded at the same time
+    max_workers = 4
+
+    # hourly files are named <project id>_<YYYY-MM-DD>_<hour>#<part>.json.gz, hours aren't zero padded
+    file_name_pattern = re.compile(r"_(\d{4}-\d{2}-\d{2})_(\d{1,2})#(\d+)\.json\.gz$")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._time_interval_hours = self.initial_time_interval_hours
+
+    @property
+    def time_interval(self) -> dict:
+        return {"hours": self._time_interval_hours}
+
+    def request_kwargs(self, **kwargs) -> Mapping[str, Any]:
+        # the archive is copied to a temporary file in chunks instead of being loaded in memory
+        return {"stream": True}
 
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        zip_file = zipfile.ZipFile(io.BytesIO(response.content))
-        for gzip_filename in zip_file.namelist():
-            with zip_file.open(gzip_filename) as file:
-                yield from self._parse_zip_file(file)
-
-    def _parse_zip_file(self, zip_file: IO[bytes]) -> Iterable[Mapping]:
-        with gzip.open(zip_file) as file:
-            for record in file:
-                yield json.loads(record)
+        with tempfile.TemporaryFile() as archive:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                archive.write(chunk)
+            archive_size = archive.tell()
+            self._resize_time_interval(response, archive_size)
+            archive.seek(0)
+            with zipfile.ZipFile(archive) as zip_file:
+                yield from self._parse_zip_file(zip_file)
+
+    def _parse_zip_file(self, zip_file: zipfile.ZipFile) -> Iterable[Mapping]:
+        """
+        Decodes the hourly files in worker threads, records are yielded in time order.
+        At most 2 * max_workers files are decoded ahead of the consumer so memory usage doesn't depend on the archive size.
+        """
+        file_names = sorted(zip_file.namelist(), key=self._file_sort_key)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for file_name in file_names:
+                pending.append(executor.submit(self._decode_file, zip_file, file_name))
+                if len(pending) >= 2 * self.max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    @staticmethod
+    def _decode_file(zip_file: zipfile.ZipFile, file_name: str) -> List[Mapping]:
+        with zip_file.open(file_name) as file:
+            # zlib releases the GIL so the files are decompressed in parallel
+            data = gzip.decompress(file.read())
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+    def _file_sort_key(self, file_name: str) -> Tuple:
+        match = self.file_name_pattern.search(file_name)
+        if not match:
+            return ("", 0, 0, file_name)
+        date, hour, part = match.groups()
+        return (date, int(hour), int(part), file_name)
+
+    def _resize_time_interval(self, response: requests.Response, archive_size: int):
+        """Sets the window of the next requests from the archive size per hour of the current one"""
+        query = parse_qs(urlparse.urlparse(response.url).query)
+        if not query.get("start") or not query.get("end"):
+            return
+        hours = (pendulum.parse(query["end"][0]) - pendulum.parse(query["start"][0])).in_hours() + 1
+        if hours <= 0:
+            return
+        size_per_hour = max(archive_size / hours, 1)
+        interval_hours = int(self.target_archive_size / size_per_hour)
+        self._time_interval_hours = min(max(interval_hours, self.min_time_interval_hours), self.max_time_interval_hours)
+        self.logger.info(
+            f"Read {archive_size} bytes for {hours} hours of {self.name}, the next export window is {self._time_interval_hours} hours"
+        )
 
     def read_records(
         self,
@@ -2,6 +2,11 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import gzip
+import io
+import json
+import zipfile
+
 import airbyte_cdk.models
 import pytest
 import requests
@@ -26,3 +31,47 @@ def test_http_error_handler(mocker):
     send_request_mocker.side_effect = requests.HTTPError(**{"response": mock_response})
     with pytest.raises(requests.exceptions.HTTPError):
         next(stream.read_records(sync_mode=airbyte_cdk.models.SyncMode.full_refresh))
+
+
+def make_export_response(files: dict, url: str) -> requests.Response:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for file_name, records in files.items():
+            zip_file.writestr(file_name, gzip.compress("\n".join(json.dumps(record) for record in records).encode()))
+    response = requests.Response()
+    response.raw = io.BytesIO(archive.getvalue())
+    response.url = url
+    return response
+
+
+def test_events_parse_response_in_time_order():
+    stream = Events(start_date="2021-01-01T00:00:00Z")
+    stream.max_workers = 2
+    files = {
+        "123/123_2021-01-01_10#0.json.gz": [{"uuid": "3"}],
+        "123/123_2021-01-01_9#0.json.gz": [{"uuid": "1"}, {"uuid": "2"}],
+        "123/123_2021-01-02_0#0.json.gz": [{"uuid": "6"}],
+        "123/123_2021-01-01_10#1.json.gz": [{"uuid": "4"}, {"uuid": "5"}],
+    }
+    response = make_export_response(files, "https://amplitude.com/api/2/export?start=20210101T00&end=20210102T23")
+
+    records = list(stream.parse_response(response))
+
+    assert [record["uuid"] for record in records] == ["1", "2", "3", "4", "5", "6"]
+
+
+@pytest.mark.parametrize(
+    "archive_size,expected_hours",
+    [
+        (Events.target_archive_size * 2, Events.min_time_interval_hours),
+        (Events.target_archive_size // 4, 48),
+        (0, Events.max_time_interval_hours),
+    ],
+)
+def test_events_time_interval_resize(archive_size, expected_hours):
+    stream = Events(start_date="2021-01-01T00:00:00Z")
+    response = make_export_response({}, "https://amplitude.com/api/2/export?start=20210101T00&end=20210101T11")
+
+    stream._resize_time_interval(response, archive_size)
+
+    assert stream.time_interval == {"hours": expected_hours}
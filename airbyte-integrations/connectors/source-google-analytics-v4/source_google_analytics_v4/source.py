@@ -5,14 +5,17 @@
 
 import json
 import pkgutil
+import threading
 import time
 from abc import ABC
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 import jwt
 import pendulum
 import requests
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -32,6 +35,20 @@ class GoogleAnalyticsV4TypesList(HttpStream):
     # Column id completely match for v3 and v4.
     url_base = "https://www.googleapis.com/analytics/v3/metadata/ga/columns"
 
+    # the metadata doesn't depend on the account, it's fetched once and shared by all streams
+    _types: Optional[Tuple[dict, dict]] = None
+    _types_lock = threading.Lock()
+
+    @classmethod
+    def get_types(cls) -> Tuple[dict, dict]:
+        """Returns the (dimensions, metrics) types, the metadata endpoint is requested once per process"""
+        with cls._types_lock:
+            if cls._types is None:
+                # read_records yields the dimensions and then the metrics
+                dimensions, metrics = cls().read_records(sync_mode=None)
+                cls._types = dimensions, metrics
+            return cls._types
+
     def path(self, **kwargs) -> str:
         return ""
 
@@ -74,6 +91,64 @@ class GoogleAnalyticsV4TypesList(HttpStream):
         return dimensions, metrics
 
 
+class SampledReportException(Exception):
+    """Raised when the report of a date range is sampled and the range can be split"""
+
+
+class ReportsBatch:
+    """
+    Combines the first page requests of the reports which share a view and a date range into one reports:batchGet call.
+
+    Streams announce the date they start reading from with expect(). When a stream requests a date range, the streams
+    which are going to read from the same date are added to the call and their next date is moved after the range.
+    Their reports are kept until they read that range. Following pages are requested by every stream separately.
+    Streams are read one after the other, so at most max_stored_reports reports are kept: once they are all taken, streams
+    request their reports alone until the kept reports are read.
+    """
+
+    # batchGet accepts up to 5 report requests
+    max_reports = 5
+    max_stored_reports = 20
+
+    def __init__(self):
+        self._next_dates: Dict[str, Tuple["GoogleAnalyticsV4Stream", str]] = {}
+        self._reports: Dict[Tuple[str, str], Tuple[Mapping[str, Any], Mapping[str, Any]]] = {}
+
+    def expect(self, stream: "GoogleAnalyticsV4Stream", start_date: str):
+        self._next_dates[stream.name] = (stream, start_date)
+
+    def companions(self, stream: "GoogleAnalyticsV4Stream", date_range: Mapping[str, Any]) -> List["GoogleAnalyticsV4Stream"]:
+        """Returns the streams whose report for the date range is requested together with the report of the stream"""
+        start_date = date_range["startDate"]
+        next_date = stream.to_datetime_str(pendulum.parse(date_range["endDate"]).add(days=1))
+        if stream.name in self._next_dates:
+            self._next_dates[stream.name] = (stream, next_date)
+        max_companions = min(self.max_reports - 1, self.max_stored_reports - len(self._reports))
+        companions = []
+        for other_stream, other_date in list(self._next_dates.values()):
+            if len(companions) >= max_companions:
+                break
+            if other_stream is not stream and other_date == start_date and other_stream.view_id == stream.view_id:
+                self._next_dates[other_stream.name] = (other_stream, next_date)
+                companions.append(other_stream)
+        return companions
+
+    def store(self, stream_name: str, date_range: Mapping[str, Any], report: Mapping[str, Any]):
+        self._reports[(stream_name, date_range["startDate"])] = (date_range, report)
+
+    def cached_date_range(self, stream_name: str, start_date: str) -> Optional[Mapping[str, Any]]:
+        """Returns the date range of the report kept for a stream from the date"""
+        date_range, _ = self._reports.get((stream_name, start_date), (None, None))
+        return date_range
+
+    def pop(self, stream_name: str, date_range: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
+        # a report kept for another range from the same date is never going to be read, it is dropped as well
+        cached_range, report = self._reports.pop((stream_name, date_range["startDate"]), (None, None))
+        if not cached_range or cached_range["endDate"] != date_range["endDate"]:
+            return None
+        return report
+
+
 class GoogleAnalyticsV4Stream(HttpStream, ABC):
     primary_key = None
     http_method = "POST"
@@ -88,6 +163,12 @@ class GoogleAnalyticsV4Stream(HttpStream, ABC):
 
     map_type = dict(INTEGER="integer", FLOAT="number", PERCENT="number", TIME="number")
 
+    # date windows start with window_in_days days, they are doubled while their reports have less than
+    # page_size * merge_rows_ratio rows and halved when their reports have more than page_size rows.
+    # Windows whose reports are sampled are split until the data isn't sampled or a window has a single day.
+    merge_rows_ratio = 0.1
+    max_window_in_days = 365
+
     def __init__(self, config: Dict):
         super().__init__(authenticator=config["authenticator"])
         self.start_date = config["start_date"]
@@ -96,7 +177,20 @@ class GoogleAnalyticsV4Stream(HttpStream, ABC):
         self.metrics = config["metrics"]
         self.dimensions = config["dimensions"]
         self._config = config
-        self.dimensions_ref, self.metrics_ref = GoogleAnalyticsV4TypesList().read_records(sync_mode=None)
+        self.reports_batch: Optional[ReportsBatch] = config.get("reports_batch")
+        # streams whose reports are requested together with the report of this stream by the current request
+        self._companions: List[GoogleAnalyticsV4Stream] = []
+        self._first_page = True
+        # rows and largest window read without sampling in the current stream slice, used to size the next slice
+        self._slice_feedback: Optional[Dict[str, Any]] = None
+
+    @property
+    def dimensions_ref(self) -> dict:
+        return GoogleAnalyticsV4TypesList.get_types()[0]
+
+    @property
+    def metrics_ref(self) -> dict:
+        return GoogleAnalyticsV4TypesList.get_types()[1]
 
     @property
     def state_checkpoint_interval(self) -> int:
@@ -115,33 +209,107 @@ class GoogleAnalyticsV4Stream(HttpStream, ABC):
         return "reports:batchGet"
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
-        next_page = response.json().get("nextPageToken")
+        # the page token is returned per report, the first report is the report of this stream
+        reports = response.json().get(self.report_field) or [{}]
+        next_page = reports[0].get("nextPageToken")
         if next_page:
             return {"pageToken": next_page}
 
+    def report_request(self, date_range: Mapping[str, Any]) -> MutableMapping[str, Any]:
+        return {
+            "viewId": self.view_id,
+            "dateRanges": [date_range],
+            "pageSize": self.page_size,
+            "metrics": [{"expression": metric} for metric in self.metrics],
+            "dimensions": [{"name": dimension} for dimension in self.dimensions],
+        }
+
     def request_body_json(
         self, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None, **kwargs
     ) -> Optional[Mapping]:
+        date_range = {"startDate": stream_slice["startDate"], "endDate": stream_slice["endDate"]}
+        report_request = self.report_request(date_range)
+        next_page_token = next_page_token or ({"pageToken": stream_slice["pageToken"]} if "pageToken" in stream_slice else None)
 
-        metrics = [{"expression": metric} for metric in self.metrics]
-        dimensions = [{"name": dimension} for dimension in self.dimensions]
-
-        request_body = {
-            "reportRequests": [
-                {
-                    "viewId": self.view_id,
-                    "dateRanges": [stream_slice],
-                    "pageSize": self.page_size,
-                    "metrics": metrics,
-                    "dimensions": dimensions,
-                }
-            ]
-        }
-
+        self._companions = []
+        self._first_page = not next_page_token
         if next_page_token:
-            request_body["reportRequests"][0].update(next_page_token)
+            report_request.update(next_page_token)
+        elif self.reports_batch:
+            self._companions = self.reports_batch.companions(self, date_range)
+
+        return {"reportRequests": [report_request] + [companion.report_request(date_range) for companion in self._companions]}
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the first page from the report requested by another stream when there is one.
+        The date range is split in two halves which are read one after the other when its report is sampled.
+        """
+        report = self.reports_batch.pop(self.name, stream_slice) if self.reports_batch and stream_slice else None
+        try:
+            if not report:
+                yield from super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+                return
+            self.inspect_report(report, stream_slice)
+            yield from self.parse_report(report)
+            if report.get("nextPageToken"):
+                stream_slice = {**stream_slice, "pageToken": report["nextPageToken"]}
+                yield from super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+        except SampledReportException:
+            # no record of the range has been returned yet
+            if self._slice_feedback is not None:
+                self._slice_feedback["sampled"] = True
+            for date_range in self.split_date_range(stream_slice):
+                yield from self.read_records(sync_mode, cursor_field=cursor_field, stream_slice=date_range, stream_state=stream_state)
 
-        return request_body
+    @staticmethod
+    def window_of(date_range: Mapping[str, Any]) -> int:
+        """Returns the number of days which are added to the start date to get the end date"""
+        return (pendulum.parse(date_range["endDate"]) - pendulum.parse(date_range["startDate"])).days
+
+    def split_date_range(self, date_range: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+        start_date = pendulum.parse(date_range["startDate"])
+        middle_date = start_date.add(days=self.window_of(date_range) // 2)
+        return [
+            {"startDate": date_range["startDate"], "endDate": self.to_datetime_str(middle_date)},
+            {"startDate": self.to_datetime_str(middle_date.add(days=1)), "endDate": date_range["endDate"]},
+        ]
+
+    def inspect_report(self, report: Mapping[str, Any], date_range: Mapping[str, Any]):
+        """
+        Raises SampledReportException when the first page of a report is sampled and its date range can be split,
+        otherwise records the number of rows of the report to size the next date windows.
+        """
+        data = report.get("data", {})
+        window = self.window_of(date_range)
+        if data.get("samplesReadCounts"):
+            if window > 0:
+                raise SampledReportException()
+            self.logger.warn(f"Report of {self.name} for {date_range['startDate']} is sampled even when it is requested for a single day")
+        if data.get("isDataGolden") is False:
+            self.logger.info(f"Data of {self.name} from {date_range['startDate']} to {date_range['endDate']} isn't final yet")
+        if self._slice_feedback is not None:
+            self._slice_feedback["rows"] += data.get("rowCount", 0)
+            self._slice_feedback["window"] = max(self._slice_feedback["window"], window)
+
+    def next_window(self, window_in_days: int) -> int:
+        """Returns the size of the next date window from the reports of the last stream slice"""
+        feedback = self._slice_feedback
+        if not feedback:
+            return window_in_days
+        if feedback["sampled"]:
+            return feedback["window"]
+        if feedback["rows"] > self.page_size:
+            return window_in_days // 2
+        if feedback["rows"] < self.page_size * self.merge_rows_ratio:
+            return min(window_in_days * 2 + 1, self.max_window_in_days)
+        return window_in_days
 
     def get_json_schema(self) -> Mapping[str, Any]:
         """
@@ -192,6 +360,28 @@ class GoogleAnalyticsV4Stream(HttpStream, ABC):
             ...]
         """
 
+        start_date = self.get_start_date(stream_state)
+        end_date = pendulum.now().date()
+        window_in_days = self.window_in_days
+
+        while start_date <= end_date:
+            date_slice = None
+            if self.reports_batch:
+                # follow the date range of the report requested by another stream
+                date_slice = self.reports_batch.cached_date_range(self.name, self.to_datetime_str(start_date))
+            if not date_slice:
+                end_date_slice = min(start_date.add(days=window_in_days), end_date)
+                date_slice = {"startDate": self.to_datetime_str(start_date), "endDate": self.to_datetime_str(end_date_slice)}
+
+            self._slice_feedback = {"rows": 0, "sampled": False, "window": 0}
+            yield date_slice
+            # the slice has been read when the next one is requested
+            window_in_days = self.next_window(window_in_days)
+            self._slice_feedback = None
+            # add 1 day for start next slice from next day and not duplicate data from previous slice end date.
+            start_date = pendulum.parse(date_slice["endDate"]).date().add(days=1)
+
+    def get_start_date(self, stream_state: Mapping[str, Any] = None) -> date:
         start_date = pendulum.parse(self.start_date).date()
         end_date = pendulum.now().date()
 
@@ -200,16 +390,7 @@ class GoogleAnalyticsV4Stream(HttpStream, ABC):
             start_date = pendulum.parse(stream_state.get(self.cursor_field)).date()
 
         # use the lowest date between start_date and self.end_date, otherwise API fails if start_date is in future
-        start_date = min(start_date, end_date)
-        date_slices = []
-
-        while start_date <= end_date:
-            end_date_slice = start_date.add(days=self.window_in_days)
-            date_slices.append({"startDate": self.to_datetime_str(start_date), "endDate": self.to_datetime_str(end_date_slice)})
-            # add 1 day for start next slice from next day and not duplicate data from previous slice end date.
-            start_date = end_date_slice.add(days=1)
-
-        return date_slices
+        return min(start_date, end_date)
 
     def get_data(self, data):
         for data_field in self.data_fields:
@@ -333,44 +514,58 @@ class GoogleAnalyticsV4Stream(HttpStream, ABC):
         """
         json_response = response.json()
         reports = json_response.get(self.report_field, [])
+        if not reports:
+            return
 
-        for report in reports:
-            column_header = report.get("columnHeader", {})
-            dimension_headers = column_header.get("dimensions", [])
-            metric_headers = column_header.get("metricHeader", {}).get("metricHeaderEntries", [])
+        # reports of the other streams follow in the order they were requested
+        stream_slice = kwargs.get("stream_slice")
+        date_range = {"startDate": stream_slice["startDate"], "endDate": stream_slice["endDate"]}
+        for companion, report in zip(self._companions, reports[1:]):
+            self.reports_batch.store(companion.name, date_range, report)
+        self._companions = []
 
-            for row in self.get_data(report):
-                record = {}
-                dimensions = row.get("dimensions", [])
-                metrics = row.get("metrics", [])
+        if self._first_page:
+            self.inspect_report(reports[0], date_range)
+        yield from self.parse_report(reports[0])
 
-                for header, dimension in zip(dimension_headers, dimensions):
-                    data_type = self.lookup_data_type("dimension", header)
+    def parse_report(self, report: Mapping[str, Any]) -> Iterable[Mapping]:
+        """Returns the records of a single report"""
+        column_header = report.get("columnHeader", {})
+        dimension_headers = column_header.get("dimensions", [])
+        metric_headers = column_header.get("metricHeader", {}).get("metricHeaderEntries", [])
 
-                    if data_type == "integer":
-                        value = int(dimension)
-                    elif data_type == "number":
-                        value = float(dimension)
-                    else:
-                        value = dimension
+        for row in self.get_data(report):
+            record = {}
+            dimensions = row.get("dimensions", [])
+            metrics = row.get("metrics", [])
 
-                    record[header.replace("ga:", "ga_")] = value
+            for header, dimension in zip(dimension_headers, dimensions):
+                data_type = self.lookup_data_type("dimension", header)
 
-                for i, values in enumerate(metrics):
-                    for metric_header, value in zip(metric_headers, values.get("values")):
-                        metric_name = metric_header.get("name")
-                        metric_type = self.lookup_data_type("metric", metric_name)
+                if data_type == "integer":
+                    value = int(dimension)
+                elif data_type == "number":
+                    value = float(dimension)
+                else:
+                    value = dimension
 
-                        if metric_type == "integer":
-                            value = int(value)
-                        elif metric_type == "number":
-                            value = float(value)
+                record[header.replace("ga:", "ga_")] = value
 
-                        record[metric_name.replace("ga:", "ga_")] = value
+            for i, values in enumerate(metrics):
+                for metric_header, value in zip(metric_headers, values.get("values")):
+                    metric_name = metric_header.get("name")
+                    metric_type = self.lookup_data_type("metric", metric_name)
 
-                record["view_id"] = self.view_id
+                    if metric_type == "integer":
+                        value = int(value)
+                    elif metric_type == "number":
+                        value = float(value)
 
-                yield record
+                    record[metric_name.replace("ga:", "ga_")] = value
+
+            record["view_id"] = self.view_id
+
+            yield record
 
 
 class GoogleAnalyticsV4IncrementalObjectsBase(GoogleAnalyticsV4Stream):
@@ -448,6 +643,18 @@ class GoogleAnalyticsServiceOauth2Authenticator(Oauth2Authenticator):
 class SourceGoogleAnalyticsV4(AbstractSource):
     """Google Analytics lets you analyze data about customer engagement with your website or application."""
 
+    def __init__(self):
+        super().__init__()
+        # set by read() to batch the reports of the configured streams
+        self._catalog: Optional[ConfiguredAirbyteCatalog] = None
+        self._state: MutableMapping[str, Any] = {}
+
+    def read(
+        self, logger: AirbyteLogger, config: Mapping[str, Any], catalog: ConfiguredAirbyteCatalog, state: MutableMapping[str, Any] = None
+    ) -> Iterator[AirbyteMessage]:
+        self._catalog, self._state = catalog, state or {}
+        yield from super().read(logger, config, catalog, state)
+
     @staticmethod
     def get_authenticator(config):
         # backwards compatibility, credentials_json used to be in the top level of the connector
@@ -499,6 +706,7 @@ class SourceGoogleAnalyticsV4(AbstractSource):
             reports += custom_reports
 
         config["ga_streams"] = reports
+        config["reports_batch"] = ReportsBatch()
 
         for stream in config["ga_streams"]:
             config["metrics"] = stream["metrics"]
@@ -517,4 +725,16 @@ class SourceGoogleAnalyticsV4(AbstractSource):
             stream_instance = stream_class(config)
             streams.append(stream_instance)
 
+        if self._catalog:
+            self._expect_reports(config["reports_batch"], streams)
         return streams
+
+    def _expect_reports(self, reports_batch: ReportsBatch, streams: List[GoogleAnalyticsV4Stream]):
+        """Announces the date ranges of the configured streams so their first pages can be requested together"""
+        streams_by_name = {stream.name: stream for stream in streams}
+        for configured_stream in self._catalog.streams:
+            stream = streams_by_name.get(configured_stream.stream.name)
+            if not stream:
+                continue
+            stream_state = self._state.get(stream.name) if configured_stream.sync_mode == SyncMode.incremental else None
+            reports_batch.expect(stream, stream.to_datetime_str(stream.get_start_date(stream_state)))
@@ -8,8 +8,9 @@ from unittest.mock import MagicMock, patch
 from urllib.parse import unquote
 
 import pytest
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http.auth import NoAuth
-from source_google_analytics_v4.source import GoogleAnalyticsV4Stream, GoogleAnalyticsV4TypesList, SourceGoogleAnalyticsV4
+from source_google_analytics_v4.source import GoogleAnalyticsV4Stream, GoogleAnalyticsV4TypesList, ReportsBatch, SourceGoogleAnalyticsV4
 
 
 def read_file(file_name):
@@ -97,3 +98,125 @@ def test_check_connection_oauth(jwt_encode_mock, mocker, mock_metrics_dimensions
     assert "client_secret_val" in unquote(mock_auth_call.last_request.body)
     assert "refresh_token_val" in unquote(mock_auth_call.last_request.body)
     assert mock_auth_call.called
+
+
+def test_reports_batch(requests_mock, mock_metrics_dimensions_type_list_link):
+    test_config = json.loads(read_file("../integration_tests/sample_config.json"))
+    test_config["authenticator"] = NoAuth()
+    test_config["start_date"] = "2021-01-01"
+    test_config["dimensions"] = ["ga:date"]
+    test_config["reports_batch"] = ReportsBatch()
+    test_config["metrics"] = ["ga:users"]
+    first = type("first", (GoogleAnalyticsV4Stream,), {})(config=test_config)
+    test_config["metrics"] = ["ga:newUsers"]
+    second = type("second", (GoogleAnalyticsV4Stream,), {})(config=test_config)
+    date_range = {"startDate": "2021-01-01", "endDate": "2021-01-02"}
+    test_config["reports_batch"].expect(first, "2021-01-01")
+    test_config["reports_batch"].expect(second, "2021-01-01")
+
+    def report(metric, value, next_page_token=None):
+        result = {
+            "columnHeader": {"dimensions": ["ga:date"], "metricHeader": {"metricHeaderEntries": [{"name": metric, "type": "INTEGER"}]}},
+            "data": {"rows": [{"dimensions": ["20210101"], "metrics": [{"values": [value]}]}]},
+        }
+        if next_page_token:
+            result["nextPageToken"] = next_page_token
+        return result
+
+    batch_get = requests_mock.post(
+        "https://analyticsreporting.googleapis.com/v4/reports:batchGet",
+        [
+            {"json": {"reports": [report("ga:users", "1"), report("ga:newUsers", "2", next_page_token="token")]}},
+            {"json": {"reports": [report("ga:newUsers", "3")]}},
+        ],
+    )
+
+    first_records = list(first.read_records(sync_mode=SyncMode.full_refresh, stream_slice=date_range))
+    assert test_config["reports_batch"].cached_date_range("second", "2021-01-01") == date_range
+    second_records = list(second.read_records(sync_mode=SyncMode.full_refresh, stream_slice=date_range))
+
+    assert [record["ga_users"] for record in first_records] == [1]
+    assert [record["ga_newUsers"] for record in second_records] == [2, 3]
+    first_request, second_request = [request.json()["reportRequests"] for request in batch_get.request_history]
+    assert [request["metrics"] for request in first_request] == [[{"expression": "ga:users"}], [{"expression": "ga:newUsers"}]]
+    assert second_request[0]["pageToken"] == "token"
+    assert second_request[0]["dateRanges"] == [date_range]
+
+
+def test_reports_batch_keeps_limited_reports():
+    reports_batch = ReportsBatch()
+    reports_batch.max_stored_reports = 2
+    streams = [MagicMock(view_id="view") for _ in range(4)]
+    for i, stream in enumerate(streams):
+        stream.name = f"stream_{i}"
+        stream.to_datetime_str = GoogleAnalyticsV4Stream.to_datetime_str
+        reports_batch.expect(stream, "2021-01-01")
+    date_range = {"startDate": "2021-01-01", "endDate": "2021-01-02"}
+    next_range = {"startDate": "2021-01-03", "endDate": "2021-01-04"}
+
+    companions = reports_batch.companions(streams[0], date_range)
+    assert companions == streams[1:3]
+    for companion in companions:
+        reports_batch.store(companion.name, date_range, {"data": {}})
+    assert reports_batch.companions(streams[0], next_range) == []
+
+    # reading a kept report makes room for another one
+    assert reports_batch.pop("stream_1", date_range) == {"data": {}}
+    assert reports_batch.companions(streams[1], next_range) == [streams[2]]
+    # a kept report which doesn't match the range read is dropped
+    assert reports_batch.pop("stream_2", {"startDate": "2021-01-01", "endDate": "2021-01-03"}) is None
+    assert reports_batch.cached_date_range("stream_2", "2021-01-01") is None
+
+
+def test_metadata_requested_once(requests_mock, mock_metrics_dimensions_type_list_link):
+    GoogleAnalyticsV4TypesList._types = None
+    for _ in range(3):
+        assert GoogleAnalyticsV4TypesList.get_types()
+    metadata_requests = [request for request in requests_mock.request_history if "metadata" in request.url]
+    assert len(metadata_requests) == 1
+
+
+def make_stream(requests_mock, reports):
+    test_config = json.loads(read_file("../integration_tests/sample_config.json"))
+    test_config["authenticator"] = NoAuth()
+    test_config["start_date"] = "2021-01-01"
+    test_config["window_in_days"] = 3
+    test_config["metrics"] = ["ga:users"]
+    test_config["dimensions"] = ["ga:date"]
+    stream = GoogleAnalyticsV4Stream(config=test_config)
+    batch_get = requests_mock.post(
+        "https://analyticsreporting.googleapis.com/v4/reports:batchGet", [{"json": {"reports": [report]}} for report in reports]
+    )
+    return stream, batch_get
+
+
+def test_sampled_date_range_is_split(requests_mock, mock_metrics_dimensions_type_list_link):
+    rows = [{"dimensions": ["20210101"], "metrics": [{"values": ["1"]}]}]
+    sampled_report = {"columnHeader": {"dimensions": ["ga:date"]}, "data": {"rows": rows, "samplesReadCounts": ["10"], "rowCount": 1}}
+    report = {"columnHeader": {"dimensions": ["ga:date"]}, "data": {"rows": rows, "rowCount": 1}}
+    stream, batch_get = make_stream(requests_mock, [sampled_report, report, sampled_report, report, report])
+    date_range = {"startDate": "2021-01-01", "endDate": "2021-01-04"}
+    stream._slice_feedback = {"rows": 0, "sampled": False, "window": 0}
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=date_range))
+
+    requested_ranges = [request.json()["reportRequests"][0]["dateRanges"][0] for request in batch_get.request_history]
+    assert requested_ranges == [
+        {"startDate": "2021-01-01", "endDate": "2021-01-04"},
+        {"startDate": "2021-01-01", "endDate": "2021-01-02"},
+        {"startDate": "2021-01-03", "endDate": "2021-01-04"},
+        {"startDate": "2021-01-03", "endDate": "2021-01-03"},
+        {"startDate": "2021-01-04", "endDate": "2021-01-04"},
+    ]
+    assert len(records) == 3
+    # 2021-01-01 to 2021-01-02 is the largest range read without sampling
+    assert stream.next_window(3) == 1
+
+
+@pytest.mark.parametrize("rows,expected_window", [(10, 7), (50000, 3), (200000, 1)])
+def test_next_window_from_row_count(requests_mock, mock_metrics_dimensions_type_list_link, rows, expected_window):
+    stream, _ = make_stream(requests_mock, [])
+    stream._slice_feedback = {"rows": 0, "sampled": False, "window": 0}
+    stream.inspect_report({"data": {"rowCount": rows}}, {"startDate": "2021-01-01", "endDate": "2021-01-04"})
+
+    assert stream.next_window(3) == expected_window
@@ -2,18 +2,46 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 import time
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 from urllib.parse import parse_qsl, urlparse
 
 import requests
 from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.auth import HttpAuthenticator, TokenAuthenticator
+from requests.adapters import HTTPAdapter
+
+
+class TokenBucket:
+    """
+    Paces requests to `rate` per second on average while allowing bursts of up to `capacity` requests.
+    It is thread-safe: concurrent callers reserve their tokens in turn and sleep until their token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
 
 
 class IntercomStream(HttpStream, ABC):
@@ -21,6 +49,8 @@ class IntercomStream(HttpStream, ABC):
 
     # https://developers.intercom.com/intercom-api-reference/reference#rate-limiting
     queries_per_minute = 1000  # 1000 queries per minute == 16.67 req per sec
+    # the limit is enforced over 10 seconds periods, allow a small burst only to stay within every period
+    queries_burst = 10
 
     primary_key = "id"
     data_fields = ["data"]
@@ -29,9 +59,12 @@ class IntercomStream(HttpStream, ABC):
         self,
         authenticator: HttpAuthenticator,
         start_date: str = None,
+        rate_limiter: TokenBucket = None,
         **kwargs,
     ):
         self.start_date = start_date
+        # the rate limit applies to the whole workspace, the source shares a single rate limiter between its streams
+        self.rate_limiter = rate_limiter or TokenBucket(rate=self.queries_per_minute / 60.0, capacity=self.queries_burst)
 
         super().__init__(authenticator=authenticator)
 
@@ -55,6 +88,10 @@ class IntercomStream(HttpStream, ABC):
     def request_headers(self, **kwargs) -> Mapping[str, Any]:
         return {"Accept": "application/json"}
 
+    def _send(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        self.rate_limiter.acquire()
+        return super()._send(request, request_kwargs)
+
     def read_records(self, *args, **kwargs) -> Iterable[Mapping[str, Any]]:
         try:
             yield from super().read_records(*args, **kwargs)
@@ -84,10 +121,6 @@ class IntercomStream(HttpStream, ABC):
         for record in data:
             yield record
 
-        # This is probably overkill because the request itself likely took more
-        # than the rate limit, but keep it just to be safe.
-        time.sleep(60.0 / self.queries_per_minute)
-
 
 class IncrementalIntercomStream(IntercomStream, ABC):
     cursor_field = "updated_at"
@@ -127,10 +160,14 @@ class IncrementalIntercomStream(IntercomStream, ABC):
 class ChildStreamMixin:
     parent_stream_class: Optional[IntercomStream] = None
 
+    def read_parent_records(self, sync_mode) -> Iterable[Mapping[str, Any]]:
+        parent_stream = self.parent_stream_class(
+            authenticator=self.authenticator, start_date=self.start_date, rate_limiter=self.rate_limiter
+        )
+        return parent_stream.read_records(sync_mode=sync_mode)
+
     def stream_slices(self, sync_mode, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
-        for item in self.parent_stream_class(authenticator=self.authenticator, start_date=self.start_date).read_records(
-            sync_mode=sync_mode
-        ):
+        for item in self.read_parent_records(sync_mode=sync_mode):
             yield {"id": item["id"]}
 
         yield from []
@@ -176,7 +213,7 @@ class CompanySegments(ChildStreamMixin, IncrementalIntercomStream):
     parent_stream_class = Companies
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
-        return f"/companies/{stream_slice['id']}/segments"
+        return f"companies/{stream_slice['id']}/segments"
 
 
 class Conversations(IncrementalIntercomStream):
@@ -187,21 +224,84 @@ class Conversations(IncrementalIntercomStream):
 
     data_fields = ["conversations"]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # id and updated_at of every conversation listed by the last complete read, reused by ConversationParts
+        self.listed_conversations: Optional[List[Mapping[str, Any]]] = None
+        self._listing: List[Mapping[str, Any]] = []
+
     def path(self, **kwargs) -> str:
         return "conversations"
 
+    def get_data(self, response: requests.Response) -> List:
+        data = super().get_data(response)
+        self._listing.extend({"id": conversation["id"], self.cursor_field: conversation[self.cursor_field]} for conversation in data)
+        return data
+
+    def read_records(self, *args, **kwargs) -> Iterable[Mapping[str, Any]]:
+        self._listing = []
+        yield from super().read_records(*args, **kwargs)
+        # only a listing of every page can replace reading the conversations again
+        self.listed_conversations = self._listing
+
 
 class ConversationParts(ChildStreamMixin, IncrementalIntercomStream):
     """Return list of all conversation parts.
     API Docs: https://developers.intercom.com/intercom-api-reference/reference#retrieve-a-conversation
     Endpoint: https://api.intercom.io/conversations/<id>
+
+    Conversations are retrieved in batches of `batch_size`, up to `max_workers` at a time within the rate limit.
+    Only the conversations updated since the stream state are retrieved. They are listed by reading the Conversations stream,
+    unless the `conversations` stream given to the constructor has already been read completely during the sync.
     """
 
     data_fields = ["conversation_parts", "conversation_parts"]
     parent_stream_class = Conversations
+    batch_size = 100
+    max_workers = 10
+
+    def __init__(self, *args, conversations: Conversations = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conversations = conversations
+        self._session.mount(self.url_base, HTTPAdapter(pool_maxsize=self.max_workers))
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
-        return f"/conversations/{stream_slice['id']}"
+        return f"conversations/{stream_slice['id']}"
+
+    def read_parent_records(self, sync_mode) -> Iterable[Mapping[str, Any]]:
+        if self.conversations and self.conversations.listed_conversations is not None:
+            return self.conversations.listed_conversations
+        return super().read_parent_records(sync_mode=sync_mode)
+
+    def stream_slices(self, sync_mode, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
+        updated_since = (stream_state or {}).get(self.cursor_field)
+        batch = []
+        for conversation in self.read_parent_records(sync_mode=sync_mode):
+            # parts can't be updated without updating their conversation
+            if updated_since and conversation[self.cursor_field] < updated_since:
+                continue
+            batch.append(conversation["id"])
+            if len(batch) == self.batch_size:
+                yield {"ids": batch}
+                batch = []
+        if batch:
+            yield {"ids": batch}
+
+    def read_records(
+        self, sync_mode: SyncMode, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Mapping[str, Any]]:
+        conversation_ids = (stream_slice or {}).get("ids", [])
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # results are yielded in the order of the conversations
+            for parts in executor.map(
+                lambda conversation_id: self._read_conversation_parts(sync_mode, conversation_id, stream_state), conversation_ids
+            ):
+                yield from parts
+
+    def _read_conversation_parts(
+        self, sync_mode: SyncMode, conversation_id: str, stream_state: Mapping[str, Any]
+    ) -> List[Mapping[str, Any]]:
+        return list(super().read_records(sync_mode=sync_mode, stream_slice={"id": conversation_id}, stream_state=stream_state))
 
 
 class Segments(IncrementalIntercomStream):
@@ -314,16 +414,18 @@ class SourceIntercom(AbstractSource):
         config["start_date"] = datetime.strptime(config["start_date"], "%Y-%m-%dT%H:%M:%SZ").timestamp()
 
         auth = TokenAuthenticator(token=config["access_token"])
+        rate_limiter = TokenBucket(rate=IntercomStream.queries_per_minute / 60.0, capacity=IntercomStream.queries_burst)
+        conversations = Conversations(authenticator=auth, rate_limiter=rate_limiter, **config)
         return [
-            Admins(authenticator=auth, **config),
-            Companies(authenticator=auth, **config),
-            CompanySegments(authenticator=auth, **config),
-            Conversations(authenticator=auth, **config),
-            ConversationParts(authenticator=auth, **config),
-            Contacts(authenticator=auth, **config),
-            CompanyAttributes(authenticator=auth, **config),
-            ContactAttributes(authenticator=auth, **config),
-            Segments(authenticator=auth, **config),
-            Tags(authenticator=auth, **config),
-            Teams(authenticator=auth, **config),
+            Admins(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Companies(authenticator=auth, rate_limiter=rate_limiter, **config),
+            CompanySegments(authenticator=auth, rate_limiter=rate_limiter, **config),
+            conversations,
+            ConversationParts(authenticator=auth, rate_limiter=rate_limiter, conversations=conversations, **config),
+            Contacts(authenticator=auth, rate_limiter=rate_limiter, **config),
+            CompanyAttributes(authenticator=auth, rate_limiter=rate_limiter, **config),
+            ContactAttributes(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Segments(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Tags(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Teams(authenticator=auth, rate_limiter=rate_limiter, **config),
         ]
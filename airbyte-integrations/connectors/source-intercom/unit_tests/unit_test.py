@@ -3,10 +3,13 @@
 #
 
 
+import time
+
 import pytest
 import requests
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http.auth import NoAuth
-from source_intercom.source import Companies, Contacts, IntercomStream
+from source_intercom.source import Companies, Contacts, ConversationParts, Conversations, IntercomStream, TokenBucket
 
 test_data = [
     (
@@ -46,3 +49,74 @@ def test_get_next_page_token(intercom_class, response_json, expected_output_toke
     test = intercom_class(authenticator=NoAuth).next_page_token(response)
 
     assert test == expected_output_token
+
+
+def test_token_bucket_paces_requests(mocker):
+    now = [100.0]
+    mocker.patch.object(time, "monotonic", side_effect=lambda: now[0])
+    sleep = mocker.patch.object(time, "sleep")
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    # the burst is served at once, the next requests wait for their token
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+
+def conversation_parts_response(conversation_id, updated_at):
+    return {
+        "json": {
+            "id": conversation_id,
+            "conversation_parts": {"conversation_parts": [{"id": f"part_{conversation_id}", "updated_at": updated_at}]},
+        }
+    }
+
+
+def test_conversation_parts_reuse_conversations_listing(requests_mock):
+    requests_mock.get(
+        "https://api.intercom.io/conversations",
+        json={"conversations": [{"id": "1", "updated_at": 10}, {"id": "2", "updated_at": 20}, {"id": "3", "updated_at": 30}]},
+    )
+    for conversation_id, updated_at in (("2", 20), ("3", 30)):
+        requests_mock.get(
+            f"https://api.intercom.io/conversations/{conversation_id}", **conversation_parts_response(conversation_id, updated_at)
+        )
+    conversations = Conversations(authenticator=NoAuth())
+    conversation_parts = ConversationParts(authenticator=NoAuth(), conversations=conversations)
+    conversation_parts.batch_size = 1
+
+    assert len(list(conversations.read_records(sync_mode=SyncMode.incremental, stream_state={"updated_at": 30}))) == 1
+    slices = list(conversation_parts.stream_slices(sync_mode=SyncMode.incremental, stream_state={"updated_at": 20}))
+    records = [
+        record
+        for stream_slice in slices
+        for record in conversation_parts.read_records(
+            sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state={"updated_at": 20}
+        )
+    ]
+
+    assert slices == [{"ids": ["2"]}, {"ids": ["3"]}]
+    assert [record["id"] for record in records] == ["part_2", "part_3"]
+    assert requests_mock.call_count == 3
+
+
+def test_conversation_parts_read_batches_concurrently(requests_mock):
+    requests_mock.get(
+        "https://api.intercom.io/conversations",
+        json={"conversations": [{"id": str(index), "updated_at": index} for index in range(25)]},
+    )
+    for index in range(25):
+        requests_mock.get(f"https://api.intercom.io/conversations/{index}", **conversation_parts_response(str(index), index))
+    conversation_parts = ConversationParts(authenticator=NoAuth())
+    conversation_parts.rate_limiter = TokenBucket(rate=1000, capacity=100)
+
+    slices = list(conversation_parts.stream_slices(sync_mode=SyncMode.full_refresh))
+    records = [
+        record
+        for stream_slice in slices
+        for record in conversation_parts.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice)
+    ]
+
+    assert [len(stream_slice["ids"]) for stream_slice in slices] == [25]
+    assert [record["id"] for record in records] == [f"part_{index}" for index in range(25)]
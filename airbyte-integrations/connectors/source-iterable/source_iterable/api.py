@@ -6,6 +6,7 @@ import csv
 import json
 import urllib.parse as urlparse
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -15,6 +16,7 @@ from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http import HttpStream
 
 EVENT_ROWS_LIMIT = 200
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 CAMPAIGNS_PER_REQUEST = 20
 
 
@@ -59,14 +61,26 @@ class IterableStream(HttpStream, ABC):
 
 
 class IterableExportStream(IterableStream, ABC):
+    """
+    The export is split into time windows, one per stream slice, so the state is emitted after every window.
+    The first window spans initial_window, next ones are resized to contain about target_window_records records
+    according to the number of records read in the previous window.
+    """
 
     cursor_field = "createdAt"
     primary_key = None
 
+    initial_window = pendulum.duration(days=7)
+    min_window = pendulum.duration(hours=1)
+    max_window = pendulum.duration(days=180)
+    target_window_records = 250_000
+
     def __init__(self, start_date, **kwargs):
         super().__init__(**kwargs)
         self._start_date = pendulum.parse(start_date)
         self.stream_params = {"dataTypeName": self.data_field}
+        # number of records read in the current window
+        self._window_records = 0
 
     def path(self, **kwargs) -> str:
         return "/export/data.json"
@@ -95,23 +109,52 @@ class IterableExportStream(IterableStream, ABC):
             }
         return {self.cursor_field: latest_benchmark.to_datetime_string()}
 
-    def request_params(self, stream_state: Mapping[str, Any], **kwargs) -> MutableMapping[str, Any]:
-
-        params = super().request_params(stream_state=stream_state)
+    def stream_slices(
+        self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
         start_datetime = self._start_date
-        if stream_state.get(self.cursor_field):
+        if stream_state and stream_state.get(self.cursor_field):
             start_datetime = pendulum.parse(stream_state[self.cursor_field])
+        now = pendulum.now()
+
+        window = self.initial_window
+        while True:
+            end_datetime = min(start_datetime + window, now)
+            self._window_records = 0
+            yield {"start_date": start_datetime.strftime(DATETIME_FORMAT), "end_date": end_datetime.strftime(DATETIME_FORMAT)}
+            # the previous window is read completely when the next slice is requested
+            if end_datetime >= now:
+                break
+            window = self._next_window(end_datetime - start_datetime, self._window_records)
+            start_datetime = end_datetime
+
+    def _next_window(self, window: pendulum.Duration, records: int) -> pendulum.Duration:
+        if records:
+            seconds = window.total_seconds() * self.target_window_records / records
+        else:
+            seconds = window.total_seconds() * 2
+        seconds = min(max(seconds, self.min_window.total_seconds()), self.max_window.total_seconds())
+        return pendulum.duration(seconds=int(seconds))
+
+    def request_params(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
 
-        params.update(
-            {"startDateTime": start_datetime.strftime("%Y-%m-%d %H:%M:%S"), "endDateTime": pendulum.now().strftime("%Y-%m-%d %H:%M:%S")},
-            **self.stream_params,
-        )
+        params = super().request_params(stream_state=stream_state)
+        if stream_slice:
+            start_date, end_date = stream_slice["start_date"], stream_slice["end_date"]
+        else:
+            start_datetime = self._start_date
+            if stream_state.get(self.cursor_field):
+                start_datetime = pendulum.parse(stream_state[self.cursor_field])
+            start_date, end_date = start_datetime.strftime(DATETIME_FORMAT), pendulum.now().strftime(DATETIME_FORMAT)
+
+        params.update({"startDateTime": start_date, "endDateTime": end_date}, **self.stream_params)
         return params
 
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         for obj in response.iter_lines():
             record = json.loads(obj)
             record[self.cursor_field] = self._field_to_datetime(record[self.cursor_field])
+            self._window_records += 1
             yield record
 
 
@@ -283,11 +326,18 @@ class EmailUnsubscribe(IterableExportStream):
 class Events(IterableStream):
     """
     https://api.iterable.com/api/docs#events_User_events
+
+    Users of all lists are deduplicated and read in email order, every slice contains emails_per_slice users whose events
+    are requested by max_workers threads.
+    The stream only supports full refresh: events of a user can't be requested from a point in time, so resuming a sync
+    from a state would read the whole history of every user again and duplicate it.
     """
 
     primary_key = None
     data_field = "events"
     page_size = EVENT_ROWS_LIMIT
+    emails_per_slice = 100
+    max_workers = 4
 
     def path(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> str:
         return f"events/{stream_slice['email']}"
@@ -300,15 +350,26 @@ class Events(IterableStream):
 
     def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
         lists = ListUsers(api_key=self._api_key)
-        stream_slices = lists.stream_slices()
+        emails = set()
+        for stream_slice in lists.stream_slices():
+            for list_record in lists.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice):
+                emails.add(list_record["email"])
+        emails = sorted(emails)
 
-        for stream_slice in stream_slices:
-            for list_record in lists.read_records(sync_mode=kwargs.get("sync_mode", SyncMode.full_refresh), stream_slice=stream_slice):
-                yield {"email": list_record["email"]}
+        for index in range(0, len(emails), self.emails_per_slice):
+            yield {"emails": emails[index : index + self.emails_per_slice]}
 
-    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for records in executor.map(lambda email: self._read_user_events(email, **kwargs), stream_slice["emails"]):
+                yield from records
+
+    def _read_user_events(self, email: str, **kwargs) -> List[Mapping[str, Any]]:
+        return list(super().read_records(stream_slice={"email": email}, **kwargs))
+
+    def parse_response(self, response: requests.Response, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping]:
         for record in super().parse_response(response, **kwargs):
-            yield {"data": record}
+            yield {"email": stream_slice["email"], "data": record}
 
 
 class MessageTypes(IterableStream):
@@ -335,6 +396,11 @@ class Templates(IterableExportStream):
     def path(self, **kwargs) -> str:
         return "templates"
 
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        # templates are not exported, there are few of them and their records are not counted to resize windows:
+        # they are requested at once from the start date or the state until now
+        yield None
+
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
         for template in self.template_types:
             for message in self.message_types:
@@ -2,6 +2,71 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import pendulum
+from airbyte_cdk.models import SyncMode
+from source_iterable.api import EmailSend, Events, IterableStream, ListUsers, Templates
+
 
 def test_example_method():
     assert True
+
+
+def test_export_stream_slices_adapt_to_record_count():
+    stream = EmailSend(api_key="key", start_date="2021-01-01T00:00:00Z")
+    stream.initial_window = pendulum.duration(days=10)
+    stream.target_window_records = 100
+    slices = stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={"createdAt": "2021-02-01 00:00:00"})
+
+    assert next(slices) == {"start_date": "2021-02-01 00:00:00", "end_date": "2021-02-11 00:00:00"}
+    # 4 times more records than targeted, the next window is 4 times smaller
+    stream._window_records = 400
+    assert next(slices) == {"start_date": "2021-02-11 00:00:00", "end_date": "2021-02-13 12:00:00"}
+    # empty windows are doubled
+    assert next(slices) == {"start_date": "2021-02-13 12:00:00", "end_date": "2021-02-18 12:00:00"}
+
+
+def test_export_stream_slices_end_now():
+    stream = EmailSend(api_key="key", start_date="2021-01-01T00:00:00Z")
+    stream.max_window = pendulum.duration(days=365 * 100)
+    stream.initial_window = stream.max_window
+    slices = list(stream.stream_slices(sync_mode=SyncMode.full_refresh))
+
+    assert len(slices) == 1
+    params = stream.request_params(stream_state={}, stream_slice=slices[0])
+    assert (params["startDateTime"], params["endDateTime"]) == (slices[0]["start_date"], slices[0]["end_date"])
+    assert params["dataTypeName"] == "emailSend"
+
+
+def test_templates_are_not_windowed():
+    stream = Templates(api_key="key", start_date="2021-01-01T00:00:00Z")
+    slices = list(stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={"createdAt": "2021-02-01 00:00:00"}))
+
+    assert slices == [None]
+    params = stream.request_params(stream_state={"createdAt": "2021-02-01 00:00:00"}, stream_slice=slices[0])
+    assert params["startDateTime"] == "2021-02-01 00:00:00"
+
+
+def test_events_users_deduplicated(mocker):
+    stream = Events(api_key="key")
+    stream.emails_per_slice = 2
+    mocker.patch.object(ListUsers, "stream_slices", return_value=[{"list_id": 1}, {"list_id": 2}])
+    list_users = {1: ["c@x.com", "a@x.com", "b@x.com"], 2: ["b@x.com", "d@x.com"]}
+    mocker.patch.object(
+        ListUsers,
+        "read_records",
+        side_effect=lambda stream_slice, **kwargs: [{"email": email} for email in list_users[stream_slice["list_id"]]],
+    )
+
+    slices = list(stream.stream_slices(sync_mode=SyncMode.full_refresh))
+    assert slices == [{"emails": ["a@x.com", "b@x.com"]}, {"emails": ["c@x.com", "d@x.com"]}]
+    # the events of a user can't be read from a point in time, resuming from a state would duplicate them
+    assert not stream.supports_incremental
+
+
+def test_events_read_in_slice_order(mocker):
+    stream = Events(api_key="key")
+    mocker.patch.object(IterableStream, "read_records", side_effect=lambda stream_slice, **kwargs: [{"id": stream_slice["email"]}])
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"emails": ["a@x.com", "b@x.com", "c@x.com"]}))
+
+    assert [record["id"] for record in records] == ["a@x.com", "b@x.com", "c@x.com"]
@@ -6,8 +6,8 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk~=0.1.7",
-    "pyarrow==4.0.1",
+    "airbyte-cdk~=0.1.29",
+    "pyarrow==6.0.1",
     "smart-open[s3]==5.1.0",
     "wcmatch==8.2",
     "dill==0.3.4",
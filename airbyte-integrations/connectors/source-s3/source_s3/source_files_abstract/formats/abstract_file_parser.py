@@ -48,6 +48,17 @@ class AbstractFileParser(ABC):
         :yield: data record as a mapping of {columns:values}
         """
 
+    @abstractmethod
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
+        """
+        Override this with format-specifc logic to stream the file as pyarrow RecordBatches.
+        Values are kept in their Arrow types, the CDK renders them into JSON without converting them to Python objects.
+        Note: avoid loading the whole file into memory to avoid OOM breakages
+
+        :param file: file-like object (opened via StorageFile)
+        :yield: batch of data records
+        """
+
     @staticmethod
     def json_type_to_pyarrow_type(typ: str, reverse: bool = False, logger: AirbyteLogger = AirbyteLogger()) -> str:
         """
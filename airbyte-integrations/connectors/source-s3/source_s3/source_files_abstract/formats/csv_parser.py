@@ -140,10 +140,10 @@ class CsvParser(AbstractFileParser):
         )
         return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
 
-    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.csv.open_csv.html
-        PyArrow returns lists of values for each column so we zip() these up into records which we then yield
+        PyArrow reads the file block by block, every block is yielded as a RecordBatch
         """
         streaming_reader = pa_csv.open_csv(
             file,
@@ -158,12 +158,20 @@ class CsvParser(AbstractFileParser):
             except StopIteration:
                 still_reading = False
             else:
-                batch_dict = batch.to_pydict()
-                batch_columns = [col_info.name for col_info in batch.schema]
-                # this gives us a list of lists where each nested list holds ordered values for a single column
-                # e.g. [ [1,2,3], ["a", "b", "c"], [True, True, False] ]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns]
-                # we zip this to get row-by-row, e.g. [ [1, "a", True], [2, "b", True], [3, "c", False] ]
-                for record_values in zip(*columnwise_record_values):
-                    # create our record of {col: value, col: value} by dict comprehension, iterating through all cols in batch_columns
-                    yield {batch_columns[i]: record_values[i] for i in range(len(batch_columns))}
+                yield batch
+
+    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+        """
+        https://arrow.apache.org/docs/python/generated/pyarrow.csv.open_csv.html
+        PyArrow returns lists of values for each column so we zip() these up into records which we then yield
+        """
+        for batch in self.stream_record_batches(file):
+            batch_dict = batch.to_pydict()
+            batch_columns = [col_info.name for col_info in batch.schema]
+            # this gives us a list of lists where each nested list holds ordered values for a single column
+            # e.g. [ [1,2,3], ["a", "b", "c"], [True, True, False] ]
+            columnwise_record_values = [batch_dict[column] for column in batch_columns]
+            # we zip this to get row-by-row, e.g. [ [1, "a", True], [2, "b", True], [3, "c", False] ]
+            for record_values in zip(*columnwise_record_values):
+                # create our record of {col: value, col: value} by dict comprehension, iterating through all cols in batch_columns
+                yield {batch_columns[i]: record_values[i] for i in range(len(batch_columns))}
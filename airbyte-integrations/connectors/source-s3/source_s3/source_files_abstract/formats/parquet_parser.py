@@ -4,6 +4,7 @@
 
 from typing import Any, BinaryIO, Iterator, List, Mapping, TextIO, Tuple, Union
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 from pyarrow.parquet import ParquetFile
 
@@ -108,10 +109,35 @@ class ParquetParser(AbstractFileParser):
         """
 
         reader = self._init_reader(file)
-        self.logger.info(f"found {reader.num_row_groups} row groups")
         logical_types = {
             field.name: self.parse_field_type(field.logical_type.type.lower(), field.physical_type)[1] for field in reader.schema
         }
+        for batch in self._iter_batches(reader):
+            # this gives us a dist of lists where each nested list holds ordered values for a single column
+            # {'number': [1.0, 2.0, 3.0], 'name': ['foo', None, 'bar'], 'flag': [True, False, True], 'delta': [-1.0, 2.5, 0.1]}
+            batch_columns = [col.name for col in batch.schema]
+            batch_dict = batch.to_pydict()
+            columnwise_record_values = [batch_dict[column] for column in batch_columns]
+
+            # we zip this to get row-by-row
+            for record_values in zip(*columnwise_record_values):
+                yield {
+                    batch_columns[i]: self.convert_field_data(logical_types[batch_columns[i]], record_values[i])
+                    for i in range(len(batch_columns))
+                }
+
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
+        """
+        https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html#pyarrow.parquet.ParquetFile.iter_batches
+        Batches are yielded as read, timestamp/date/time columns are rendered as ISO strings by the CDK serializer
+        """
+        yield from self._iter_batches(self._init_reader(file))
+
+    def _iter_batches(self, reader: ParquetFile) -> Iterator[pa.RecordBatch]:
+        """
+        PyArrow reads streaming batches from a Parquet file, one row group at a time
+        """
+        self.logger.info(f"found {reader.num_row_groups} row groups")
         if not reader.schema:
             # pyarrow can parse empty parquet files but a connector can't generate dynamic schema
             raise OSError("empty Parquet file")
@@ -122,16 +148,4 @@ class ParquetParser(AbstractFileParser):
         # load batches per page
         for num_row_group in num_row_groups:
             args["row_groups"] = [num_row_group]
-            for batch in reader.iter_batches(**args):
-                # this gives us a dist of lists where each nested list holds ordered values for a single column
-                # {'number': [1.0, 2.0, 3.0], 'name': ['foo', None, 'bar'], 'flag': [True, False, True], 'delta': [-1.0, 2.5, 0.1]}
-                batch_columns = [col.name for col in batch.schema]
-                batch_dict = batch.to_pydict()
-                columnwise_record_values = [batch_dict[column] for column in batch_columns]
-
-                # we zip this to get row-by-row
-                for record_values in zip(*columnwise_record_values):
-                    yield {
-                        batch_columns[i]: self.convert_field_data(logical_types[batch_columns[i]], record_values[i])
-                        for i in range(len(batch_columns))
-                    }
+            yield from reader.iter_batches(**args)
@@ -12,11 +12,12 @@ from operator import itemgetter
 from traceback import format_exc
 from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
-from airbyte_cdk.logger import AirbyteLogger
+import pyarrow as pa
 from airbyte_cdk.models.airbyte_protocol import SyncMode
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import ColumnarStream
 from wcmatch.glob import GLOBSTAR, SPLIT, globmatch
 
+from .formats.abstract_file_parser import AbstractFileParser
 from .formats.csv_parser import CsvParser
 from .formats.parquet_parser import ParquetParser
 from .storagefile import StorageFile
@@ -28,7 +29,7 @@ class ConfigurationError(Exception):
     """Client mis-configured"""
 
 
-class FileStream(Stream, ABC):
+class FileStream(ColumnarStream, ABC):
     @property
     def fileformatparser_map(self):
         """Mapping where every key is equal  'filetype' and values are  corresponding  parser classes."""
@@ -61,7 +62,6 @@ class FileStream(Stream, ABC):
             self._schema = self._parse_user_input_schema(schema)
         self.master_schema = None
         self.storagefile_cache: Optional[List[Tuple[datetime, StorageFile]]] = None
-        self.logger = AirbyteLogger()
         self.logger.info(f"initialised stream with format: {format}")
 
     @staticmethod
@@ -301,6 +301,32 @@ class FileStream(Stream, ABC):
 
         return record
 
+    def _match_target_schema_batch(self, batch: pa.RecordBatch, target_columns: List) -> List[Tuple[str, pa.Array]]:
+        """
+        Columnar counterpart of _match_target_schema(), works on whole columns instead of single records.
+        All missing columns are added as null columns typed according to the schema map
+        All additional columns are packed into the _ab_additional_properties struct column
+
+        :param batch: batch of data rows as read by the file format parser
+        :param target_columns: list of column names to mutate this batch into (obtained via self._get_schema_map().keys() as of now)
+        :return: list of (column name, column values) pairs lining up to target_columns
+        """
+        compare_columns = [c for c in target_columns if c not in [self.ab_last_mod_col, self.ab_file_name_col, self.ab_additional_col]]
+        schema_map = self._get_schema_map()
+        columns = [(name, column) for name, column in zip(batch.schema.names, batch.columns) if name in compare_columns]
+        # missing columns
+        for c in compare_columns:
+            if c not in batch.schema.names:
+                columns.append((c, pa.nulls(batch.num_rows, type=AbstractFileParser.json_type_to_pyarrow_type(schema_map[c]))))
+        # additional columns
+        additional = [(name, column) for name, column in zip(batch.schema.names, batch.columns) if name not in compare_columns]
+        if additional:
+            additional_column = pa.StructArray.from_arrays([column for _, column in additional], names=[name for name, _ in additional])
+        else:
+            additional_column = pa.array([{}] * batch.num_rows, type=pa.struct([]))
+        columns.append((self.ab_additional_col, additional_column))
+        return columns
+
     def _add_extra_fields_from_map(self, record: Mapping[str, Any], extra_map: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Simple method to take a mapping of columns:values and add them to the provided record
@@ -347,6 +373,32 @@ class FileStream(Stream, ABC):
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def read_record_batches(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[pa.RecordBatch]:
+        """
+        Columnar counterpart of read_records(), used by the CDK when no record transformation is configured.
+        Batches from stream_record_batches() are aligned to the final schema with _match_target_schema_batch()
+        and the file metadata columns are appended as constant columns.
+        """
+        stream_slice = stream_slice if stream_slice is not None else []
+        file_reader = self.fileformatparser_class(self._format, self._get_master_schema())
+        target_columns = list(self._get_schema_map().keys())
+
+        for file_info in stream_slice:
+            last_modified = datetime.strftime(file_info["last_modified"], self.datetime_format_string)
+            with file_info["storagefile"].open(file_reader.is_binary) as f:
+                for batch in file_reader.stream_record_batches(f):
+                    columns = self._match_target_schema_batch(batch, target_columns)
+                    columns.append((self.ab_last_mod_col, pa.repeat(last_modified, batch.num_rows)))
+                    columns.append((self.ab_file_name_col, pa.repeat(file_info["unique_url"], batch.num_rows)))
+                    yield pa.RecordBatch.from_arrays([column for _, column in columns], names=[name for name, _ in columns])
+        self.logger.info("finished reading a stream slice")
+
 
 class IncrementalFileStream(FileStream, ABC):
 
@@ -388,6 +440,16 @@ class IncrementalFileStream(FileStream, ABC):
         state_dict["schema"] = self._get_schema_map()
         return state_dict
 
+    def get_updated_state_from_batch(
+        self, current_stream_state: MutableMapping[str, Any], latest_batch: pa.RecordBatch
+    ) -> Mapping[str, Any]:
+        """
+        All records of a batch come from the same file and therefore share the cursor value,
+        so the state only needs to be updated with a single record holding it.
+        """
+        latest_record = {self.cursor_field: latest_batch.column(latest_batch.schema.get_field_index(self.cursor_field))[0].as_py()}
+        return self.get_updated_state(current_stream_state, latest_record)
+
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
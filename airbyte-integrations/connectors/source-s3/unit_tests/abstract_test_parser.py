@@ -2,11 +2,15 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from abc import ABC, abstractmethod
 from typing import Any, List, Mapping
 
+import pyarrow as pa
 import pytest
 from airbyte_cdk import AirbyteLogger
+from airbyte_cdk.models import AirbyteRecordMessage
+from airbyte_cdk.sources.utils.record_batch import RecordBatchSerializer
 from smart_open import open as smart_open
 
 
@@ -53,3 +57,31 @@ class AbstractTestParser(ABC):
                     assert len(records) == test_file["num_records"]
                     for index, expected_record in test_file["line_checks"].items():
                         assert records[index - 1] == expected_record
+
+    def test_stream_record_batches(self):
+        for test_file in self.test_files:
+            if "test_stream_records" in test_file["fails"]:
+                continue
+            with smart_open(test_file["filepath"], self._get_readmode("stream_record_batches", test_file)) as f:
+                batches = list(test_file["AbstractFileParser"].stream_record_batches(f))
+                assert sum(batch.num_rows for batch in batches) == test_file["num_records"]
+            with smart_open(test_file["filepath"], self._get_readmode("stream_records", test_file)) as f:
+                records = list(test_file["AbstractFileParser"].stream_records(f))
+            # serialized batches must carry exactly the values the record-by-record path emits through pydantic
+            serializer = RecordBatchSerializer()
+            try:
+                expected = [
+                    json.loads(AirbyteRecordMessage(stream="stream", data=record, emitted_at=1).json())["data"] for record in records
+                ]
+            except UnicodeDecodeError:
+                # binary values which aren't valid UTF-8 can be emitted by neither path
+                with pytest.raises(pa.ArrowInvalid):
+                    [serializer.serialize("stream", batch, emitted_at=1) for batch in batches]
+                continue
+            serialized_records = [
+                json.loads(line)["record"]["data"]
+                for batch in batches
+                if batch.num_rows
+                for line in serializer.serialize("stream", batch, emitted_at=1).payload.split("\n")
+            ]
+            assert serialized_records == expected
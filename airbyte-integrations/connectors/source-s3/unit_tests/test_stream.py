@@ -4,6 +4,7 @@
 
 from unittest.mock import patch
 
+import pyarrow as pa
 import pytest
 from airbyte_cdk import AirbyteLogger
 from source_s3.source_files_abstract.stream import FileStream
@@ -101,6 +102,23 @@ class TestFileStream:
                 fs._match_target_schema(record, target_columns)
                 LOGGER.debug(str(e_info))
 
+    @patch(
+        "source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_match_target_schema_batch(self):
+        fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern=[], schema='{"id": "integer", "name": "string"}')
+        batch = pa.RecordBatch.from_pydict({"id": [1, 2], "location": ["The Shire", None]})
+
+        columns = fs._match_target_schema_batch(batch, ["id", "name", "_ab_additional_properties"])
+
+        assert [name for name, _ in columns] == ["id", "name", "_ab_additional_properties"]
+        assert pa.RecordBatch.from_arrays([c for _, c in columns], names=[n for n, _ in columns]).to_pydict() == {
+            "id": [1, 2],
+            "name": [None, None],
+            "_ab_additional_properties": [{"location": "The Shire"}, {"location": None}],
+        }
+        assert columns[1][1].type == pa.large_string()
+
     @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
         "extra_map, record, expected_return_record",
         [
@@ -7,7 +7,7 @@ import calendar
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
 import pytz
@@ -238,9 +238,14 @@ class IncrementalUnsortedStream(IncrementalEntityStream, ABC):
     """Stream for loading without sorting
 
     Some endpoints don't provide approachs for data filtration
-    We can load all reconds fully and select updated data only
+    We can load all reconds fully and select updated data only.
+    If an endpoint returns records sorted by the cursor in descending order the loading
+    stops at the first record which isn't newer than the stream state.
     """
 
+    # responses are sorted by the cursor field in descending order
+    sorted_by_cursor = False
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # For saving of a relevant last updated date
@@ -261,7 +266,11 @@ class IncrementalUnsortedStream(IncrementalEntityStream, ABC):
                 if not cursor_date or updated > cursor_date:
                     send_cnt += 1
                     yield record
-            if not send_cnt:
+                elif self.sorted_by_cursor:
+                    # all next records are older
+                    self._finished = True
+                    return
+            if not send_cnt and self.sorted_by_cursor:
                 self._finished = True
 
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
@@ -278,6 +287,8 @@ class IncrementalUnsortedPageStream(IncrementalUnsortedStream, ABC):
     """
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        if self.is_finished:
+            return None
         next_page = self._parse_next_page_number(response)
         if not next_page:
             self._finished = True
@@ -300,6 +311,8 @@ class FullRefreshStream(IncrementalUnsortedPageStream, ABC):
 class IncrementalSortedCursorStream(IncrementalUnsortedStream, ABC):
     """Stream for loading sorting data with cursor based pagination"""
 
+    sorted_by_cursor = True
+
     def request_params(self, next_page_token: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
         params = super().request_params(next_page_token=next_page_token, **kwargs)
         params.update({"sort_by": self.cursor_field, "sort_order": "desc", "limit": self.page_size})
@@ -317,6 +330,8 @@ class IncrementalSortedCursorStream(IncrementalUnsortedStream, ABC):
 class IncrementalSortedPageStream(IncrementalUnsortedPageStream, ABC):
     """Stream for loading sorting data with normal pagination"""
 
+    sorted_by_cursor = True
+
     def request_params(self, **kwargs) -> MutableMapping[str, Any]:
         params = super().request_params(**kwargs)
         if params:
@@ -324,71 +339,41 @@ class IncrementalSortedPageStream(IncrementalUnsortedPageStream, ABC):
         return params
 
 
-class TicketComments(IncrementalSortedPageStream):
-    """TicketComments stream: https://developer.zendesk.com/api-reference/ticketing/tickets/ticket_comments/
+class TicketComments(IncrementalExportStream):
+    """TicketComments stream: https://developer.zendesk.com/api-reference/ticketing/ticket-management/incremental_exports/#incremental-ticket-event-export
     ZenDesk doesn't provide API for loading of all comments by one direct endpoints.
-    Thus at first we loads all updated tickets and after this tries to load all created/updated
-    comments per every ticket"""
+    Thus comments are extracted from the incremental ticket events export with sideloaded comment events.
+    Every page contains events of many tickets so comments are loaded without a request per ticket"""
 
-    response_list_name = "comments"
-    cursor_field = IncrementalSortedPageStream.created_at_field
+    cursor_field = IncrementalExportStream.created_at_field
+    response_list_name = "ticket_events"
+    sideload_param = "comment_events"
+    event_type = "Comment"
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # need to save a slice ticket state
-        # because the function get_updated_state doesn't have a stream_slice as argument
-        self._slice_cursor_date = None
+    def path(self, **kwargs) -> str:
+        return "incremental/ticket_events.json"
 
-    def path(self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
-        ticket_id = stream_slice["id"]
-        return f"tickets/{ticket_id}/comments.json"
+    def request_params(self, stream_state: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
+        stream_state = stream_state or {}
+        if not stream_state.get("_last_end_time") and stream_state.get(Tickets.cursor_field):
+            # for backward compatibility, previous versions saved the cursor of the last ticket they loaded comments for
+            stream_state = {"_last_end_time": stream_state[Tickets.cursor_field]}
+        params = super().request_params(stream_state=stream_state, **kwargs)
+        params["include"] = self.sideload_param
+        return params
 
     def parse_response(
         self, response: requests.Response, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, **kwargs
     ) -> Iterable[Mapping]:
-        # save a slice ticket state
-        self._cursor_ticket_date = stream_slice[Tickets.cursor_field]
-        yield from super().parse_response(response, stream_state=stream_state, stream_slice=stream_slice, **kwargs)
-
-    def stream_slices(
-        self, sync_mode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
-    ) -> Iterable[Optional[Mapping[str, Any]]]:
-        """Loads all updated tickets after last stream state"""
-        stream_state = stream_state or {}
-        # convert a comment state value to a ticket one
-        # tickets and comments have different cursor formats. For example:
-        # Ticket state {"generated_timestamp": 1627637409}
-        # Comment state: {"created_at": "2021-07-30T12:30:09Z"}
-        # At the first try to find a ticket cursor value
-        ticket_stream_value = stream_state.get(Tickets.cursor_field)
-        if not ticket_stream_value:
-            # for backward compatibility because not all relevant states can have some last ticket state
-            ticket_stream_value = Tickets.str2unixtime(stream_state.get(self.cursor_field))
-
-        tickets = Tickets(start_date=self._start_date, subdomain=self._subdomain, authenticator=self.authenticator).read_records(
-            sync_mode=sync_mode, cursor_field=cursor_field, stream_state={Tickets.cursor_field: ticket_stream_value}
-        )
-
-        # selects all tickets what have at least one comment
-        ticket_ids = [
-            {
-                "id": ticket["id"],
-                Tickets.cursor_field: ticket[Tickets.cursor_field],
-            }
-            for ticket in tickets
-            if ticket["comment_count"]
-        ]
-        self.logger.info(f"Found updated {len(ticket_ids)} ticket(s) with comments")
-        # sort slices by generated_timestamp
-        ticket_ids.sort(key=lambda ticket: ticket[Tickets.cursor_field])
-        return ticket_ids
-
-    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
-        """Adds a last cursor ticket updated time for a comment state"""
-        new_state = super().get_updated_state(current_stream_state=current_stream_state, latest_record=latest_record)
-        if new_state:
-            new_state[Tickets.cursor_field] = self._cursor_ticket_date
-        return new_state
+        """Selects comment child events, a ticket event can contain several comments or none"""
+        for ticket_event in super().parse_response(response, stream_state=stream_state, stream_slice=stream_slice, **kwargs):
+            for event in ticket_event.get("child_events") or []:
+                if event.get("event_type") != self.event_type:
+                    continue
+                comment = {key: value for key, value in event.items() if key not in ("event_type", "via_reference_id")}
+                comment["ticket_id"] = ticket_event["ticket_id"]
+                comment.setdefault(self.created_at_field, ticket_event[self.created_at_field])
+                yield comment
 
 
 # NOTE: all Zendesk endpoints can be splitted into several templates of data loading.
@@ -441,7 +426,16 @@ class GroupMemberships(IncrementalUnsortedPageStream):
 
 
 class SatisfactionRatings(IncrementalUnsortedPageStream):
-    """SatisfactionRatings stream: https://developer.zendesk.com/api-reference/ticketing/ticket-management/satisfaction_ratings/"""
+    """SatisfactionRatings stream: https://developer.zendesk.com/api-reference/ticketing/ticket-management/satisfaction_ratings/
+    The endpoint can't sort responses but it filters them by the start_time parameter
+    """
+
+    def request_params(self, stream_state: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
+        params = super().request_params(stream_state=stream_state, **kwargs)
+        cursor_date = (stream_state or {}).get(self.cursor_field)
+        start_date = self.str2datetime(cursor_date) if cursor_date else self._start_date
+        params["start_time"] = calendar.timegm(start_date.utctimetuple())
+        return params
 
 
 class TicketFields(IncrementalUnsortedPageStream):
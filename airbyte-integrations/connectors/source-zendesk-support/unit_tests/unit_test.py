@@ -7,8 +7,9 @@ from unittest import TestCase
 
 import requests
 import requests_mock
+from airbyte_cdk.models import SyncMode
 from source_zendesk_support import SourceZendeskSupport
-from source_zendesk_support.streams import Tags
+from source_zendesk_support.streams import Groups, Macros, SatisfactionRatings, Tags, TicketComments
 
 CONFIG_FILE = "secrets/config.json"
 
@@ -50,3 +51,98 @@ class TestZendeskSupport(TestCase):
             # without rate headers
             m.get(url)
             assert stream.backoff_time(requests.get(url)) == default_timeout
+
+
+def test_ticket_comments_from_ticket_events():
+    """Comments are extracted from the child events of the ticket events export"""
+    stream = TicketComments(subdomain="test", start_date="2021-01-01T00:00:00Z")
+    first_page = {
+        "ticket_events": [
+            {
+                "id": 1,
+                "ticket_id": 10,
+                "created_at": "2021-07-01T10:00:00Z",
+                "child_events": [
+                    {"id": 100, "event_type": "Comment", "body": "first", "via_reference_id": None, "created_at": "2021-07-01T10:00:00Z"},
+                    {"id": 101, "event_type": "Change", "field_name": "status"},
+                ],
+            },
+            {"id": 2, "ticket_id": 11, "created_at": "2021-07-01T11:00:00Z", "child_events": []},
+        ],
+        "end_time": 1625137200,
+        "end_of_stream": False,
+    }
+    last_page = {
+        "ticket_events": [
+            {
+                "id": 3,
+                "ticket_id": 11,
+                "created_at": "2021-07-02T10:00:00Z",
+                "child_events": [{"id": 102, "event_type": "Comment", "body": "second"}],
+            }
+        ],
+        "end_time": 1625220000,
+        "end_of_stream": True,
+    }
+    with requests_mock.Mocker() as m:
+        url = stream.url_base + stream.path()
+        m.get(url, [{"json": first_page}, {"json": last_page}])
+        records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_state={}))
+
+        assert [request.qs["include"] for request in m.request_history] == [["comment_events"], ["comment_events"]]
+        assert m.request_history[1].qs["start_time"] == ["1625137200"]
+    assert records == [
+        {"id": 100, "body": "first", "created_at": "2021-07-01T10:00:00Z", "ticket_id": 10},
+        {"id": 102, "body": "second", "created_at": "2021-07-02T10:00:00Z", "ticket_id": 11},
+    ]
+    state = {}
+    for record in records:
+        state = stream.get_updated_state(state, record)
+    assert state == {"created_at": "2021-07-02T10:00:00Z", "_last_end_time": 1625220000}
+
+
+def test_ticket_comments_legacy_state():
+    """States saved by previous versions keep the cursor of the last loaded ticket"""
+    stream = TicketComments(subdomain="test", start_date="2021-01-01T00:00:00Z")
+    params = stream.request_params(stream_state={"created_at": "2021-07-02T10:00:00Z", "generated_timestamp": 1625220000})
+    assert params["start_time"] == 1625220000
+
+
+def test_sorted_stream_stops_at_stream_state():
+    """Responses are sorted in descending order so next pages contain older records only"""
+    stream = Macros(subdomain="test", start_date="2021-01-01T00:00:00Z")
+    with requests_mock.Mocker() as m:
+        url = stream.url_base + stream.path()
+        first_page = {
+            "macros": [{"id": 2, "updated_at": "2021-07-02T10:00:00Z"}, {"id": 1, "updated_at": "2021-07-01T10:00:00Z"}],
+            "next_page": f"{url}?page=2",
+        }
+        m.get(url, json=first_page)
+        records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_state={"updated_at": "2021-07-01T10:00:00Z"}))
+
+        assert m.call_count == 1
+        assert m.last_request.qs["sort_order"] == ["desc"]
+    assert [record["id"] for record in records] == [2]
+
+
+def test_unsorted_stream_reads_all_pages():
+    stream = Groups(subdomain="test", start_date="2021-01-01T00:00:00Z")
+    with requests_mock.Mocker() as m:
+        url = stream.url_base + stream.path()
+        m.get(
+            url,
+            [
+                {"json": {"groups": [{"id": 1, "updated_at": "2021-06-01T10:00:00Z"}], "next_page": f"{url}?page=2"}},
+                {"json": {"groups": [{"id": 2, "updated_at": "2021-07-02T10:00:00Z"}], "next_page": None}},
+            ],
+        )
+        records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_state={"updated_at": "2021-07-01T10:00:00Z"}))
+
+        assert m.call_count == 2
+    assert [record["id"] for record in records] == [2]
+
+
+def test_satisfaction_ratings_filtered_by_start_time():
+    stream = SatisfactionRatings(subdomain="test", start_date="2021-01-01T00:00:00Z")
+    assert stream.request_params(stream_state={})["start_time"] == 1609459200
+    assert stream.request_params(stream_state={"updated_at": "2021-07-01T10:00:00Z"})["start_time"] == 1625133600
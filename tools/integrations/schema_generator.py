@@ -22,14 +22,25 @@
 # SOFTWARE.
 #
 
+import argparse
 import json
 import os
+import random
 import sys
+import time
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple
 
-from airbyte_cdk.models import AirbyteMessage, Type
 from genson import SchemaBuilder
 from genson.schema.strategies.object import Object
 
+RECORD_TYPE = "RECORD"
+# number of records sent to a worker at once
+CHUNK_SIZE = 1000
+
 
 class NoRequiredObj(Object):
     """
@@ -50,24 +61,159 @@ class NoRequiredSchemaBuilder(SchemaBuilder):
     EXTRA_STRATEGIES = (NoRequiredObj,)
 
 
+class Progress:
+    """Reports the number of read lines and selected records to stderr every `interval` seconds"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lines = 0
+        self.records: Dict[str, int] = {}
+        self._last_report = time.monotonic()
+
+    def update(self, lines: int = 0, stream_name: Optional[str] = None):
+        self.lines += lines
+        if stream_name:
+            self.records[stream_name] = self.records.get(stream_name, 0) + 1
+        if self.interval and time.monotonic() - self._last_report >= self.interval:
+            self.report()
+
+    def report(self):
+        self._last_report = time.monotonic()
+        records = ", ".join(f"{stream_name}: {count}" for stream_name, count in sorted(self.records.items()))
+        print(f"read {self.lines} lines, records per stream: {records or '-'}", file=sys.stderr)
+
+
+def read_records(lines: Iterable[str], progress: Progress) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+    """
+    Yields (stream name, data) of every RECORD message.
+    Lines are decoded with json.loads only, the messages aren't validated against the Airbyte protocol models.
+    """
+    for line in lines:
+        progress.update(lines=1)
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(message, dict) or message.get("type") != RECORD_TYPE:
+            continue
+        record = message.get("record") or {}
+        if "stream" in record and isinstance(record.get("data"), dict):
+            yield record["stream"], record["data"]
+
+
+def select_records(
+    records: Iterable[Tuple[str, Mapping[str, Any]]], progress: Progress, max_records: int = None, sample_size: int = None, seed: int = None
+) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+    """
+    Limits the records used for every stream.
+    :param max_records: only the first max_records records of a stream are used
+    :param sample_size: a uniform sample of at most sample_size records of a stream is used (reservoir sampling).
+    Sampled records are yielded once the whole input is read.
+    """
+    counts: Dict[str, int] = {}
+    reservoirs: Dict[str, List[Mapping[str, Any]]] = {}
+    rng = random.Random(seed)
+    for stream_name, data in records:
+        seen = counts.get(stream_name, 0)
+        if max_records is not None and seen >= max_records:
+            continue
+        counts[stream_name] = seen + 1
+        progress.update(stream_name=stream_name)
+        if sample_size is None:
+            yield stream_name, data
+            continue
+        reservoir = reservoirs.setdefault(stream_name, [])
+        if len(reservoir) < sample_size:
+            reservoir.append(data)
+        else:
+            index = rng.randrange(seen + 1)
+            if index < sample_size:
+                reservoir[index] = data
+    for stream_name, reservoir in reservoirs.items():
+        for data in reservoir:
+            yield stream_name, data
+
+
+def chunk_records(records: Iterable[Tuple[str, Mapping[str, Any]]], chunk_size: int) -> Iterator[List[Tuple[str, Mapping[str, Any]]]]:
+    iterator = iter(records)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def build_partial_schemas(records: List[Tuple[str, Mapping[str, Any]]]) -> Dict[str, Mapping[str, Any]]:
+    """Builds the schemas of a chunk of records, they are merged into the stream builders by the main process"""
+    builders: Dict[str, SchemaBuilder] = {}
+    for stream_name, data in records:
+        builder = builders.get(stream_name)
+        if builder is None:
+            builder = builders[stream_name] = NoRequiredSchemaBuilder()
+        builder.add_object(data)
+    return {stream_name: builder.to_schema() for stream_name, builder in builders.items()}
+
+
+def generate_schemas(
+    input_stream: TextIO,
+    workers: int = 1,
+    max_records: int = None,
+    sample_size: int = None,
+    seed: int = None,
+    progress_interval: float = 0,
+) -> Dict[str, Mapping[str, Any]]:
+    progress = Progress(progress_interval)
+    records = select_records(read_records(input_stream, progress), progress, max_records=max_records, sample_size=sample_size, seed=seed)
+    chunks = chunk_records(records, CHUNK_SIZE)
+
+    builders: Dict[str, SchemaBuilder] = {}
+
+    def merge(partial_schemas: Dict[str, Mapping[str, Any]]):
+        for stream_name, schema in partial_schemas.items():
+            builders.setdefault(stream_name, NoRequiredSchemaBuilder()).add_schema(schema)
+
+    if workers > 1:
+        with Pool(workers) as pool:
+            # a bounded number of chunks is queued so the input isn't read faster than the workers process it
+            pending: Deque[AsyncResult] = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(build_partial_schemas, (chunk,)))
+                if len(pending) >= 2 * workers:
+                    merge(pending.popleft().get())
+            while pending:
+                merge(pending.popleft().get())
+    else:
+        for chunk in chunks:
+            merge(build_partial_schemas(chunk))
+    if progress_interval:
+        progress.report()
+    return {stream_name: builder.to_schema() for stream_name, builder in builders.items()}
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generates JSON schemas of the streams from the output of a connector's read command")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of processes building the schemas")
+    parser.add_argument("--max-records", type=int, help="use at most this number of records per stream, the first ones are used")
+    parser.add_argument("--sample-size", type=int, help="use a random sample of at most this number of records per stream")
+    parser.add_argument("--seed", type=int, help="seed of the random sampling")
+    parser.add_argument("--progress-interval", type=float, default=10, help="report progress to stderr every N seconds, 0 disables it")
+    return parser.parse_args(args)
+
+
 def main():
+    args = parse_args(sys.argv[1:])
     default_folder = os.path.join(os.getcwd(), "schemas")
     if not os.path.exists(default_folder):
         os.mkdir(default_folder)
 
-    builders = {}
-    for line in sys.stdin:
-        message = AirbyteMessage.parse_raw(line)
-        if message.type == Type.RECORD:
-            stream_name = message.record.stream
-            if stream_name not in builders:
-                builder = NoRequiredSchemaBuilder()
-                builders[stream_name] = builder
-            else:
-                builder = builders[stream_name]
-            builder.add_object(message.record.data)
-    for stream_name, builder in builders.items():
-        schema = builder.to_schema()
+    schemas = generate_schemas(
+        sys.stdin,
+        workers=args.workers,
+        max_records=args.max_records,
+        sample_size=args.sample_size,
+        seed=args.seed,
+        progress_interval=args.progress_interval,
+    )
+    for stream_name, schema in schemas.items():
         output_file_name = os.path.join(default_folder, stream_name + ".json")
         with open(output_file_name, "w") as outfile:
             json.dump(schema, outfile, indent=2, sort_keys=True)